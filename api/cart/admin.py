@@ -15,11 +15,14 @@ class CartAdmin(admin.ModelAdmin):
         "user",
         "is_active",
         "checked_out",
+        "items_count",
+        "subtotal",
         "created_at",
         "updated_at",
     )
     search_fields = ("user__email",)
     list_filter = ("is_active", "checked_out", "created_at")
+    readonly_fields = ("items_count", "total_quantity", "subtotal")
     inlines = [CartItemInline]
 
 
@@ -0,0 +1,140 @@
+import json
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+
+from api.cart.models import Cart, CartItem
+from api.products.models import Product
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete cart items untouched for longer than --days and refresh stale "
+        "captured prices, in small batches that are safe to run alongside live traffic."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.CART_ITEM_MAX_AGE_DAYS,
+            help="Delete items not updated for this many days.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per batch; each batch runs in its own short transaction.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.1,
+            help="Seconds to pause between batches to leave room for live traffic.",
+        )
+        parser.add_argument(
+            "--archive",
+            metavar="PATH",
+            help="Append deleted items to this file as JSON lines before deleting.",
+        )
+        parser.add_argument(
+            "--refresh-prices",
+            action="store_true",
+            help="Also update captured item prices that differ from the product price.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many rows would be processed without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        stale = CartItem.objects.filter(updated_at__lt=cutoff)
+        if options["dry_run"]:
+            self.stdout.write(
+                f"{stale.count()} cart items older than {cutoff} would be deleted."
+            )
+            if options["refresh_prices"]:
+                self.stdout.write(
+                    f"{self._mispriced().count()} cart item prices would be refreshed."
+                )
+            return
+        archive = open(options["archive"], "a") if options["archive"] else None
+        try:
+            self._run(
+                "Deleted stale cart items",
+                stale,
+                options,
+                lambda pks: self._delete(pks, archive),
+            )
+        finally:
+            if archive:
+                archive.close()
+        if options["refresh_prices"]:
+            self._run(
+                "Refreshed cart item prices",
+                self._mispriced(),
+                options,
+                self._refresh_prices,
+            )
+
+    def _mispriced(self):
+        return CartItem.objects.filter(product__is_deleted=False).exclude(
+            price=F("product__price")
+        )
+
+    def _run(self, label, queryset, options, process):
+        total = 0
+        started = time.monotonic()
+        while True:
+            batch_started = time.monotonic()
+            with transaction.atomic():
+                pks = list(
+                    queryset.order_by("updated_at").values_list("pk", flat=True)[
+                        : options["batch_size"]
+                    ]
+                )
+                if not pks:
+                    break
+                process(pks)
+            total += len(pks)
+            elapsed = time.monotonic() - batch_started
+            self.stdout.write(
+                f"{label}: batch of {len(pks)} ({len(pks) / elapsed:.1f} rows/s)"
+            )
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+        elapsed = time.monotonic() - started
+        rate = total / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{label}: {total} rows in {elapsed:.2f}s ({rate:.1f} rows/s)"
+            )
+        )
+
+    def _delete(self, pks, archive):
+        items = CartItem.objects.filter(pk__in=pks)
+        cart_ids = set(items.values_list("cart_id", flat=True))
+        if archive:
+            for row in items.values():
+                archive.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+        items.delete()
+        Cart.objects.filter(pk__in=cart_ids).refresh_summaries()
+
+    def _refresh_prices(self, pks):
+        # updated_at is left alone: a price refresh is not customer activity
+        items = CartItem.objects.filter(pk__in=pks)
+        cart_ids = set(items.values_list("cart_id", flat=True))
+        items.update(
+            price=Subquery(
+                Product.objects.filter(pk=OuterRef("product_id")).values("price")[:1]
+            )
+        )
+        Cart.objects.filter(pk__in=cart_ids).refresh_summaries()
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:36
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+
+
+def backfill_cart_summary(apps, schema_editor):
+    Cart = apps.get_model("cart", "Cart")
+    carts = Cart.objects.annotate(
+        _items_count=Count("items"),
+        _total_quantity=Sum("items__quantity"),
+        _subtotal=Sum(
+            F("items__quantity") * F("items__price"),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        ),
+    ).filter(_items_count__gt=0)
+    for cart in carts.iterator():
+        Cart.objects.filter(pk=cart.pk).update(
+            items_count=cart._items_count,
+            total_quantity=cart._total_quantity,
+            subtotal=cart._subtotal,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cart", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cart",
+            name="items_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="cart",
+            name="subtotal",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="cart",
+            name="total_quantity",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_cart_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:39
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+
+
+def merge_duplicate_cart_items(apps, schema_editor):
+    # Fold duplicate (cart, product) rows into the oldest one before the
+    # unique constraint is added
+    Cart = apps.get_model("cart", "Cart")
+    CartItem = apps.get_model("cart", "CartItem")
+    duplicates = (
+        CartItem.objects.values("cart_id", "product_id")
+        .annotate(rows=Count("id"), total=Sum("quantity"))
+        .filter(rows__gt=1)
+    )
+    duplicates = list(duplicates)
+    for duplicate in duplicates:
+        items = CartItem.objects.filter(
+            cart_id=duplicate["cart_id"], product_id=duplicate["product_id"]
+        ).order_by("created_at")
+        keep = items.first()
+        items.exclude(pk=keep.pk).delete()
+        CartItem.objects.filter(pk=keep.pk).update(quantity=duplicate["total"])
+
+    # 0002 counted the duplicate rows into the cart summary; recount the
+    # merged carts
+    cart_ids = {duplicate["cart_id"] for duplicate in duplicates}
+    carts = Cart.objects.filter(pk__in=cart_ids).annotate(
+        _items_count=Count("items"),
+        _total_quantity=Sum("items__quantity"),
+        _subtotal=Sum(
+            F("items__quantity") * F("items__price"),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        ),
+    )
+    for cart in carts:
+        Cart.objects.filter(pk=cart.pk).update(
+            items_count=cart._items_count,
+            total_quantity=cart._total_quantity,
+            subtotal=cart._subtotal,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cart", "0002_cart_summary"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_cart_items, migrations.RunPython.noop),
+    ]
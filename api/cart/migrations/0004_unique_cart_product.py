@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cart", "0003_merge_duplicate_cart_items"),
+        ("products", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="cartitem",
+            constraint=models.UniqueConstraint(
+                fields=("cart", "product"), name="unique_cart_product"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cart", "0004_unique_cart_product"),
+        ("products", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cartitem",
+            index=models.Index(fields=["updated_at"], name="cartitem_updated_at_idx"),
+        ),
+    ]
@@ -1,9 +1,39 @@
+from decimal import Decimal
+
 from django.conf import settings
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from api.common.models import BaseModel
+from api.common.utils import calculate_shipping, calculate_tax
 from api.products.models import Product
 
+MONEY = models.DecimalField(max_digits=12, decimal_places=2)
+ZERO = Value(Decimal("0.00"), output_field=MONEY)
+
+
+class CartQuerySet(models.QuerySet):
+    def refresh_summaries(self):
+        """
+        Recompute the denormalized summary of every cart in the queryset with
+        a single UPDATE, for bulk item changes that bypass CartItem.save().
+        """
+        items = CartItem.objects.filter(cart=OuterRef("pk")).order_by().values("cart")
+
+        def total(expression, default, output_field=None):
+            subquery = items.annotate(total=expression).values("total")
+            return Coalesce(Subquery(subquery, output_field=output_field), default)
+
+        return self.update(
+            items_count=total(Count("id"), 0),
+            total_quantity=total(Sum("quantity"), 0),
+            subtotal=total(
+                Sum(F("quantity") * F("price"), output_field=MONEY), ZERO, MONEY
+            ),
+        )
+
 
 class Cart(BaseModel):
     user = models.OneToOneField(
@@ -11,19 +41,270 @@ class Cart(BaseModel):
     )
     is_active = models.BooleanField(default=True)
     checked_out = models.BooleanField(default=False)
+    # Denormalized summary, kept in sync by refresh_summary() on CartItem writes
+    items_count = models.PositiveIntegerField(default=0)
+    total_quantity = models.PositiveIntegerField(default=0)
+    subtotal = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    objects = CartQuerySet.as_manager()
 
     def clear_items(self):
         self.items.all().delete()
+        self.refresh_summary()
+
+    def refresh_summary(self):
+        """
+        Recompute the denormalized summary from captured item prices with a
+        single aggregate query and store it with a single UPDATE.
+        """
+        totals = self.items.aggregate(
+            items_count=Count("id"),
+            total_quantity=Coalesce(Sum("quantity"), 0),
+            subtotal=Coalesce(
+                Sum(F("quantity") * F("price"), output_field=MONEY), ZERO
+            ),
+        )
+        Cart.objects.filter(pk=self.pk).update(**totals)
+        for field, value in totals.items():
+            setattr(self, field, value)
+
+    def priced_items(self, now=None):
+        """
+        Cart items annotated with `unit_price`, the current product price or
+        its sale price while a discount is active. Shared by the cart summary
+        and checkout so both charge the same amounts.
+        """
+        now = now or timezone.now()
+        on_sale = (
+            Q(product__discount_price__isnull=False)
+            & (
+                Q(product__discount_start__isnull=True)
+                | Q(product__discount_start__lte=now)
+            )
+            & (
+                Q(product__discount_end__isnull=True)
+                | Q(product__discount_end__gte=now)
+            )
+        )
+        return self.items.annotate(
+            unit_price=Case(
+                When(on_sale, then=F("product__discount_price")),
+                default=F("product__price"),
+                output_field=MONEY,
+            )
+        )
+
+    def calculate_summary(self, address=None, now=None):
+        """
+        Live cart totals at current product prices, computed in one aggregate
+        query. Discounts are the active product sale prices; shipping and tax
+        are estimates for the given address (None if delivery is unsupported).
+        """
+        totals = self.priced_items(now).aggregate(
+            items_count=Count("id"),
+            total_quantity=Coalesce(Sum("quantity"), 0),
+            subtotal=Coalesce(
+                Sum(F("quantity") * F("product__price"), output_field=MONEY), ZERO
+            ),
+            discount=Coalesce(
+                Sum(
+                    F("quantity") * (F("product__price") - F("unit_price")),
+                    output_field=MONEY,
+                ),
+                ZERO,
+            ),
+        )
+        subtotal = Decimal(totals["subtotal"])
+        discount = Decimal(totals["discount"])
+        taxable = subtotal - discount
+        shipping = calculate_shipping(taxable, address)
+        tax = calculate_tax(taxable, address)
+        total = taxable + tax + (shipping or Decimal("0"))
+        return {
+            **totals,
+            "subtotal": subtotal,
+            "discount": discount,
+            "shipping": shipping,
+            "tax": tax,
+            "total": total,
+        }
+
+    def apply_batch(self, operations):
+        """
+        Apply add/update/remove operations in one transaction with upsert
+        semantics on (cart, product). Each operation is a dict with "op",
+        "product" (a Product instance) and "quantity". The number of queries
+        does not depend on the number of operations.
+        """
+        with transaction.atomic():
+            products = {
+                operation["product"].pk: operation["product"]
+                for operation in operations
+            }
+            existing = {
+                item.product_id: item
+                for item in self.items.select_for_update().filter(
+                    product_id__in=products.keys()
+                )
+            }
+            quantities = {pk: item.quantity for pk, item in existing.items()}
+            # Products whose final quantity was set by an update/remove rather
+            # than reached by adds alone
+            absolute = set()
+            for operation in operations:
+                product_id = operation["product"].pk
+                if operation["op"] == "add":
+                    quantities[product_id] = (
+                        quantities.get(product_id, 0) + operation["quantity"]
+                    )
+                elif operation["op"] == "update":
+                    quantities[product_id] = operation["quantity"]
+                    absolute.add(product_id)
+                else:
+                    quantities[product_id] = 0
+                    absolute.add(product_id)
+            now = timezone.now()
+            to_increment, to_set, to_update, to_delete = [], [], [], []
+            for product_id, quantity in quantities.items():
+                item = existing.get(product_id)
+                if quantity <= 0:
+                    to_delete.append(product_id)
+                elif item is None:
+                    # Rows missing from the locked read may be inserted by a
+                    # concurrent add before ours lands, so adds are applied as
+                    # increments and only update/remove overwrite
+                    product = products[product_id]
+                    new_item = CartItem(
+                        cart=self,
+                        product=product,
+                        quantity=quantity,
+                        price=product.price,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    if product_id in absolute:
+                        to_set.append(new_item)
+                    else:
+                        to_increment.append(new_item)
+                elif item.quantity != quantity:
+                    item.quantity = quantity
+                    item.updated_at = now
+                    to_update.append(item)
+            # Queryset/bulk operations bypass CartItem.save()/delete(), so the
+            # summary is refreshed once at the end instead of per item
+            if to_delete:
+                CartItem.objects.filter(cart=self, product_id__in=to_delete).delete()
+            if to_increment:
+                CartItem.objects.upsert_increment(to_increment)
+            if to_set:
+                CartItem.objects.bulk_create(
+                    to_set,
+                    update_conflicts=True,
+                    unique_fields=["cart", "product"],
+                    update_fields=["quantity", "updated_at"],
+                )
+            if to_update:
+                CartItem.objects.bulk_update(to_update, ["quantity", "updated_at"])
+            self.refresh_summary()
 
     def __str__(self):
         return f"Cart {self.id} for {self.user.email}"
 
 
+class CartItemManager(models.Manager):
+    def upsert_increment(self, items, returning=False):
+        """
+        Insert unsaved `items` with a single
+        INSERT ... ON CONFLICT (cart, product) DO UPDATE statement that adds
+        each item's quantity to an existing row's instead of overwriting it,
+        so concurrent adds of the same product never lose an increment.
+        The captured price is set on insert and kept on increment. Returns
+        the affected primary keys if `returning` is set.
+        """
+        using = router.db_for_write(self.model)
+        connection = connections[using]
+        opts = self.model._meta
+        qn = connection.ops.quote_name
+        names = [
+            "id",
+            "created_at",
+            "updated_at",
+            "cart",
+            "product",
+            "quantity",
+            "price",
+        ]
+        fields = [opts.get_field(name) for name in names]
+        table = qn(opts.db_table)
+        quantity_column = qn(opts.get_field("quantity").column)
+        updated_at_column = qn(opts.get_field("updated_at").column)
+        row = f"({', '.join(['%s'] * len(fields))})"
+        sql = (
+            f"INSERT INTO {table} ({', '.join(qn(f.column) for f in fields)}) "
+            f"VALUES {', '.join([row] * len(items))} "
+            f"ON CONFLICT ({qn(opts.get_field('cart').column)}, "
+            f"{qn(opts.get_field('product').column)}) DO UPDATE SET "
+            f"{quantity_column} = {table}.{quantity_column} + EXCLUDED.{quantity_column}, "
+            f"{updated_at_column} = EXCLUDED.{updated_at_column}"
+        )
+        if returning:
+            sql += f" RETURNING {qn(opts.pk.column)}"
+        params = [
+            field.get_db_prep_save(getattr(item, field.attname), connection)
+            for item in items
+            for field in fields
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            if returning:
+                return [opts.pk.to_python(pk) for pk, in cursor.fetchall()]
+
+    def add_to_cart(self, cart, product, quantity=1):
+        """
+        Add `quantity` of `product` to `cart` with a single upsert, see
+        upsert_increment().
+        """
+        using = router.db_for_write(self.model)
+        now = timezone.now()
+        item = self.model(
+            cart=cart,
+            product=product,
+            quantity=quantity,
+            price=product.price,
+            created_at=now,
+            updated_at=now,
+        )
+        with transaction.atomic(using=using):
+            (item_id,) = self.upsert_increment([item], returning=True)
+            cart.refresh_summary()
+            return self.db_manager(using).select_related("product").get(pk=item_id)
+
+
 class CartItem(BaseModel):
     cart = models.ForeignKey(Cart, on_delete=models.CASCADE, related_name="items")
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     quantity = models.PositiveIntegerField(default=1)
     price = models.DecimalField(max_digits=10, decimal_places=2)
 
+    objects = CartItemManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cart", "product"], name="unique_cart_product"
+            ),
+        ]
+        # Scanned by the prune_cart_items command to find stale items
+        indexes = [models.Index(fields=["updated_at"], name="cartitem_updated_at_idx")]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.cart.refresh_summary()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.cart.refresh_summary()
+        return result
+
     def __str__(self):
         return f"{self.quantity} x {self.product.name} in cart {self.cart.id}"
@@ -46,8 +46,6 @@ class CartItemReadSerializer(serializers.ModelSerializer):
 
 
 class CartSerializer(serializers.ModelSerializer):
-    items_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Cart
         fields = [
@@ -56,6 +54,8 @@ class CartSerializer(serializers.ModelSerializer):
             "is_active",
             "checked_out",
             "items_count",
+            "total_quantity",
+            "subtotal",
             "created_at",
             "updated_at",
         ]
@@ -65,9 +65,50 @@ class CartSerializer(serializers.ModelSerializer):
             "is_active",
             "checked_out",
             "items_count",
+            "total_quantity",
+            "subtotal",
             "created_at",
             "updated_at",
         ]
 
-    def get_items_count(self, obj):
-        return obj.items.count()
+
+class CartSummarySerializer(serializers.Serializer):
+    """Cart totals at current product prices with estimated shipping and tax."""
+
+    items_count = serializers.IntegerField()
+    total_quantity = serializers.IntegerField()
+    subtotal = serializers.DecimalField(max_digits=12, decimal_places=2)
+    discount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    shipping = serializers.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        allow_null=True,
+        help_text="Estimated shipping; null if delivery is not supported.",
+    )
+    tax = serializers.DecimalField(max_digits=12, decimal_places=2)
+    total = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+
+class CartBatchOperationSerializer(serializers.Serializer):
+    OPERATIONS = ["add", "update", "remove"]
+
+    op = serializers.ChoiceField(choices=OPERATIONS)
+    product = serializers.UUIDField()
+    quantity = serializers.IntegerField(
+        min_value=0,
+        default=1,
+        help_text="Added for 'add', set for 'update' (0 removes), ignored for 'remove'.",
+    )
+
+    def validate(self, attrs):
+        if attrs["op"] == "add" and attrs["quantity"] < 1:
+            raise serializers.ValidationError(
+                {"quantity": "Quantity must be at least 1 when adding."}
+            )
+        return attrs
+
+
+class CartBatchSerializer(serializers.Serializer):
+    operations = CartBatchOperationSerializer(
+        many=True, allow_empty=False, max_length=100
+    )
@@ -0,0 +1,63 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from api.cart.models import CartItem
+from api.cart.tests.factories import CartFactory, CartItemFactory
+from api.products.tests.factories import ProductFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _age(item, days):
+    CartItem.objects.filter(pk=item.pk).update(
+        updated_at=timezone.now() - timedelta(days=days)
+    )
+
+
+def test_prune_cart_items_deletes_stale_items(tmp_path):
+    cart = CartFactory()
+    stale = CartItemFactory(cart=cart, product=ProductFactory(price="10.00"))
+    fresh = CartItemFactory(cart=cart, product=ProductFactory(price="5.00"))
+    _age(stale, 40)
+    archive = tmp_path / "archive.jsonl"
+    out = StringIO()
+    call_command(
+        "prune_cart_items",
+        days=30,
+        batch_size=1,
+        sleep=0,
+        archive=str(archive),
+        stdout=out,
+    )
+    assert list(CartItem.objects.values_list("pk", flat=True)) == [fresh.pk]
+    assert json.loads(archive.read_text())["id"] == str(stale.pk)
+    assert "rows/s" in out.getvalue()
+    cart.refresh_from_db()
+    assert cart.items_count == 1
+    assert cart.subtotal == Decimal("5.00")
+
+
+def test_prune_cart_items_refreshes_prices():
+    item = CartItemFactory(product=ProductFactory(price="10.00"))
+    item.product.price = Decimal("12.50")
+    item.product.save()
+    call_command("prune_cart_items", refresh_prices=True, sleep=0, stdout=StringIO())
+    item.refresh_from_db()
+    item.cart.refresh_from_db()
+    assert item.price == Decimal("12.50")
+    assert item.cart.subtotal == Decimal("12.50")
+
+
+def test_prune_cart_items_dry_run():
+    item = CartItemFactory()
+    _age(item, 40)
+    out = StringIO()
+    call_command("prune_cart_items", dry_run=True, stdout=out)
+    assert CartItem.objects.filter(pk=item.pk).exists()
+    assert "1 cart items" in out.getvalue()
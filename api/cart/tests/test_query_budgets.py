@@ -0,0 +1,18 @@
+import pytest
+from django.urls import reverse
+
+from api.cart.tests.factories import CartItemFactory
+from api.products.tests.factories import ProductImageFactory, ProductReviewFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_cart_item_list_budget(api_client, query_budget, cart):
+    def add_items(n):
+        for item in CartItemFactory.create_batch(n, cart=cart):
+            ProductImageFactory(product=item.product)
+            ProductReviewFactory(product=item.product)
+
+    api_client.force_authenticate(user=cart.user)
+    # Items, then the products and what ProductReadSerializer embeds
+    query_budget(reverse("cart:cartitem-list-create-top"), add_items, budget=11)
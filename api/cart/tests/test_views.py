@@ -1,6 +1,14 @@
+import threading
+import time
+import uuid
+from decimal import Decimal
+
 import pytest
+from django.db import OperationalError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from api.cart.models import Cart, CartItem
 from api.cart.tests.factories import CartFactory, CartItemFactory
 from api.products.tests.factories import ProductFactory
 
@@ -89,3 +97,156 @@ def test_cart_unauthorized_access(api_client):
     url = reverse("cart:cart-detail", args=[cart.id])
     response = api_client.get(url)
     assert response.status_code == 401
+
+
+def test_cart_summary_denormalized_on_item_writes(api_client, user):
+    product = ProductFactory(price="10.00")
+    url = reverse("cart:cartitem-list-create-top")
+    api_client.force_authenticate(user=user)
+    api_client.post(url, {"product": str(product.id), "quantity": 2})
+    api_client.post(url, {"product": str(product.id), "quantity": 1})
+    cart = Cart.objects.get(user=user)
+    assert cart.items_count == 1
+    assert cart.total_quantity == 3
+    assert cart.subtotal == Decimal("30.00")
+    cart.clear_items()
+    cart.refresh_from_db()
+    assert (cart.items_count, cart.total_quantity, cart.subtotal) == (0, 0, 0)
+
+
+def test_cart_summary_endpoint(api_client, user):
+    cart = CartFactory(user=user)
+    CartItemFactory(cart=cart, product=ProductFactory(price="10.00"), quantity=2)
+    CartItemFactory(
+        cart=cart,
+        product=ProductFactory(price="50.00", discount_price="40.00"),
+        quantity=1,
+    )
+    api_client.force_authenticate(user=user)
+    response = api_client.get(reverse("cart:cart-summary"))
+    assert response.status_code == 200
+    assert response.data["items_count"] == 2
+    assert response.data["total_quantity"] == 3
+    assert response.data["subtotal"] == "70.00"
+    assert response.data["discount"] == "10.00"
+    assert response.data["total"] == "60.00"
+
+
+def test_cartitem_batch_upsert(api_client, user):
+    cart = CartFactory(user=user)
+    existing = CartItemFactory(cart=cart, quantity=1)
+    removed = CartItemFactory(cart=cart, quantity=1)
+    new = ProductFactory(price="10.00")
+    url = reverse("cart:cartitem-batch")
+    api_client.force_authenticate(user=user)
+    data = {
+        "operations": [
+            {"op": "add", "product": str(new.id), "quantity": 2},
+            {"op": "add", "product": str(new.id), "quantity": 1},
+            {"op": "update", "product": str(existing.product_id), "quantity": 5},
+            {"op": "remove", "product": str(removed.product_id)},
+        ]
+    }
+    response = api_client.post(url, data, format="json")
+    assert response.status_code == 200
+    quantities = dict(cart.items.values_list("product_id", "quantity"))
+    assert quantities == {new.id: 3, existing.product_id: 5}
+    assert response.data["items_count"] == 2
+    assert response.data["total_quantity"] == 8
+
+
+def test_cartitem_batch_fixed_query_count(api_client, user):
+    CartFactory(user=user)
+    url = reverse("cart:cartitem-batch")
+    api_client.force_authenticate(user=user)
+
+    def run(count):
+        operations = [
+            {"op": "add", "product": str(p.id), "quantity": 1}
+            for p in ProductFactory.create_batch(count)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.post(url, {"operations": operations}, format="json")
+        assert response.status_code == 200
+        return len(ctx.captured_queries)
+
+    assert run(1) == run(10)
+
+
+def test_cartitem_batch_unknown_product(api_client, user):
+    url = reverse("cart:cartitem-batch")
+    api_client.force_authenticate(user=user)
+    data = {"operations": [{"op": "add", "product": str(uuid.uuid4())}]}
+    response = api_client.post(url, data, format="json")
+    assert response.status_code == 400
+    assert response.data["errors"][0]["index"] == 0
+
+
+def test_cartitem_create_increments_existing(api_client, user):
+    cart = CartFactory(user=user)
+    item = CartItemFactory(cart=cart, quantity=2)
+    url = reverse("cart:cartitem-list-create-top")
+    api_client.force_authenticate(user=user)
+    response = api_client.post(url, {"product": str(item.product_id), "quantity": 3})
+    assert response.status_code == 201
+    assert response.data["id"] == str(item.id)
+    assert cart.items.get().quantity == 5
+
+
+@pytest.mark.django_db(transaction=True)
+def test_add_to_cart_concurrent_increments_not_lost():
+    cart = CartFactory()
+    product = ProductFactory()
+    workers, adds_per_worker = 4, 10
+    barrier = threading.Barrier(workers)
+    errors = []
+
+    def add():
+        try:
+            barrier.wait()
+            for _ in range(adds_per_worker):
+                # SQLite's shared-cache test database rejects concurrent writers
+                # instead of blocking; the add is atomic, so retrying is safe
+                while True:
+                    try:
+                        CartItem.objects.add_to_cart(cart, product, 1)
+                        break
+                    except OperationalError as exc:
+                        if "locked" not in str(exc):
+                            raise
+                        time.sleep(0.001)
+        except Exception as exc:  # pragma: no cover - surfaced by the assert
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=add) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    item = CartItem.objects.get(cart=cart, product=product)
+    assert item.quantity == workers * adds_per_worker
+
+
+def test_cartitem_batch_add_keeps_concurrent_add(user):
+    cart = CartFactory(user=user)
+    product = ProductFactory()
+    interleaved = []
+
+    def add_after_batch_read(execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        # Another request adds the product right after apply_batch has read
+        # the (still missing) row and before it writes
+        if not interleaved and sql.startswith("SELECT") and "cart_cartitem" in sql:
+            interleaved.append(sql)
+            CartItem.objects.add_to_cart(cart, product, 2)
+        return result
+
+    with connection.execute_wrapper(add_after_batch_read):
+        cart.apply_batch([{"op": "add", "product": product, "quantity": 3}])
+    assert interleaved
+    assert cart.items.get(product=product).quantity == 5
+    cart.refresh_from_db()
+    assert cart.total_quantity == 5
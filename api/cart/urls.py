@@ -2,10 +2,12 @@ from django.urls import path
 
 from .views import (
     CartClearItemsView,
+    CartItemBatchView,
     CartItemListCreateTopView,
     CartItemRetrieveUpdateDestroyTopView,
     CartListCreateView,
     CartRetrieveUpdateView,
+    CartSummaryView,
 )
 
 app_name = "cart"
@@ -13,10 +15,12 @@ app_name = "cart"
 urlpatterns = [
     # Cart endpoints
     path("", CartListCreateView.as_view(), name="cart-list-create"),
+    path("summary/", CartSummaryView.as_view(), name="cart-summary"),
     path("<uuid:pk>/", CartRetrieveUpdateView.as_view(), name="cart-detail"),
     path(
         "<uuid:cart_id>/clear/", CartClearItemsView.as_view(), name="cart-clear-items"
     ),
+    path("items/batch/", CartItemBatchView.as_view(), name="cartitem-batch"),
     # CartItem endpoints (top-level)
     path(
         "cartitems/",
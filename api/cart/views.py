@@ -1,9 +1,19 @@
+from django.db.models import Prefetch
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from api.products.models import Product
+
 from .models import Cart, CartItem
-from .serializers import CartItemReadSerializer, CartItemSerializer, CartSerializer
+from .serializers import (
+    CartBatchSerializer,
+    CartItemReadSerializer,
+    CartItemSerializer,
+    CartSerializer,
+    CartSummarySerializer,
+)
 
 # Create your views here.
 
@@ -27,10 +37,8 @@ class CartListCreateView(generics.ListCreateAPIView):
         # Fix for drf-yasg schema generation (AnonymousUser)
         if getattr(self, "swagger_fake_view", False):
             return Cart.objects.none()
-        return (
-            Cart.objects.select_related("user")
-            .prefetch_related("items__product")
-            .filter(user=self.request.user, is_active=True)
+        return Cart.objects.select_related("user").filter(
+            user=self.request.user, is_active=True
         )
 
     def list(self, request, *args, **kwargs):
@@ -65,11 +73,27 @@ class CartRetrieveUpdateView(generics.RetrieveUpdateAPIView):
         # Fix for drf-yasg schema generation (AnonymousUser)
         if getattr(self, "swagger_fake_view", False):
             return Cart.objects.none()
-        return (
-            Cart.objects.select_related("user")
-            .prefetch_related("items__product")
-            .filter(user=self.request.user)
+        return Cart.objects.select_related("user").filter(user=self.request.user)
+
+
+class CartSummaryView(APIView):
+    """
+    Totals for the authenticated user's cart without item or product payloads.
+    Returns item count, subtotal, active product discounts and estimated
+    shipping/tax for the user's default address.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(responses={200: CartSummarySerializer})
+    def get(self, request):
+        user = request.user
+        cart, created = Cart.objects.get_or_create(user=user, defaults={})
+        address = (
+            user.addresses.filter(is_default=True).first() or user.addresses.first()
         )
+        summary = cart.calculate_summary(address)
+        return Response(CartSummarySerializer(summary).data)
 
 
 class CartItemListCreateView(generics.ListCreateAPIView):
@@ -95,9 +119,11 @@ class CartItemListCreateView(generics.ListCreateAPIView):
         cart = Cart.objects.get(
             id=self.kwargs["cart_id"], user=self.request.user, is_active=True
         )
-        product = serializer.validated_data["product"]
-        price = product.price
-        serializer.save(cart=cart, price=price)
+        serializer.instance = CartItem.objects.add_to_cart(
+            cart,
+            serializer.validated_data["product"],
+            serializer.validated_data.get("quantity", 1),
+        )
 
 
 class CartItemRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
@@ -159,23 +185,21 @@ class CartItemListCreateTopView(generics.ListCreateAPIView):
         return super().get_serializer_class()
 
     def get_queryset(self):
-        return CartItem.objects.select_related("product").filter(
+        # Items render the full product; prefetch what it embeds
+        products = Prefetch("product", queryset=Product.objects.for_read())
+        return CartItem.objects.prefetch_related(products).filter(
             cart__user=self.request.user
         )
 
     def perform_create(self, serializer):
         # Get or create active cart for the user
         cart, created = Cart.objects.get_or_create(user=self.request.user, defaults={})
-        product = serializer.validated_data["product"]
-        price = product.price
-        existing_item = CartItem.objects.filter(cart=cart, product=product).first()
-        if existing_item:
-            existing_item.quantity += serializer.validated_data.get("quantity", 1)
-            existing_item.save()
-            # Set the instance to the updated existing item
-            serializer.instance = existing_item
-        else:
-            serializer.save(cart=cart, price=price)
+        # Single upsert statement; adding an existing product increments it
+        serializer.instance = CartItem.objects.add_to_cart(
+            cart,
+            serializer.validated_data["product"],
+            serializer.validated_data.get("quantity", 1),
+        )
 
 
 class CartItemRetrieveUpdateDestroyTopView(generics.RetrieveUpdateDestroyAPIView):
@@ -196,3 +220,47 @@ class CartItemRetrieveUpdateDestroyTopView(generics.RetrieveUpdateDestroyAPIView
         if getattr(self, "swagger_fake_view", False):
             return CartItem.objects.none()
         return CartItem.objects.filter(cart__user=self.request.user)
+
+
+class CartItemBatchView(APIView):
+    """
+    Apply a list of add/update/remove operations to the active cart in one
+    transaction, e.g. "buy the look" or restoring a saved list.
+    - add: increase the quantity of a product (creates the item if needed)
+    - update: set the quantity of a product (0 removes the item)
+    - remove: remove a product from the cart
+    Returns the updated cart summary.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=CartBatchSerializer,
+        responses={200: CartSummarySerializer},
+    )
+    def post(self, request):
+        serializer = CartBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        operations = serializer.validated_data["operations"]
+        products = Product.objects.filter(is_deleted=False).in_bulk(
+            {operation["product"] for operation in operations}
+        )
+        errors = [
+            {"index": idx, "errors": {"product": ["Product not found."]}}
+            for idx, operation in enumerate(operations)
+            if operation["product"] not in products
+        ]
+        if errors:
+            return Response(
+                {"detail": "Invalid operations.", "errors": errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        for operation in operations:
+            operation["product"] = products[operation["product"]]
+        user = request.user
+        cart, created = Cart.objects.get_or_create(user=user, defaults={})
+        cart.apply_batch(operations)
+        address = (
+            user.addresses.filter(is_default=True).first() or user.addresses.first()
+        )
+        return Response(CartSummarySerializer(cart.calculate_summary(address)).data)
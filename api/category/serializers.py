@@ -29,5 +29,21 @@ class CategoryBulkUploadSerializer(serializers.Serializer):
     categories = CategorySerializer(many=True)
 
 
+class CategoryBulkUploadResultSerializer(serializers.Serializer):
+    """
+    Response payload for bulk upload: `created` in full by default, or only
+    `created_count` and `created_ids` with ?summary=true. Sent with 201 if
+    anything was created, 400 otherwise.
+    """
+
+    created = CategorySerializer(many=True, required=False)
+    created_count = serializers.IntegerField(required=False)
+    created_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
+    errors = serializers.ListField(
+        child=serializers.DictField(),
+        help_text="Rejected items as {index, errors}.",
+    )
+
+
 class TagBulkUploadSerializer(serializers.Serializer):
     tags = TagSerializer(many=True)
@@ -7,7 +7,7 @@ class CategoryFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Category
 
-    name = factory.Faker("word")
+    name = factory.Sequence(lambda n: f"category{n}")
     slug = factory.LazyAttribute(lambda o: o.name.lower())
     description = factory.Faker("sentence")
     parent = None
@@ -17,6 +17,6 @@ class TagFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Tag
 
-    name = factory.Faker("word")
+    name = factory.Sequence(lambda n: f"tag{n}")
     slug = factory.LazyAttribute(lambda o: o.name.lower())
     description = factory.Faker("sentence")
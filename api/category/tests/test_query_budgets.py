@@ -0,0 +1,20 @@
+import pytest
+from django.urls import reverse
+
+from api.category.tests.factories import CategoryFactory, TagFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_category_list_budget(query_budget):
+    parent = CategoryFactory()
+    query_budget(
+        reverse("category:category-list-create"),
+        lambda n: CategoryFactory.create_batch(n, parent=parent),
+        budget=2,
+        sizes=(2, 5),
+    )
+
+
+def test_tag_list_budget(query_budget):
+    query_budget(reverse("category:tag-list-create"), TagFactory.create_batch, budget=2)
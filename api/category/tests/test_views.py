@@ -67,3 +67,33 @@ def test_tag_duplicate_slug(api_client):
     data = {"name": "Tag2", "slug": "tag1"}
     response = api_client.post(url, data)
     assert response.status_code in (400, 409)
+
+
+def test_category_bulk_upload_summary(api_client):
+    api_client.force_authenticate(user=UserFactory(is_staff=True))
+    url = reverse("category:category-bulk-upload")
+    categories = [
+        {"name": "Bulk A", "slug": "bulk-a"},
+        {"name": "Bulk B", "slug": "bulk-b"},
+    ]
+    full = api_client.post(url, categories[:1], format="json")
+    summary = api_client.post(f"{url}?summary=1", categories[1:], format="json")
+    assert full.status_code == summary.status_code == 201
+    assert full.data["created"][0]["slug"] == "bulk-a"
+    assert summary.data["created_count"] == 1
+    assert summary.data["errors"] == []
+    assert "created_count" not in full.data
+    assert "created" not in summary.data
+
+
+def test_category_bulk_upload_summary_nothing_created(api_client):
+    CategoryFactory(name="Taken", slug="taken")
+    api_client.force_authenticate(user=UserFactory(is_staff=True))
+    url = reverse("category:category-bulk-upload")
+    response = api_client.post(
+        f"{url}?summary=1", [{"name": "Taken", "slug": "taken"}], format="json"
+    )
+    assert response.status_code == 400
+    assert response.data["created_count"] == 0
+    assert response.data["created_ids"] == []
+    assert response.data["errors"][0]["index"] == 0
@@ -1,6 +1,7 @@
 import csv
 from io import StringIO
 
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, permissions, status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
@@ -8,9 +9,12 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.common.permissions import IsAdminOrManager
+from api.common.transactions import NonAtomicReadsMixin
+from api.common.utils import bulk_upload_response
 
 from .models import Category, Tag
 from .serializers import (
+    CategoryBulkUploadResultSerializer,
     CategoryBulkUploadSerializer,
     CategorySerializer,
     TagBulkUploadSerializer,
@@ -20,7 +24,7 @@ from .serializers import (
 # Create your views here.
 
 
-class CategoryListCreateView(generics.ListCreateAPIView):
+class CategoryListCreateView(NonAtomicReadsMixin, generics.ListCreateAPIView):
     """
     List all categories or create a new category.
     - GET: Returns a list of categories with filtering, search, and ordering.
@@ -35,7 +39,9 @@ class CategoryListCreateView(generics.ListCreateAPIView):
     ordering_fields = ["name", "created_at", "updated_at"]
 
 
-class CategoryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class CategoryRetrieveUpdateDestroyView(
+    NonAtomicReadsMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     Retrieve, update, or delete a category by ID.
     """
@@ -51,7 +57,8 @@ class CategoryBulkUploadView(APIView):
     - JSON: POST a list of category objects or {"categories": [...]}
     - CSV: POST a file with the key 'file' (fields: name, slug, ...)
     Only admin/manager users can access this endpoint.
-    Returns a list of created categories and any errors.
+    Returns a list of created categories and any errors, or with
+    ?summary=true only the number and ids of created categories.
     """
 
     permission_classes = [IsAdminOrManager]
@@ -59,8 +66,21 @@ class CategoryBulkUploadView(APIView):
 
     @swagger_auto_schema(
         operation_description="Bulk upload categories via JSON (list of categories) or CSV file.",
+        manual_parameters=[
+            openapi.Parameter(
+                "summary",
+                openapi.IN_QUERY,
+                description="Return only the count and ids of created categories (and any errors).",
+                type=openapi.TYPE_BOOLEAN,
+            )
+        ],
         request_body=CategoryBulkUploadSerializer,
-        responses={201: CategorySerializer(many=True)},
+        responses={
+            201: CategoryBulkUploadResultSerializer,
+            400: openapi.Response(
+                "Nothing was created.", CategoryBulkUploadResultSerializer
+            ),
+        },
     )
     def post(self, request):
         created = []
@@ -95,15 +115,7 @@ class CategoryBulkUploadView(APIView):
                     {"detail": "Provide a list of categories (JSON) or a CSV file."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            return Response(
-                {
-                    "created": CategorySerializer(created, many=True).data,
-                    "errors": errors,
-                },
-                status=(
-                    status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
-                ),
-            )
+            return bulk_upload_response(request, created, errors, CategorySerializer)
         except Exception as exc:
             return Response(
                 {"detail": str(exc), "type": type(exc).__name__},
@@ -111,7 +123,7 @@ class CategoryBulkUploadView(APIView):
             )
 
 
-class TagListCreateView(generics.ListCreateAPIView):
+class TagListCreateView(NonAtomicReadsMixin, generics.ListCreateAPIView):
     """
     List all tags or create a new tag.
     - GET: Returns a list of tags with filtering, search, and ordering.
@@ -125,7 +137,9 @@ class TagListCreateView(generics.ListCreateAPIView):
     ordering_fields = ["name", "created_at", "updated_at"]
 
 
-class TagRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class TagRetrieveUpdateDestroyView(
+    NonAtomicReadsMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     Retrieve, update, or delete a tag by ID.
     """
@@ -1 +1,48 @@
-# Register your models here.
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import DomainEvent, EventConsumerOffset, OutboundEmail
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+        "created_at",
+    )
+    list_filter = ("status", "created_at")
+    search_fields = ("subject", "recipients")
+    readonly_fields = ("attempts", "locked_until", "last_error", "sent_at")
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry selected emails now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboundEmail.Status.SENT).update(
+            status=OutboundEmail.Status.PENDING,
+            attempts=0,
+            next_attempt_at=timezone.now(),
+            locked_until=None,
+        )
+        self.message_user(request, f"{updated} emails queued for retry.")
+
+
+@admin.register(DomainEvent)
+class DomainEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "topic", "aggregate_id", "created_at")
+    list_filter = ("topic",)
+    search_fields = ("aggregate_id",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(EventConsumerOffset)
+class EventConsumerOffsetAdmin(admin.ModelAdmin):
+    list_display = ("consumer", "last_event_id", "updated_at")
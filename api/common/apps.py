@@ -3,4 +3,5 @@ from django.apps import AppConfig
 
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "common"
+    name = "api.common"
+    verbose_name = "Common"
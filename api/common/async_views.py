@@ -0,0 +1,42 @@
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose method handlers are coroutines, for I/O-bound endpoints.
+    Under ASGI the request is served on the event loop; authentication,
+    permission checks and exception handling still run the regular (sync)
+    DRF machinery through sync_to_async. Handlers should use the async ORM
+    (aget, aexists, abulk_create, ...) and wrap serializer work that touches
+    the database in sync_to_async.
+    Django cannot wrap async views in ATOMIC_REQUESTS, so they always run in
+    autocommit; open transactions explicitly inside sync_to_async if needed.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if hasattr(response, "__await__"):
+                response = await response
+        except Exception as exc:
+            response = await sync_to_async(self.handle_exception)(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,130 @@
+"""
+Negotiated response compression, enabled with RESPONSE_COMPRESSION.
+
+CompressionMiddleware compresses responses of RESPONSE_COMPRESSION_TYPES
+that are at least RESPONSE_COMPRESSION_MIN_BYTES long with the encoding the
+client prefers out of zstd (with the `zstandard` package installed), br
+(with `brotli`) and gzip. This shrinks the gunicorn -> nginx hop as well as
+responses to clients that reach gunicorn directly; nginx passes already
+encoded responses through without compressing them again.
+
+BREACH: compression lets an attacker who can make a victim's browser send
+requests with attacker-chosen input recover secrets from the response
+lengths. Browsers only attach ambient credentials (the session and CSRF
+cookies) to such cross-site requests, so responses to requests carrying
+them are never compressed, and neither are responses that set cookies.
+Requests authenticated with an Authorization header (JWT, the API's
+normal clients) can't be forged that way and are compressed.
+"""
+
+import gzip
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Levels tuned for dynamic responses: most of the size win for little CPU
+ENCODERS = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = zstandard.ZstdCompressor(level=3).compress
+if brotli is not None:
+    ENCODERS["br"] = lambda data: brotli.compress(data, quality=4)
+ENCODERS["gzip"] = lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def negotiate(accept_encoding, available=None):
+    """
+    Pick the encoding for an Accept-Encoding header: the highest q-value
+    among `available` encodings (default: those installed), ties going to
+    the earlier one. Returns None when the client accepts none of them.
+    """
+    available = list(ENCODERS) if available is None else available
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                quality = float(match[1])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            weights[coding.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """Works under both WSGI and ASGI."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.RESPONSE_COMPRESSION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.content_types = set(settings.RESPONSE_COMPRESSION_TYPES)
+        self.credential_cookies = {
+            settings.SESSION_COOKIE_NAME,
+            settings.CSRF_COOKIE_NAME,
+        }
+
+    def has_ambient_credentials(self, request):
+        # See BREACH in the module docstring
+        return not self.credential_cookies.isdisjoint(request.COOKIES)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if response.cookies or self.has_ambient_credentials(request):
+            return response
+        if len(response.content) < settings.RESPONSE_COMPRESSION_MIN_BYTES:
+            return response
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+        if content_type not in self.content_types:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+        compressed = ENCODERS[encoding](response.content)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        # The encoded body differs byte for byte, so a strong ETag no longer
+        # applies (as in Django's GZipMiddleware)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
@@ -0,0 +1,126 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+# Per-request routing state: {"replica_reads": bool, "pinned": bool}.
+# A ContextVar keeps concurrent requests (threads or async tasks) apart.
+_routing = ContextVar("replica_routing", default=None)
+
+PRIMARY_PIN_COOKIE = "use_primary_db"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRouter:
+    """
+    Send reads of DATABASE_REPLICA_APPS models to a random replica in
+    DATABASE_REPLICAS, but only where replica reads are enabled (safe
+    requests via ReplicaRoutingMiddleware, or `use_replicas()`). Once
+    anything is written the rest of the request reads from the primary, so
+    a request always sees its own writes. Everything else uses "default".
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        if (
+            state is None
+            or not state["replica_reads"]
+            or state["pinned"]
+            or not settings.DATABASE_REPLICAS
+            or model._meta.app_label not in settings.DATABASE_REPLICA_APPS
+        ):
+            return None
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            state["pinned"] = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+@contextmanager
+def use_replicas():
+    """Allow replica reads outside a request, e.g. in reports or commands."""
+    token = _routing.set({"replica_reads": True, "pinned": False})
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Read everything from the primary for the duration of the block."""
+    state = _routing.get()
+    if state is None:
+        yield
+        return
+    pinned = state["pinned"]
+    state["pinned"] = True
+    try:
+        yield
+    finally:
+        state["pinned"] = pinned
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Enable replica reads for GET/HEAD/OPTIONS requests. Unsafe requests, and
+    requests carrying the pin cookie set after a recent write, read from the
+    primary so clients see their own writes despite replication lag.
+    Works under both WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state, token = self._start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self._finish(state, response)
+
+    async def __acall__(self, request):
+        state, token = self._start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self._finish(state, response)
+
+    def _start(self, request):
+        replica_reads = request.method in SAFE_METHODS and not request.COOKIES.get(
+            PRIMARY_PIN_COOKIE
+        )
+        state = {"replica_reads": replica_reads, "pinned": False}
+        return state, _routing.set(state)
+
+    def _finish(self, state, response):
+        if state["pinned"] and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                "1",
+                max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
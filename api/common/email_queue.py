@@ -0,0 +1,141 @@
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+
+def enqueue_emails(messages, from_email=None):
+    """
+    Queue (subject, message, recipient_list) tuples for delivery by the
+    send_queued_emails worker. Rows are written in the caller's transaction,
+    so emails for rolled-back changes are never sent.
+    """
+    if from_email is None:
+        from_email = settings.DEFAULT_FROM_EMAIL
+    return OutboundEmail.objects.bulk_create(
+        [
+            OutboundEmail(
+                subject=subject,
+                body=message,
+                from_email=from_email,
+                recipients=list(recipients),
+            )
+            for subject, message, recipients in messages
+        ]
+    )
+
+
+def claim_batch(batch_size):
+    """
+    Lock up to `batch_size` due emails for this worker. Rows are leased for
+    EMAIL_QUEUE_LEASE_SECONDS; a worker that dies mid-send releases them when
+    the lease expires. Concurrent workers skip each other's locked rows.
+    """
+    now = timezone.now()
+    due = Q(status=OutboundEmail.Status.PENDING, next_attempt_at__lte=now) | Q(
+        status=OutboundEmail.Status.SENDING, locked_until__lt=now
+    )
+    with transaction.atomic():
+        emails = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(due)
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        if emails:
+            OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+                status=OutboundEmail.Status.SENDING,
+                locked_until=now
+                + timedelta(seconds=settings.EMAIL_QUEUE_LEASE_SECONDS),
+            )
+    return emails
+
+
+def backoff_delay(attempts):
+    """Exponential backoff with jitter, in seconds, after `attempts` failures."""
+    delay = min(
+        settings.EMAIL_QUEUE_BACKOFF_SECONDS * 2 ** (attempts - 1),
+        settings.EMAIL_QUEUE_MAX_BACKOFF_SECONDS,
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _record_failure(email, exc, now):
+    email.attempts += 1
+    email.last_error = f"{type(exc).__name__}: {exc}"
+    email.locked_until = None
+    if email.attempts >= settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+        email.status = OutboundEmail.Status.FAILED
+    else:
+        email.status = OutboundEmail.Status.PENDING
+        email.next_attempt_at = now + timedelta(seconds=backoff_delay(email.attempts))
+
+
+def deliver_batch(emails):
+    """
+    Send claimed emails over a single mail connection and record each
+    outcome; failures are rescheduled with backoff until
+    EMAIL_QUEUE_MAX_ATTEMPTS is reached. Returns the number sent.
+    """
+    now = timezone.now()
+    connection = get_connection()
+    try:
+        connection.open()
+        connect_error = None
+    except Exception as exc:
+        connect_error = exc
+    sent = 0
+    for email in emails:
+        if connect_error is not None:
+            _record_failure(email, connect_error, now)
+            continue
+        message = EmailMessage(
+            email.subject,
+            email.body,
+            email.from_email,
+            email.recipients,
+            connection=connection,
+        )
+        try:
+            message.send()
+        except Exception as exc:
+            _record_failure(email, exc, now)
+            continue
+        email.status = OutboundEmail.Status.SENT
+        email.attempts += 1
+        email.locked_until = None
+        email.sent_at = timezone.now()
+        sent += 1
+    if connect_error is None:
+        connection.close()
+    OutboundEmail.objects.bulk_update(
+        emails,
+        [
+            "status",
+            "attempts",
+            "next_attempt_at",
+            "locked_until",
+            "last_error",
+            "sent_at",
+        ],
+    )
+    return sent
+
+
+def process_queue(batch_size=100):
+    """
+    Claim and deliver batches until no due emails remain.
+    Returns (processed, sent) counts.
+    """
+    processed = sent = 0
+    while True:
+        emails = claim_batch(batch_size)
+        if not emails:
+            return processed, sent
+        processed += len(emails)
+        sent += deliver_batch(emails)
@@ -0,0 +1,157 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Min
+from django.db.models.functions import Now
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import DomainEvent, EventConsumerOffset
+
+ORDER_CREATED = "order.created"
+ORDER_STATUS_CHANGED = "order.status_changed"
+PRODUCT_PRICE_CHANGED = "product.price_changed"
+PRODUCT_STOCK_CHANGED = "product.stock_changed"
+
+
+def publish(topic, aggregate_id, payload):
+    """Record a domain event in the current transaction."""
+    return publish_many([(topic, aggregate_id, payload)])
+
+
+def publish_many(events):
+    """Record many (topic, aggregate_id, payload) events with a single insert."""
+    return DomainEvent.objects.bulk_create(
+        [
+            DomainEvent(topic=topic, aggregate_id=str(aggregate_id), payload=payload)
+            for topic, aggregate_id, payload in events
+        ]
+    )
+
+
+def changed_fields(instance, fields):
+    """
+    Return {field: (old, new)} for `fields` that differ from the values the
+    instance was loaded with (see LoadedValuesMixin), then treat the current
+    values as loaded so the next save compares against them.
+    Instances that were not loaded from the database report no changes.
+    """
+    loaded = getattr(instance, "_loaded_values", None)
+    if loaded is None:
+        return {}
+    changes = {}
+    for field in fields:
+        if field not in loaded:
+            continue
+        new = getattr(instance, field)
+        if loaded[field] != new:
+            changes[field] = (loaded[field], new)
+        loaded[field] = new
+    return changes
+
+
+def get_consumer(name):
+    """Return (handler, topics) for a consumer configured in EVENT_CONSUMERS."""
+    config = settings.EVENT_CONSUMERS[name]
+    return import_string(config["handler"]), config.get("topics")
+
+
+def _in_flight_since(moment):
+    """
+    Whether another transaction that has written to the database and began
+    at or before `moment` is still open. Only PostgreSQL reports this; other
+    backends rely on EVENT_CONSUMER_SETTLE_SECONDS alone.
+    """
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_stat_activity "
+            "WHERE backend_xid IS NOT NULL AND pid <> pg_backend_pid() "
+            "AND xact_start <= %s)",
+            [moment],
+        )
+        return cursor.fetchone()[0]
+
+
+def _gap_expired(offset):
+    """
+    Whether the missing event id right after the consumer's offset can be
+    treated as a rolled-back insert: it has been waited on for
+    EVENT_CONSUMER_SETTLE_SECONDS and no transaction that could still
+    commit it is open.
+    """
+    if offset.gap_seen_at is None:
+        return False
+    settle = timedelta(seconds=settings.EVENT_CONSUMER_SETTLE_SECONDS)
+    if offset.gap_seen_at > timezone.now() - settle:
+        return False
+    return not _in_flight_since(offset.gap_seen_at)
+
+
+def consume(name, batch_size=100):
+    """
+    Deliver the next batch of events to consumer `name` and advance its
+    offset. The handler is called with a list of DomainEvent rows inside the
+    transaction that moves the offset; if it raises, the offset stays put and
+    the batch is redelivered on the next run (at-least-once), so handlers
+    must be idempotent. Event ids are allocated before the inserting
+    transaction commits, so a missing id below a visible one may belong to a
+    transaction still in flight: delivery stops at the first such gap until
+    it fills or expires (see _gap_expired).
+    Returns the number of events delivered.
+    """
+    handler, topics = get_consumer(name)
+    with transaction.atomic():
+        offset, _ = EventConsumerOffset.objects.select_for_update().get_or_create(
+            consumer=name
+        )
+        events = DomainEvent.objects.filter(pk__gt=offset.last_event_id)
+        if topics:
+            events = events.filter(topic__in=topics)
+        events = list(events.order_by("pk")[:batch_size])
+        if not events:
+            return 0
+        # Gaps are found over all topics: any missing id could be an event
+        # this consumer wants
+        ids = DomainEvent.objects.filter(
+            pk__gt=offset.last_event_id, pk__lte=events[-1].pk
+        ).values_list("pk", flat=True)
+        position = offset.last_event_id
+        blocked = False
+        for pk in ids.order_by("pk"):
+            if pk != position + 1 and not (
+                position == offset.last_event_id and _gap_expired(offset)
+            ):
+                blocked = True
+                break
+            position = pk
+        events = [event for event in events if event.pk <= position]
+        if position > offset.last_event_id:
+            if events:
+                handler(events)
+            offset.last_event_id = position
+            offset.gap_seen_at = None
+        if blocked and offset.gap_seen_at is None:
+            # Database time, so it compares with pg_stat_activity.xact_start
+            offset.gap_seen_at = Now()
+        offset.save(update_fields=["last_event_id", "gap_seen_at", "updated_at"])
+    return len(events)
+
+
+def prune_events():
+    """
+    Delete events every configured consumer has processed.
+    Returns the number of events deleted.
+    """
+    consumers = list(settings.EVENT_CONSUMERS)
+    if not consumers:
+        return 0
+    offsets = EventConsumerOffset.objects.filter(consumer__in=consumers)
+    if offsets.count() < len(consumers):
+        # A consumer that has never run still needs every event
+        return 0
+    low_water = offsets.aggregate(low=Min("last_event_id"))["low"]
+    deleted, _ = DomainEvent.objects.filter(pk__lte=low_water).delete()
+    return deleted
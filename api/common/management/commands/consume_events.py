@@ -0,0 +1,75 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.common.events import consume, prune_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver domain events to the consumers configured in EVENT_CONSUMERS, "
+        "in batches, advancing each consumer's offset after its handler succeeds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--consumer",
+            action="append",
+            help="Consumer to run; repeat for several. Defaults to all consumers.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Events handed to a consumer per call.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new events instead of exiting once caught up.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1,
+            help="Seconds to wait between polls when --loop is set.",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete events every consumer has processed after each pass.",
+        )
+
+    def handle(self, *args, **options):
+        consumers = options["consumer"] or list(settings.EVENT_CONSUMERS)
+        unknown = set(consumers) - set(settings.EVENT_CONSUMERS)
+        if unknown:
+            raise CommandError(f"Unknown consumers: {', '.join(sorted(unknown))}")
+        while True:
+            for name in consumers:
+                delivered = self._drain(name, options["batch_size"])
+                if delivered or not options["loop"]:
+                    self.stdout.write(f"{name}: delivered {delivered} events")
+            if options["prune"]:
+                pruned = prune_events()
+                if pruned:
+                    self.stdout.write(f"Pruned {pruned} processed events")
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
+
+    def _drain(self, name, batch_size):
+        delivered = 0
+        while True:
+            try:
+                count = consume(name, batch_size)
+            except Exception as exc:
+                # The offset was not advanced; the batch is retried next pass
+                self.stderr.write(
+                    f"{name}: handler failed: {type(exc).__name__}: {exc}"
+                )
+                return delivered
+            if not count:
+                return delivered
+            delivered += count
@@ -0,0 +1,90 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.common.seeding import Seeder
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed the database with benchmark volumes of coherent data: users with "
+        "profiles and addresses, a category tree, tags, products with tags, "
+        "images and variants, coupons, carts, and orders with coupon usages. "
+        "Output is deterministic for a given --seed and --until; row numbering "
+        "continues from existing data, so repeated runs add to it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--categories", type=int, default=50)
+        parser.add_argument("--tags", type=int, default=100)
+        parser.add_argument("--products", type=int, default=10_000)
+        parser.add_argument("--coupons", type=int, default=20)
+        parser.add_argument(
+            "--carts", type=int, default=200, help="Users given an open cart."
+        )
+        parser.add_argument("--order-items", type=int, default=50_000)
+        parser.add_argument(
+            "--items-per-order",
+            type=int,
+            default=5,
+            help="Average number of items per order.",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=0.8,
+            help="Zipf exponent for product popularity in carts and orders; 0 is uniform.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed for generated values."
+        )
+        parser.add_argument(
+            "--until",
+            type=datetime.date.fromisoformat,
+            help="Last day of generated history (YYYY-MM-DD); defaults to today.",
+        )
+        parser.add_argument(
+            "--days", type=int, default=365, help="Days of generated history."
+        )
+
+    def handle(self, *args, **options):
+        until = options["until"]
+        if until is not None:
+            until = timezone.make_aware(
+                datetime.datetime.combine(until, datetime.time.min)
+            )
+        seeder = Seeder(
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            until=until,
+            days=options["days"],
+        )
+        skew = options["skew"]
+        self.timed("categories", seeder.seed_categories, options["categories"])
+        self.timed("tags", seeder.seed_tags, options["tags"])
+        self.timed("user rows", seeder.seed_users, options["users"])
+        self.timed("coupons", seeder.seed_coupons, options["coupons"])
+        self.timed("product rows", seeder.seed_products, options["products"])
+        self.timed("cart rows", seeder.seed_carts, options["carts"], skew)
+        self.timed(
+            "order items",
+            seeder.seed_orders,
+            options["order_items"],
+            options["items_per_order"],
+            skew,
+        )
+
+    def timed(self, label, seed, *args):
+        started = time.monotonic()
+        count = seed(*args)
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {count} {label} in {elapsed:.1f}s "
+                f"({count / max(elapsed, 1e-6):.0f}/s)."
+            )
+        )
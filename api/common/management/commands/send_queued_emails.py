@@ -0,0 +1,73 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from api.common.email_queue import process_queue
+
+
+def _drain(batch_size):
+    try:
+        return process_queue(batch_size)
+    finally:
+        # Each worker thread opens its own database connection
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver queued outbound emails in batches over a single mail connection "
+        "per batch, retrying failures with exponential backoff."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Emails claimed and sent per mail connection.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of threads draining the queue concurrently.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue instead of exiting once it is empty.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between polls when --loop is set.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            if options["workers"] > 1:
+                with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                    results = list(
+                        executor.map(
+                            _drain, [options["batch_size"]] * options["workers"]
+                        )
+                    )
+            else:
+                results = [process_queue(options["batch_size"])]
+            processed = sum(result[0] for result in results)
+            sent = sum(result[1] for result in results)
+            if processed or not options["loop"]:
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Sent {sent} of {processed} queued emails in {elapsed:.2f}s "
+                        f"({processed - sent} rescheduled or failed)."
+                    )
+                )
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,149 @@
+"""
+Prometheus metrics for the API, exposed at /metrics (see MetricsView).
+
+Under gunicorn each worker process keeps its own counters. Set
+PROMETHEUS_MULTIPROC_DIR to a directory shared by the workers (emptied
+before the server starts) and prometheus_client writes every process's
+values to files there, which the /metrics view aggregates on each scrape.
+"""
+
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.models import Count
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from .profiling import RequestProfile, counting_queries
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by view (namespaced URL name).",
+    ["view", "method", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries run per request, by view.",
+    ["view", "method"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, float("inf")),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit or miss).",
+    ["cache", "result"],
+)
+CHECKOUTS = Counter(
+    "checkout_total",
+    "Checkout attempts by outcome.",
+    ["outcome"],
+)
+STOCK_CONFLICTS = Counter(
+    "stock_conflicts_total",
+    "Checked-out cart items whose quantity exceeded the product's stock.",
+)
+
+
+def record_cache_lookups(cache_name, hits, misses):
+    if hits:
+        CACHE_REQUESTS.labels(cache=cache_name, result="hit").inc(hits)
+    if misses:
+        CACHE_REQUESTS.labels(cache=cache_name, result="miss").inc(misses)
+
+
+class EmailQueueCollector:
+    """Outbound email queue depth by status, read from the database per scrape."""
+
+    def collect(self):
+        from .models import OutboundEmail
+
+        depth = GaugeMetricFamily(
+            "email_queue_depth",
+            "Outbound emails not yet sent, by status.",
+            labels=["status"],
+        )
+        counts = dict(
+            OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT)
+            .values_list("status")
+            .annotate(count=Count("pk"))
+        )
+        for status in (
+            OutboundEmail.Status.PENDING,
+            OutboundEmail.Status.SENDING,
+            OutboundEmail.Status.FAILED,
+        ):
+            depth.add_metric([status], counts.get(status, 0))
+        yield depth
+
+
+class _ProcessCollector:
+    # This process's metrics, without adding collectors to the global REGISTRY
+    def collect(self):
+        return REGISTRY.collect()
+
+
+def generate_metrics():
+    """Return the exposition text and its content type for a scrape."""
+    registry = CollectorRegistry()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(_ProcessCollector())
+    registry.register(EmailQueueCollector())
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """
+    Observe latency and query count per request, labelled by view; paths
+    that match no URL pattern share the "unmatched" label. Disabled with
+    METRICS_ENABLED=False. Works under both WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = RequestProfile()
+        started = time.perf_counter()
+        with counting_queries(profile):
+            response = self.get_response(request)
+        self.observe(request, response, profile, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        profile = RequestProfile()
+        started = time.perf_counter()
+        with counting_queries(profile):
+            response = await self.get_response(request)
+        self.observe(request, response, profile, time.perf_counter() - started)
+        return response
+
+    def observe(self, request, response, profile, duration):
+        match = request.resolver_match
+        view = match.view_name if match else "unmatched"
+        REQUEST_LATENCY.labels(
+            view=view, method=request.method, status=response.status_code
+        ).observe(duration)
+        REQUEST_QUERIES.labels(view=view, method=request.method).observe(
+            profile.queries
+        )
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:53
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_outboundemail"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventConsumerOffset",
+            fields=[
+                (
+                    "consumer",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("last_event_id", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="DomainEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("topic", models.CharField(max_length=100)),
+                ("aggregate_id", models.CharField(max_length=64)),
+                (
+                    "payload",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["topic", "id"], name="domainevent_topic_idx")
+                ],
+            },
+        ),
+    ]
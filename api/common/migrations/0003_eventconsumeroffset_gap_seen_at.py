@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0002_domain_events"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventconsumeroffset",
+            name="gap_seen_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
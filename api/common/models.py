@@ -1,6 +1,8 @@
 import uuid
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
 
 
 class BaseModel(models.Model):
@@ -10,3 +12,88 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class LoadedValuesMixin:
+    """
+    Remember field values as loaded from the database on `_loaded_values`,
+    so save handlers can tell which fields changed without another query.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+
+class OutboundEmail(BaseModel):
+    """
+    Outbox row for an email. Written in the same transaction as the change
+    that triggers it and delivered later by the send_queued_emails worker.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENDING = "sending", "Sending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="outboundemail_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} to {', '.join(self.recipients)} ({self.status})"
+
+
+class DomainEvent(models.Model):
+    """
+    Outbox row for a domain event such as "order.status_changed". Written in
+    the same transaction as the change it describes; the auto-increment id is
+    the position consumers track in EventConsumerOffset.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    topic = models.CharField(max_length=100)
+    aggregate_id = models.CharField(max_length=64)
+    payload = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["topic", "id"], name="domainevent_topic_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.topic} {self.aggregate_id}"
+
+
+class EventConsumerOffset(models.Model):
+    """Id of the last DomainEvent a consumer has processed."""
+
+    consumer = models.CharField(max_length=100, primary_key=True)
+    last_event_id = models.BigIntegerField(default=0)
+    # When delivery first stopped at a missing id right after last_event_id
+    gap_seen_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.consumer} @ {self.last_event_id}"
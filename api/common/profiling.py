@@ -0,0 +1,209 @@
+"""
+Per-request profiling, enabled with REQUEST_PROFILING=True.
+
+RequestProfilingMiddleware records the number of DB queries, time spent in
+the database, time spent producing serializer data and the response size.
+The figures are sent back as a Server-Timing header and logged as one JSON
+line on the "api.common.profiling" logger. Requests that run more queries
+than their budget are logged at WARNING. When profiling is off the
+middleware removes itself at startup, so it adds no per-request cost.
+"""
+
+import functools
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# The RequestProfile of the request being handled, if it is profiled
+_profile = ContextVar("request_profile", default=None)
+# RequestProfiles counting the queries run in the current context
+_query_counters = ContextVar("query_counters", default=())
+
+
+class RequestProfile:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+
+
+def _count_query(execute, sql, params, many, context):
+    counters = _query_counters.get()
+    if not counters:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        for profile in counters:
+            profile.queries += 1
+            profile.db_time += elapsed
+
+
+def _install_query_counter(connection, **kwargs):
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+@functools.cache
+def _watch_new_connections():
+    connection_created.connect(_install_query_counter)
+
+
+@contextmanager
+def counting_queries(profile):
+    """
+    Record the queries run in the block in `profile`, on every database
+    alias. Connections are per thread, and under ASGI sync views query from
+    another thread than the middleware's, so the wrapper sits on every
+    connection and finds `profile` through a ContextVar, which follows the
+    request into sync_to_async threads.
+    """
+    # New connections get the wrapper when created; the current thread's
+    # existing ones (e.g. opened before the first request) get it here
+    _watch_new_connections()
+    for connection in connections.all(initialized_only=True):
+        _install_query_counter(connection)
+    token = _query_counters.set((*_query_counters.get(), profile))
+    try:
+        yield profile
+    finally:
+        _query_counters.reset(token)
+
+
+@contextmanager
+def serializing():
+    """
+    Count the block as serializer time of the profiled request, for code
+    that builds response data without DRF serializers.
+    """
+    profile = _profile.get()
+    # Only time the outermost serializer; nested ones are included in it
+    if profile is None or profile.serializer_depth:
+        yield
+        return
+    profile.serializer_depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.serializer_time += time.perf_counter() - started
+        profile.serializer_depth -= 1
+
+
+def _timed_data(fget):
+    def data(self):
+        with serializing():
+            return fget(self)
+
+    data._profiled = True
+    return property(data)
+
+
+def instrument_serializers():
+    """
+    Time `serializer.data` on DRF serializers. Queries made while
+    serializing (lazy relations, N+1 lookups) count towards serializer time
+    as well as DB time.
+    """
+    from rest_framework import serializers
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        if not getattr(cls.data.fget, "_profiled", False):
+            cls.data = _timed_data(cls.data.fget)
+
+
+def query_budget(request):
+    """The query budget for the request's view, by namespaced URL name."""
+    match = request.resolver_match
+    view_name = match.view_name if match else None
+    return settings.REQUEST_QUERY_BUDGETS.get(view_name, settings.REQUEST_QUERY_BUDGET)
+
+
+class RequestProfilingMiddleware:
+    """
+    Profile every request when REQUEST_PROFILING is enabled. Place it first
+    in MIDDLEWARE so the total covers the other middleware too. Works under
+    both WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_PROFILING:
+            raise MiddlewareNotUsed
+        instrument_serializers()
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = RequestProfile()
+        token = _profile.set(profile)
+        started = time.perf_counter()
+        try:
+            with counting_queries(profile):
+                response = self.get_response(request)
+        finally:
+            _profile.reset(token)
+        self.report(request, response, profile, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        # Sync views run in another thread; counting_queries and the
+        # serializer timing reach them through ContextVars
+        profile = RequestProfile()
+        token = _profile.set(profile)
+        started = time.perf_counter()
+        try:
+            with counting_queries(profile):
+                response = await self.get_response(request)
+        finally:
+            _profile.reset(token)
+        self.report(request, response, profile, time.perf_counter() - started)
+        return response
+
+    def report(self, request, response, profile, duration):
+        match = request.resolver_match
+        budget = query_budget(request)
+        over_budget = budget is not None and profile.queries > budget
+        metrics = {
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "queries": profile.queries,
+            "db_ms": round(profile.db_time * 1000, 2),
+            "serializer_ms": round(profile.serializer_time * 1000, 2),
+            "response_bytes": None if response.streaming else len(response.content),
+            "query_budget": budget,
+            "over_budget": over_budget,
+        }
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={metrics["db_ms"]};desc="{profile.queries} queries"',
+                f"serializer;dur={metrics['serializer_ms']}",
+                f"total;dur={metrics['duration_ms']}",
+            ]
+        )
+        logger.log(
+            logging.WARNING if over_budget else logging.INFO,
+            json.dumps(metrics),
+            extra={"profile": metrics},
+        )
@@ -0,0 +1,122 @@
+"""
+Fast JSON rendering for API responses.
+
+FastJSONRenderer encodes with orjson when it is installed and with the
+standard library otherwise, producing the same bytes as DRF's JSONRenderer
+(compact, UTF-8, "Z" for UTC datetimes, Decimal and lazy strings handled by
+DRF's encoder). Response data may contain PreEncoded values, JSON encoded
+ahead of time (e.g. cached product fragments), which are spliced into the
+output without being decoded and encoded again.
+"""
+
+import json
+import re
+import uuid
+from collections.abc import Mapping
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # the standard library encoder is used instead
+    orjson = None
+
+_encoder = JSONEncoder()
+
+# DRF's JSONRenderer escapes these for JavaScript, which can't contain them
+# in string literals; they are the UTF-8 encodings of U+2028 and U+2029
+_LINE_SEPARATORS = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+
+
+class PreEncoded(Mapping):
+    """
+    A JSON object that is already encoded. FastJSONRenderer splices its
+    bytes into the output; everything else (views, tests, other renderers)
+    sees the decoded mapping, decoded on first access unless given.
+    """
+
+    __slots__ = ("json", "_data")
+
+    def __init__(self, encoded, data=None):
+        self.json = encoded
+        self._data = data
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = json.loads(self.json)
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"PreEncoded({self.json[:60]!r}...)"
+
+
+class _Splicer:
+    # Encodes PreEncoded values as unique placeholder strings, then swaps
+    # the (quoted) placeholders for their JSON in one pass over the output
+    def __init__(self):
+        self.marker = uuid.uuid4().hex
+        self.fragments = []
+
+    def default(self, obj):
+        if isinstance(obj, PreEncoded):
+            self.fragments.append(obj.json)
+            return f"{self.marker}:{len(self.fragments) - 1}"
+        return _encoder.default(obj)
+
+    def splice(self, output):
+        if not self.fragments:
+            return output
+        placeholder = re.compile(rb'"%s:(\d+)"' % self.marker.encode())
+        return placeholder.sub(lambda match: self.fragments[int(match[1])], output)
+
+
+def dumps(data):
+    """Encode `data` to compact UTF-8 JSON bytes, splicing PreEncoded values."""
+    splicer = _Splicer()
+    if orjson is not None:
+        try:
+            output = orjson.dumps(
+                data,
+                default=splicer.default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+            return splicer.splice(output)
+        except orjson.JSONEncodeError:
+            # e.g. integers over 64 bits; the standard library handles them
+            splicer = _Splicer()
+    output = json.dumps(
+        data,
+        default=splicer.default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode()
+    return splicer.splice(output)
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        # Indented (browsable API, ?indent=) or non-default output settings
+        # are rare; leave them to DRF, whose encoder reads PreEncoded as a
+        # mapping
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        output = dumps(data)
+        for character, escaped in _LINE_SEPARATORS:
+            if character in output:
+                output = output.replace(character, escaped)
+        return output
@@ -0,0 +1,80 @@
+"""
+API documentation views, with drf_yasg's schema generation loaded on first use.
+
+Importing drf_yasg's views and generators (and the spec validators they
+pull in) takes about 90 ms, which every worker paid when it loaded the
+URLconf. They are now imported the first time /swagger/, /redoc/ or
+/swagger.json is requested.
+
+/swagger.json, where both UIs load the schema from, serves
+OPENAPI_SCHEMA_FILE when it exists (entrypoint.sh writes it with
+`manage.py generate_swagger` before gunicorn starts) and generates the
+schema on every request otherwise.
+"""
+
+import functools
+import os
+
+from django.conf import settings
+from django.http import HttpResponse
+from drf_yasg import openapi
+from rest_framework import permissions
+
+# Also SWAGGER_SETTINGS["DEFAULT_INFO"], for `manage.py generate_swagger`
+API_INFO = openapi.Info(
+    title="Discount E-commerce API",
+    default_version="v1",
+    description="API documentation for the Discount E-commerce platform",
+)
+
+
+@functools.cache
+def get_schema_view():
+    from drf_yasg.views import get_schema_view
+
+    return get_schema_view(
+        API_INFO,
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+
+@functools.cache
+def _view(renderer=None):
+    schema_view = get_schema_view()
+    if renderer is None:
+        return schema_view.without_ui(cache_timeout=0)
+    return schema_view.with_ui(renderer, cache_timeout=0)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_schema(path, mtime):
+    with open(path, "rb") as schema_file:
+        return schema_file.read()
+
+
+def cached_schema():
+    """The pre-generated schema's bytes, re-read when the file changes, or None."""
+    path = settings.OPENAPI_SCHEMA_FILE
+    if not path:
+        return None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_schema(path, mtime)
+
+
+def schema_json(request):
+    schema = cached_schema()
+    if schema is not None:
+        return HttpResponse(schema, content_type="application/json")
+    return _view()(request, format="json")
+
+
+def swagger_ui(request):
+    return _view("swagger")(request)
+
+
+def redoc_ui(request):
+    return _view("redoc")(request)
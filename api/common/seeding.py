@@ -0,0 +1,577 @@
+"""
+Bulk generation of coherent benchmark and load-test data, used by the
+seed_data management command.
+
+Rows are built directly as model instances, a whole batch of each column
+at a time from one seeded random.Random (ids included), and written with
+bulk_create. Output is deterministic for a given seed, `until` date and
+starting row counts.
+"""
+
+import datetime
+import random
+import uuid
+from contextlib import contextmanager
+from decimal import Decimal
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from api.cart.models import Cart, CartItem
+from api.category.models import Category, Tag
+from api.orders.models import Coupon, CouponUsage, Order, OrderItem, OrderSummary
+from api.products.models import Product, ProductImage, ProductVariant
+from api.users.models import Address, Profile, User
+
+ADJECTIVES = [
+    "classic",
+    "compact",
+    "deluxe",
+    "eco",
+    "essential",
+    "everyday",
+    "premium",
+    "pro",
+    "rugged",
+    "smart",
+    "sport",
+    "ultra",
+    "urban",
+    "vintage",
+    "wireless",
+]
+NOUNS = [
+    "backpack",
+    "blender",
+    "camera",
+    "chair",
+    "desk lamp",
+    "headphones",
+    "jacket",
+    "kettle",
+    "keyboard",
+    "monitor",
+    "sneakers",
+    "speaker",
+    "tablet",
+    "watch",
+    "water bottle",
+]
+FIRST_NAMES = [
+    "Ama",
+    "Kofi",
+    "Efua",
+    "Kwame",
+    "Grace",
+    "John",
+    "Maria",
+    "Wei",
+    "Aisha",
+    "Liam",
+]
+LAST_NAMES = [
+    "Mensah",
+    "Owusu",
+    "Boateng",
+    "Smith",
+    "Garcia",
+    "Chen",
+    "Okafor",
+    "Brown",
+]
+CITIES = [
+    ("Accra", "Greater Accra", "GH"),
+    ("Kumasi", "Ashanti", "GH"),
+    ("Lagos", "Lagos", "NG"),
+    ("Nairobi", "Nairobi", "KE"),
+    ("Cape Town", "Western Cape", "ZA"),
+    ("London", "England", "GB"),
+    ("Toronto", "Ontario", "CA"),
+    ("Austin", "Texas", "US"),
+]
+VARIANTS = [
+    ("Size", ["S", "M", "L", "XL"]),
+    ("Color", ["Black", "White", "Red", "Blue"]),
+]
+ORDER_STATUSES = [
+    (Order.Status.DELIVERED, 50),
+    (Order.Status.SHIPPED, 15),
+    (Order.Status.PAID, 15),
+    (Order.Status.PENDING, 10),
+    (Order.Status.CANCELLED, 10),
+]
+CENT = Decimal("0.01")
+
+# Rows kept in memory to pick order owners and ordered products from
+POOL_SIZE = 100_000
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    Let bulk_create keep the timestamps set on instances of `models`
+    instead of overwriting auto_now/auto_now_add fields with the current
+    time, so seeded history is spread over the seeding window.
+    """
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Seeder:
+    def __init__(self, seed=0, batch_size=5000, until=None, days=365):
+        self.seed = seed
+        self.batch_size = batch_size
+        self.until = until or timezone.now().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        self.window = int(datetime.timedelta(days=days).total_seconds())
+        self.categories, self.tags, self.coupons = [], [], []
+        # (user id, email, default address id)
+        self.users = []
+        # (product id, name, price)
+        self.products = []
+
+    def start(self, phase, offset):
+        # Each phase draws from its own stream, keyed by the rows already in
+        # the table, so phases don't shift each other and reruns don't reuse ids
+        self.random = random.Random(f"{self.seed}:{phase}:{offset}")
+
+    # Column generators: one value per row for n rows
+
+    def uuids(self, n):
+        return [uuid.UUID(bytes=self.random.randbytes(16), version=4) for _ in range(n)]
+
+    def ints(self, n, low, high):
+        return self.random.choices(range(low, high + 1), k=n)
+
+    def money(self, n, low, high):
+        return [Decimal(cents) * CENT for cents in self.ints(n, low * 100, high * 100)]
+
+    def timestamps(self, n):
+        start = self.until - datetime.timedelta(seconds=self.window)
+        return [
+            start + datetime.timedelta(seconds=offset)
+            for offset in self.ints(n, 0, self.window)
+        ]
+
+    def batches(self, total):
+        for start in range(0, total, self.batch_size):
+            yield range(start, min(start + self.batch_size, total))
+
+    def keep(self, pool, rows):
+        # Fill the pool, then replace random entries (reservoir style)
+        for row in rows:
+            if len(pool) < POOL_SIZE:
+                pool.append(row)
+            else:
+                pool[self.random.randrange(POOL_SIZE)] = row
+
+    # Phases; each returns the number of rows it created
+
+    def seed_categories(self, count):
+        offset = Category.objects.count()
+        self.start("categories", offset)
+        roots = max(1, count // 5)
+        ids, created = self.uuids(count), self.timestamps(count)
+        nouns = self.random.choices(NOUNS, k=count)
+        categories = []
+        for i in range(count):
+            name = f"{nouns[i].title()} {offset + i}"
+            categories.append(
+                Category(
+                    id=ids[i],
+                    name=name,
+                    slug=slugify(name),
+                    description=f"All things {nouns[i]}.",
+                    parent_id=None if i < roots else self.random.choice(ids[:roots]),
+                    created_at=created[i],
+                    updated_at=created[i],
+                )
+            )
+        with explicit_timestamps(Category):
+            Category.objects.bulk_create(categories, batch_size=self.batch_size)
+        # Products are filed under leaf categories
+        self.categories = ids[roots:] or ids
+        return count
+
+    def seed_tags(self, count):
+        offset = Tag.objects.count()
+        self.start("tags", offset)
+        ids, created = self.uuids(count), self.timestamps(count)
+        adjectives = self.random.choices(ADJECTIVES, k=count)
+        tags = [
+            Tag(
+                id=ids[i],
+                name=f"{adjectives[i]}-{offset + i}",
+                slug=f"{adjectives[i]}-{offset + i}",
+                created_at=created[i],
+                updated_at=created[i],
+            )
+            for i in range(count)
+        ]
+        with explicit_timestamps(Tag):
+            Tag.objects.bulk_create(tags, batch_size=self.batch_size)
+        self.tags = ids
+        return count
+
+    def seed_users(self, count):
+        offset = User.objects.count()
+        self.start("users", offset)
+        password = make_password("password")
+        rows = 0
+        for numbers in self.batches(count):
+            n = len(numbers)
+            ids, joined = self.uuids(n), self.timestamps(n)
+            first = self.random.choices(FIRST_NAMES, k=n)
+            last = self.random.choices(LAST_NAMES, k=n)
+            address_counts = self.random.choices([1, 2], weights=[7, 3], k=n)
+            users, profiles, addresses, kept = [], [], [], []
+            for i, number in enumerate(numbers):
+                email = f"seed{offset + number}@example.com"
+                users.append(
+                    User(
+                        id=ids[i],
+                        email=email,
+                        username=f"seed{offset + number}",
+                        phonenumber=f"+1555{offset + number:08d}",
+                        password=password,
+                        first_name=first[i],
+                        last_name=last[i],
+                        is_email_verified=True,
+                        date_joined=joined[i],
+                        created_at=joined[i],
+                        updated_at=joined[i],
+                    )
+                )
+                profiles.append(
+                    Profile(
+                        id=uuid.UUID(bytes=self.random.randbytes(16), version=4),
+                        user_id=ids[i],
+                        created_at=joined[i],
+                        updated_at=joined[i],
+                    )
+                )
+                for j in range(address_counts[i]):
+                    city, state, country = self.random.choice(CITIES)
+                    address = Address(
+                        id=uuid.UUID(bytes=self.random.randbytes(16), version=4),
+                        user_id=ids[i],
+                        line1=f"{self.random.randint(1, 999)} Market Street",
+                        city=city,
+                        state=state,
+                        postal_code=f"{self.random.randint(10000, 99999)}",
+                        country=country,
+                        is_default=j == 0,
+                        created_at=joined[i],
+                        updated_at=joined[i],
+                    )
+                    addresses.append(address)
+                    if j == 0:
+                        kept.append((ids[i], email, address.id))
+            with transaction.atomic(), explicit_timestamps(User, Profile, Address):
+                User.objects.bulk_create(users)
+                Profile.objects.bulk_create(profiles)
+                Address.objects.bulk_create(addresses)
+            self.keep(self.users, kept)
+            rows += len(users) + len(profiles) + len(addresses)
+        return rows
+
+    def seed_coupons(self, count):
+        offset = Coupon.objects.count()
+        self.start("coupons", offset)
+        ids = self.uuids(count)
+        kinds = self.random.choices(Coupon.DiscountType.values, k=count)
+        coupons = []
+        for i in range(count):
+            percent = kinds[i] == Coupon.DiscountType.PERCENT
+            coupons.append(
+                Coupon(
+                    id=ids[i],
+                    code=f"SEED-{offset + i}",
+                    discount_type=kinds[i],
+                    discount_value=Decimal(self.random.choice([5, 10, 15, 20])),
+                    valid_from=self.until - datetime.timedelta(seconds=self.window),
+                    valid_to=self.until + datetime.timedelta(days=30),
+                    max_discount=Decimal("50") if percent else None,
+                    created_at=self.until,
+                    updated_at=self.until,
+                )
+            )
+        with explicit_timestamps(Coupon):
+            Coupon.objects.bulk_create(coupons, batch_size=self.batch_size)
+        self.coupons = coupons
+        return count
+
+    def seed_products(self, count):
+        offset = Product.objects.count()
+        self.start("products", offset)
+        rows = 0
+        for numbers in self.batches(count):
+            n = len(numbers)
+            ids, created = self.uuids(n), self.timestamps(n)
+            adjectives = self.random.choices(ADJECTIVES, k=n)
+            nouns = self.random.choices(NOUNS, k=n)
+            prices = self.money(n, 2, 500)
+            discounted = self.random.choices([True, False], weights=[1, 3], k=n)
+            stock = self.random.choices(
+                [0, *range(1, 501)], weights=[25, *[1] * 500], k=n
+            )
+            categories = self.random.choices(self.categories or [None], k=n)
+            tag_counts = self.ints(n, 0, 3) if self.tags else [0] * n
+            image_counts = self.ints(n, 0, 2)
+            variant_groups = self.random.choices(
+                [None, *VARIANTS], weights=[6, 2, 2], k=n
+            )
+            products, tags, images, variants, kept = [], [], [], [], []
+            for i, number in enumerate(numbers):
+                name = f"{adjectives[i].title()} {nouns[i]} {offset + number}"
+                price = prices[i]
+                discount = (
+                    (price * Decimal(self.random.randint(60, 95)) / 100).quantize(CENT)
+                    if discounted[i]
+                    else None
+                )
+                products.append(
+                    Product(
+                        id=ids[i],
+                        name=name,
+                        slug=slugify(name),
+                        description=f"A {adjectives[i]} {nouns[i]}.",
+                        price=price,
+                        discount_price=discount,
+                        category_id=categories[i],
+                        status=(
+                            Product.Status.ACTIVE
+                            if stock[i]
+                            else Product.Status.OUT_OF_STOCK
+                        ),
+                        is_available=bool(stock[i]),
+                        is_featured=self.random.random() < 0.02,
+                        stock=stock[i],
+                        created_at=created[i],
+                        updated_at=created[i],
+                    )
+                )
+                for tag_id in self.random.sample(
+                    self.tags, min(tag_counts[i], len(self.tags))
+                ):
+                    tags.append(Product.tags.through(product_id=ids[i], tag_id=tag_id))
+                for j in range(image_counts[i]):
+                    images.append(
+                        ProductImage(
+                            id=uuid.UUID(bytes=self.random.randbytes(16), version=4),
+                            product_id=ids[i],
+                            image=f"product_images/gallery/{ids[i]}-{j}.jpg",
+                            alt_text=name,
+                            created_at=created[i],
+                            updated_at=created[i],
+                        )
+                    )
+                if variant_groups[i]:
+                    variant, values = variant_groups[i]
+                    for value in values:
+                        variants.append(
+                            ProductVariant(
+                                id=uuid.UUID(
+                                    bytes=self.random.randbytes(16), version=4
+                                ),
+                                product_id=ids[i],
+                                name=variant,
+                                value=value,
+                                created_at=created[i],
+                                updated_at=created[i],
+                            )
+                        )
+                # add_to_cart and checkout capture product.price, not the sale price
+                kept.append((ids[i], name, price))
+            with transaction.atomic(), explicit_timestamps(
+                Product, ProductImage, ProductVariant
+            ):
+                Product.objects.bulk_create(products)
+                Product.tags.through.objects.bulk_create(tags)
+                ProductImage.objects.bulk_create(images)
+                ProductVariant.objects.bulk_create(variants)
+            self.keep(self.products, kept)
+            rows += len(products) + len(tags) + len(images) + len(variants)
+        return rows
+
+    def pick_products(self, k, skew):
+        """
+        Pick k products (with repeats), favouring the front of the pool:
+        weight 1 / rank**skew, so skew=0 is uniform and higher is hotter.
+        """
+        weights = getattr(self, "_weights", None)
+        if weights is None or len(weights) != len(self.products):
+            weights = list(
+                accumulate(
+                    1 / (rank**skew) for rank in range(1, len(self.products) + 1)
+                )
+            )
+            self._weights = weights
+        return self.random.choices(self.products, cum_weights=weights, k=k)
+
+    def seed_carts(self, count, skew=0.8):
+        if not self.products:
+            return 0
+        self.start("carts", Cart.objects.count())
+        owners = self.random.sample(self.users, min(count, len(self.users)))
+        rows = 0
+        for numbers in self.batches(len(owners)):
+            n = len(numbers)
+            ids, updated = self.uuids(n), self.timestamps(n)
+            carts, items = [], []
+            for i, number in enumerate(numbers):
+                picked = {
+                    product[0]: product
+                    for product in self.pick_products(self.random.randint(1, 4), skew)
+                }
+                quantities = self.ints(len(picked), 1, 3)
+                cart = Cart(
+                    id=ids[i],
+                    user_id=owners[number][0],
+                    items_count=len(picked),
+                    total_quantity=sum(quantities),
+                    subtotal=sum(
+                        (p[2] * q for p, q in zip(picked.values(), quantities)),
+                        Decimal("0"),
+                    ),
+                    created_at=updated[i],
+                    updated_at=updated[i],
+                )
+                carts.append(cart)
+                for (product_id, _, price), quantity in zip(
+                    picked.values(), quantities
+                ):
+                    items.append(
+                        CartItem(
+                            id=uuid.UUID(bytes=self.random.randbytes(16), version=4),
+                            cart_id=cart.id,
+                            product_id=product_id,
+                            quantity=quantity,
+                            price=price,
+                            created_at=updated[i],
+                            updated_at=updated[i],
+                        )
+                    )
+            with transaction.atomic(), explicit_timestamps(Cart, CartItem):
+                Cart.objects.bulk_create(carts)
+                CartItem.objects.bulk_create(items)
+            rows += len(carts) + len(items)
+        return rows
+
+    def seed_orders(self, order_items, items_per_order=5, skew=0.8):
+        """Create about `order_items` order items; returns the number created."""
+        if not self.users or not self.products:
+            return 0
+        self.start("orders", Order.objects.count())
+        orders_total = max(1, order_items // items_per_order)
+        statuses, weights = zip(*ORDER_STATUSES)
+        created_items = 0
+        for numbers in self.batches(orders_total):
+            n = len(numbers)
+            ids, checked_out = self.uuids(n), self.timestamps(n)
+            owners = self.random.choices(self.users, k=n)
+            status = self.random.choices(statuses, weights=weights, k=n)
+            # Spread the remaining items evenly over the remaining orders
+            per_order = (order_items - created_items) / (orders_total - numbers.start)
+            sizes = [
+                max(1, round(per_order * self.random.uniform(0.5, 1.5)))
+                for _ in range(n)
+            ]
+            products = iter(self.pick_products(sum(sizes), skew))
+            quantities = iter(self.ints(sum(sizes), 1, 3))
+            shipping = self.money(n, 0, 15)
+            with_coupon = self.random.choices([True, False], weights=[1, 9], k=n)
+            orders, items, summaries, usages = [], [], [], []
+            for i in range(n):
+                user_id, email, address_id = owners[i]
+                subtotal = Decimal("0")
+                for _ in range(sizes[i]):
+                    product_id, name, price = next(products)
+                    quantity = next(quantities)
+                    subtotal += price * quantity
+                    items.append(
+                        OrderItem(
+                            id=uuid.UUID(bytes=self.random.randbytes(16), version=4),
+                            order_id=ids[i],
+                            product_id=product_id,
+                            product_name=name,
+                            quantity=quantity,
+                            price=price,
+                            created_at=checked_out[i],
+                            updated_at=checked_out[i],
+                        )
+                    )
+                coupon = (
+                    self.random.choice(self.coupons)
+                    if with_coupon[i] and self.coupons
+                    else None
+                )
+                discount = (
+                    coupon.calculate_discount(subtotal) if coupon else Decimal("0")
+                )
+                tax = (subtotal * Decimal("0.075")).quantize(CENT)
+                total = subtotal + shipping[i] + tax - discount
+                orders.append(
+                    Order(
+                        id=ids[i],
+                        user_id=user_id,
+                        address_id=address_id,
+                        status=status[i],
+                        total=total,
+                        discount=discount,
+                        tax=tax,
+                        shipping=shipping[i],
+                        coupon=coupon,
+                        checked_out_at=checked_out[i],
+                        created_at=checked_out[i],
+                        updated_at=checked_out[i],
+                    )
+                )
+                summaries.append(
+                    OrderSummary(
+                        order_id=ids[i],
+                        user_email=email,
+                        status=status[i],
+                        total=total,
+                        item_count=sizes[i],
+                        checked_out_at=checked_out[i],
+                    )
+                )
+                if coupon:
+                    usages.append(
+                        CouponUsage(
+                            id=uuid.UUID(bytes=self.random.randbytes(16), version=4),
+                            coupon=coupon,
+                            user_id=user_id,
+                            order_id=ids[i],
+                            used_at=checked_out[i],
+                            created_at=checked_out[i],
+                            updated_at=checked_out[i],
+                        )
+                    )
+            with transaction.atomic(), explicit_timestamps(
+                Order, OrderItem, CouponUsage
+            ):
+                Order.objects.bulk_create(orders)
+                OrderItem.objects.bulk_create(items)
+                # bulk_create skips the signals that maintain order summaries
+                OrderSummary.objects.bulk_create(summaries)
+                CouponUsage.objects.bulk_create(usages)
+            created_items += len(items)
+        return created_items
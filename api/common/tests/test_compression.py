@@ -0,0 +1,75 @@
+import gzip
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+
+from api.common.compression import negotiate
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("br;q=1.0, gzip;q=0.8", "br"),
+        ("gzip;q=0.5, br;q=0.5", "br"),
+        ("gzip;q=0", None),
+        ("*", "br"),
+        ("*;q=0.1, gzip;q=0", "br"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate(header, expected):
+    assert negotiate(header, available=["br", "gzip"]) == expected
+
+
+def test_negotiate_skips_unavailable_encodings():
+    assert negotiate("br, gzip;q=0.5", available=["gzip"]) == "gzip"
+
+
+@pytest.mark.django_db
+def test_large_json_responses_are_compressed(api_client, product_factory):
+    product_factory.create_batch(10)
+    url = reverse("products:product-list-create")
+    plain = api_client.get(url)
+    response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert response["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response["Vary"]
+    assert int(response["Content-Length"]) == len(response.content)
+    assert gzip.decompress(response.content) == plain.content
+    assert not plain.has_header("Content-Encoding")
+
+
+@pytest.mark.django_db
+def test_small_responses_are_not_compressed(api_client, product):
+    url = reverse("products:product-list-create")
+    with override_settings(RESPONSE_COMPRESSION_MIN_BYTES=10**7):
+        response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert not response.has_header("Content-Encoding")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cookie", ["sessionid", "csrftoken"])
+def test_cookie_authenticated_responses_are_not_compressed(
+    api_client, product_factory, cookie
+):
+    # BREACH: cross-site requests carry cookies, never an Authorization header
+    product_factory.create_batch(10)
+    api_client.cookies[cookie] = "secret"
+    response = api_client.get(
+        reverse("products:product-list-create"), HTTP_ACCEPT_ENCODING="gzip"
+    )
+    assert not response.has_header("Content-Encoding")
+
+
+@pytest.mark.django_db
+def test_async_requests_are_compressed(product_factory):
+    product_factory.create_batch(10)
+    response = async_to_sync(AsyncClient().get)(
+        reverse("products:product-list-create"), headers={"Accept-Encoding": "gzip"}
+    )
+    assert response["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.content))["count"] == 10
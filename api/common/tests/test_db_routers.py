@@ -0,0 +1,86 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from api.cart.models import Cart
+from api.common.db_routers import (
+    PRIMARY_PIN_COOKIE,
+    ReplicaRouter,
+    ReplicaRoutingMiddleware,
+    use_primary,
+    use_replicas,
+)
+from api.products.models import Product
+
+router = ReplicaRouter()
+
+
+@pytest.fixture(autouse=True)
+def replicas(settings):
+    settings.DATABASE_REPLICAS = ["replica1"]
+
+
+def run_request(method, view, cookies=None):
+    request = getattr(RequestFactory(), method.lower())("/")
+    request.COOKIES.update(cookies or {})
+    return ReplicaRoutingMiddleware(view)(request)
+
+
+def test_outside_requests_everything_uses_primary():
+    assert router.db_for_read(Product) is None
+    assert router.db_for_write(Product) == "default"
+
+
+def test_safe_request_reads_catalog_from_replica():
+    routes = {}
+
+    def view(request):
+        routes["product"] = router.db_for_read(Product)
+        routes["cart"] = router.db_for_read(Cart)
+        routes["user"] = router.db_for_read(get_user_model())
+        return HttpResponse()
+
+    response = run_request("GET", view)
+    assert routes == {"product": "replica1", "cart": None, "user": None}
+    assert PRIMARY_PIN_COOKIE not in response.cookies
+
+
+def test_reads_after_a_write_stay_on_primary():
+    routes = []
+
+    def view(request):
+        routes.append(router.db_for_read(Product))
+        router.db_for_write(Product)
+        routes.append(router.db_for_read(Product))
+        return HttpResponse()
+
+    response = run_request("GET", view)
+    assert routes == ["replica1", None]
+    # The client keeps reading from the primary for a short while
+    assert response.cookies[PRIMARY_PIN_COOKIE]["max-age"] == 5
+
+
+def test_unsafe_and_pinned_requests_read_from_primary():
+    def view(request):
+        return HttpResponse(router.db_for_read(Product) or "default")
+
+    assert run_request("POST", view).content == b"default"
+    pinned = run_request("GET", view, cookies={PRIMARY_PIN_COOKIE: "1"})
+    assert pinned.content == b"default"
+
+
+def test_context_managers():
+    with use_replicas():
+        assert router.db_for_read(Product) == "replica1"
+        with use_primary():
+            assert router.db_for_read(Product) is None
+        assert router.db_for_read(Product) == "replica1"
+    assert router.db_for_read(Product) is None
+
+
+def test_no_replicas_configured(settings):
+    settings.DATABASE_REPLICAS = []
+    with use_replicas():
+        assert router.db_for_read(Product) is None
+    assert router.allow_migrate("default", "products")
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from smtplib import SMTPException
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from api.common.email_queue import claim_batch, process_queue
+from api.common.models import OutboundEmail
+from api.common.utils import send_email, send_emails
+
+pytestmark = pytest.mark.django_db
+
+
+def test_send_email_queues_without_sending(mailoutbox):
+    send_email("Hello", "Body", ["a@example.com"])
+    email = OutboundEmail.objects.get()
+    assert (email.status, email.recipients) == ("pending", ["a@example.com"])
+    assert mailoutbox == []
+
+
+def test_fail_silently_is_deprecated_but_accepted():
+    with pytest.deprecated_call():
+        send_email("Hello", "Body", ["a@example.com"], fail_silently=False)
+    with pytest.deprecated_call():
+        send_emails([("Hi", "Body", ["b@example.com"])], fail_silently=True)
+    assert OutboundEmail.objects.count() == 2
+
+
+def test_queued_email_rolls_back_with_transaction(mailoutbox):
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            send_email("Hello", "Body", ["a@example.com"])
+            raise RuntimeError
+    assert not OutboundEmail.objects.exists()
+
+
+def test_process_queue_sends_batches_over_one_connection(mailoutbox):
+    send_emails([(f"Subject {i}", "Body", [f"u{i}@example.com"]) for i in range(5)])
+    with mock.patch(
+        "api.common.email_queue.get_connection",
+        wraps=mail.get_connection,
+    ) as get_connection:
+        assert process_queue(batch_size=2) == (5, 5)
+    assert get_connection.call_count == 3
+    assert len(mailoutbox) == 5
+    assert not OutboundEmail.objects.exclude(status="sent").exists()
+    assert process_queue() == (0, 0)
+
+
+@override_settings(EMAIL_QUEUE_MAX_ATTEMPTS=2, EMAIL_QUEUE_BACKOFF_SECONDS=60)
+def test_failed_delivery_is_retried_with_backoff(mailoutbox):
+    send_email("Hello", "Body", ["a@example.com"])
+    with mock.patch(
+        "django.core.mail.EmailMessage.send", side_effect=SMTPException("down")
+    ):
+        assert process_queue() == (1, 0)
+    email = OutboundEmail.objects.get()
+    assert (email.status, email.attempts) == ("pending", 1)
+    assert "SMTPException: down" in email.last_error
+    assert email.next_attempt_at >= timezone.now() + timedelta(seconds=29)
+    # Not due yet
+    assert process_queue() == (0, 0)
+
+    OutboundEmail.objects.update(next_attempt_at=timezone.now())
+    with mock.patch(
+        "django.core.mail.EmailMessage.send", side_effect=SMTPException("down")
+    ):
+        process_queue()
+    email.refresh_from_db()
+    assert (email.status, email.attempts) == ("failed", 2)
+    assert mailoutbox == []
+
+
+def test_expired_lease_is_reclaimed():
+    send_email("Hello", "Body", ["a@example.com"])
+    assert len(claim_batch(10)) == 1
+    assert claim_batch(10) == []
+    OutboundEmail.objects.update(locked_until=timezone.now() - timedelta(seconds=1))
+    assert len(claim_batch(10)) == 1
+
+
+def test_send_queued_emails_command(mailoutbox, capsys):
+    send_emails([("Subject", "Body", ["a@example.com"])] * 3)
+    call_command("send_queued_emails", "--batch-size", "2")
+    assert len(mailoutbox) == 3
+    assert "Sent 3 of 3 queued emails" in capsys.readouterr().out
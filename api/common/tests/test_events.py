@@ -0,0 +1,161 @@
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+
+from api.common.events import consume, prune_events
+from api.common.models import DomainEvent, EventConsumerOffset
+from api.orders.models import Order
+from api.orders.tests.factories import OrderFactory
+from api.products.models import Product
+from api.products.tests.factories import ProductFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def record_events(events):
+    # Handlers are imported by dotted path, so record through the cache
+    # rather than module state the test may not share
+    batches = cache.get("received", [])
+    batches.append([(event.topic, event.payload) for event in events])
+    cache.set("received", batches)
+
+
+def failing_handler(events):
+    raise RuntimeError("downstream unavailable")
+
+
+CONSUMERS = {
+    "recorder": {
+        "handler": "api.common.tests.test_events.record_events",
+        "topics": ["product.price_changed", "product.stock_changed"],
+    },
+    "broken": {"handler": "api.common.tests.test_events.failing_handler"},
+    "all": {"handler": "api.common.tests.test_events.record_events"},
+}
+
+
+@pytest.fixture(autouse=True)
+def consumers(settings):
+    settings.EVENT_CONSUMERS = CONSUMERS
+    settings.EVENT_CONSUMER_SETTLE_SECONDS = 0
+
+
+def test_order_events_are_published():
+    order = OrderFactory(status=Order.Status.PENDING)
+    order = Order.objects.get(pk=order.pk)
+    order.set_status(Order.Status.PAID, notify=False)
+    order.set_status(Order.Status.SHIPPED, notify=False)
+    events = list(DomainEvent.objects.filter(aggregate_id=str(order.pk)).order_by("pk"))
+    assert [event.topic for event in events] == [
+        "order.created",
+        "order.status_changed",
+        "order.status_changed",
+    ]
+    assert events[2].payload == {"id": str(order.pk), "from": "paid", "to": "shipped"}
+
+
+def test_bulk_status_change_publishes_events():
+    orders = OrderFactory.create_batch(2, status=Order.Status.PENDING)
+    Order.bulk_set_status(
+        [{"order": order.pk, "status": "paid"} for order in orders], notify=False
+    )
+    assert DomainEvent.objects.filter(topic="order.status_changed").count() == 2
+
+
+def test_product_events_only_for_changed_fields():
+    product = Product.objects.get(pk=ProductFactory(price="10.00", stock=5).pk)
+    product.name = "Renamed"
+    product.save()
+    assert not DomainEvent.objects.exists()
+    product.price = Decimal("12.50")
+    product.stock = 4
+    product.save()
+    events = {
+        event.topic: event.payload for event in DomainEvent.objects.order_by("pk")
+    }
+    assert events["product.price_changed"]["old"] == "10.00"
+    assert events["product.price_changed"]["new"] == "12.50"
+    assert (
+        events["product.stock_changed"]["old"],
+        events["product.stock_changed"]["new"],
+    ) == (5, 4)
+
+
+def test_consume_delivers_batches_and_advances_offset():
+    product = Product.objects.get(pk=ProductFactory(stock=10).pk)
+    for stock in (9, 8, 7):
+        product.stock = stock
+        product.save()
+    assert consume("recorder", batch_size=2) == 2
+    assert consume("recorder", batch_size=2) == 1
+    assert consume("recorder", batch_size=2) == 0
+    received = cache.get("received")
+    assert [len(batch) for batch in received] == [2, 1]
+    assert received[1][0][1]["new"] == 7
+    offset = EventConsumerOffset.objects.get(consumer="recorder")
+    assert offset.last_event_id == DomainEvent.objects.latest("pk").pk
+
+
+def test_failed_handler_does_not_advance_offset():
+    OrderFactory()
+    with pytest.raises(RuntimeError):
+        consume("broken")
+    assert not EventConsumerOffset.objects.filter(
+        consumer="broken", last_event_id__gt=0
+    ).exists()
+
+
+def _event(pk, stock):
+    return DomainEvent.objects.create(
+        pk=pk, topic="product.stock_changed", aggregate_id="p", payload={"new": stock}
+    )
+
+
+@override_settings(EVENT_CONSUMER_SETTLE_SECONDS=60)
+def test_slow_transaction_event_is_not_skipped():
+    first = _event(None, 3)
+    # A slow transaction holds first.pk + 1 while a faster one commits after it
+    _event(first.pk + 2, 1)
+    assert consume("all") == 1
+    assert consume("all") == 0
+    offset = EventConsumerOffset.objects.get(consumer="all")
+    assert offset.last_event_id == first.pk
+    assert offset.gap_seen_at is not None
+    # The slow transaction commits
+    _event(first.pk + 1, 2)
+    assert consume("all") == 2
+    received = cache.get("received")
+    assert [payload["new"] for _, payload in received[1]] == [2, 1]
+    offset.refresh_from_db()
+    assert offset.last_event_id == first.pk + 2
+    assert offset.gap_seen_at is None
+
+
+def test_expired_gap_is_skipped():
+    first = _event(None, 3)
+    # first.pk + 1 was rolled back and never appears
+    _event(first.pk + 2, 1)
+    assert consume("all") == 1
+    assert consume("all") == 1
+    assert EventConsumerOffset.objects.get(consumer="all").last_event_id == (
+        first.pk + 2
+    )
+
+
+def test_consume_events_command_and_prune(capsys):
+    product = Product.objects.get(pk=ProductFactory(stock=3).pk)
+    product.stock = 2
+    product.save()
+    call_command("consume_events", "--consumer", "recorder", "--prune")
+    out = capsys.readouterr()
+    assert "recorder: delivered 1 events" in out.out
+    # "broken" and "all" have never run, so nothing is pruned yet
+    assert DomainEvent.objects.count() == 1
+    for consumer in ("broken", "all"):
+        EventConsumerOffset.objects.create(
+            consumer=consumer, last_event_id=DomainEvent.objects.latest("pk").pk
+        )
+    assert prune_events() == 1
@@ -0,0 +1,68 @@
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from api.common.email_queue import enqueue_emails
+from api.common.metrics import MetricsMiddleware
+
+pytestmark = pytest.mark.django_db
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_metrics_exposes_request_latency_and_queue_depth(api_client, product):
+    enqueue_emails([("Subject", "Body", ["a@example.com"])])
+    api_client.get(reverse("products:product-list-create"))
+    response = api_client.get(reverse("metrics"))
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    body = response.content.decode()
+    assert 'view="products:product-list-create"' in body
+    assert "http_request_db_queries_bucket" in body
+    assert 'email_queue_depth{status="pending"} 1.0' in body
+    assert 'cache_requests_total{cache="product_fragment",result="miss"}' in body
+
+
+@override_settings(METRICS_TOKEN="secret")
+def test_metrics_requires_token_when_configured(api_client):
+    assert api_client.get(reverse("metrics")).status_code == 403
+    response = api_client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+    assert response.status_code == 200
+
+
+def test_checkout_outcomes_and_stock_conflicts(api_client, user, address, cart_item):
+    cart_item.product.stock = cart_item.quantity - 1
+    cart_item.product.save()
+    successes = sample("checkout_total", outcome="success")
+    conflicts = sample("stock_conflicts_total")
+    api_client.force_authenticate(user=user)
+    response = api_client.post(reverse("orders:checkout"), {})
+    assert response.status_code == 201
+    assert sample("checkout_total", outcome="success") == successes + 1
+    assert sample("stock_conflicts_total") == conflicts + 1
+
+    empty = sample("checkout_total", outcome="empty_cart")
+    api_client.post(reverse("orders:checkout"), {})
+    assert sample("checkout_total", outcome="empty_cart") == empty + 1
+
+
+def test_metrics_observe_async_requests(product):
+    labels = {"view": "products:product-list-create", "method": "GET"}
+    before = sample("http_request_db_queries_count", **labels)
+    before_sum = sample("http_request_db_queries_sum", **labels)
+    response = async_to_sync(AsyncClient().get)(reverse("products:product-list-create"))
+    assert response.status_code == 200
+    assert sample("http_request_db_queries_count", **labels) == before + 1
+    assert sample("http_request_db_queries_sum", **labels) > before_sum
+
+
+def test_metrics_middleware_is_async_capable():
+    async def view(request):
+        return HttpResponse()
+
+    assert iscoroutinefunction(MetricsMiddleware(view))
@@ -0,0 +1,80 @@
+import json
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.common.profiling import RequestProfilingMiddleware
+
+pytestmark = pytest.mark.django_db
+
+
+def profiled_records(caplog):
+    return [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "api.common.profiling"
+    ]
+
+
+@override_settings(REQUEST_PROFILING=True)
+def test_profiling_reports_queries_and_timings(caplog, product_factory):
+    product_factory.create_batch(3)
+    with caplog.at_level(logging.INFO, logger="api.common.profiling"):
+        response = APIClient().get(reverse("products:product-list-create"))
+    assert response.status_code == 200
+    assert 'desc="' in response["Server-Timing"]
+    assert "serializer;dur=" in response["Server-Timing"]
+    [metrics] = profiled_records(caplog)
+    assert metrics["view"] == "products:product-list-create"
+    assert metrics["queries"] > 0
+    assert metrics["serializer_ms"] > 0
+    assert metrics["response_bytes"] == len(response.content)
+    assert metrics["over_budget"] is False
+
+
+@override_settings(
+    REQUEST_PROFILING=True,
+    REQUEST_QUERY_BUDGETS={"products:product-list-create": 0},
+)
+def test_profiling_flags_requests_over_budget(caplog, product):
+    with caplog.at_level(logging.INFO, logger="api.common.profiling"):
+        APIClient().get(reverse("products:product-list-create"))
+    [record] = [r for r in caplog.records if r.name == "api.common.profiling"]
+    assert record.levelno == logging.WARNING
+    assert record.profile["query_budget"] == 0
+    assert record.profile["over_budget"] is True
+
+
+def test_profiling_disabled_by_default(caplog, product):
+    with caplog.at_level(logging.INFO, logger="api.common.profiling"):
+        response = APIClient().get(reverse("products:product-list-create"))
+    assert "Server-Timing" not in response
+    assert profiled_records(caplog) == []
+
+
+@override_settings(REQUEST_PROFILING=True)
+def test_profiling_async_requests(caplog, product):
+    # Under ASGI the middleware runs as a coroutine and the sync view in
+    # another thread; its queries must still be counted
+    with caplog.at_level(logging.INFO, logger="api.common.profiling"):
+        response = async_to_sync(AsyncClient().get)(
+            reverse("products:product-list-create")
+        )
+    assert response.status_code == 200
+    [metrics] = profiled_records(caplog)
+    assert metrics["queries"] > 0
+    assert f'desc="{metrics["queries"]} queries"' in response["Server-Timing"]
+
+
+def test_profiling_middleware_is_async_capable():
+    async def view(request):
+        return HttpResponse()
+
+    with override_settings(REQUEST_PROFILING=True):
+        middleware = RequestProfilingMiddleware(view)
+    assert iscoroutinefunction(middleware)
@@ -0,0 +1,69 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from api.common import renderers
+from api.common.renderers import FastJSONRenderer, PreEncoded
+
+PAYLOAD = ReturnDict(
+    {
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "price": Decimal("10.50"),
+        "created_at": datetime.datetime(
+            2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+        ),
+        "local": datetime.datetime(2025, 1, 2, 3, 4, tzinfo=ZoneInfo("Africa/Lagos")),
+        "naive": datetime.datetime(2025, 1, 2, 3, 4, 5),
+        "day": datetime.date(2025, 1, 2),
+        "at": datetime.time(9, 30),
+        "label": gettext_lazy("Product"),
+        "text": "Café \u2028 line \u2029",
+        "items": [1, 2.5, None, True, {"nested": ["a"]}],
+        1: "int key",
+    },
+    serializer=None,
+)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(renderers, "orjson", None)
+    return request.param
+
+
+def test_output_matches_drf_renderer(encoder):
+    assert FastJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+def test_pre_encoded_fragments_are_spliced(encoder):
+    fragment = PreEncoded(b'{"id":"a","name":"x"}')
+    output = FastJSONRenderer().render({"results": [fragment, {"id": "b"}]})
+    assert output == b'{"results":[{"id":"a","name":"x"},{"id":"b"}]}'
+    assert fragment["name"] == "x"
+    assert dict(fragment) == {"id": "a", "name": "x"}
+
+
+def test_indented_output_falls_back_to_drf():
+    data = {"results": [PreEncoded(b'{"id":"a"}')]}
+    media_type = "application/json; indent=2"
+    output = FastJSONRenderer().render(data, media_type)
+    assert output == JSONRenderer().render({"results": [{"id": "a"}]}, media_type)
+
+
+@pytest.mark.django_db
+def test_cached_product_list_renders_the_same(api_client, product_factory):
+    product_factory.create_batch(3)
+    url = reverse("products:product-list-create")
+    cold = api_client.get(url)
+    warm = api_client.get(url)
+    assert warm.content == cold.content
+    assert json.loads(warm.content)["results"][0]["id"] == warm.data["results"][0]["id"]
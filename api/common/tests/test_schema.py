@@ -0,0 +1,62 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+def test_schema_is_generated_without_a_pre_generated_file(api_client, settings):
+    settings.OPENAPI_SCHEMA_FILE = ""
+    response = api_client.get(reverse("schema-json"))
+    assert response.status_code == 200
+    assert "/products/" in json.loads(response.content)["paths"]
+
+
+def test_bulk_upload_summary_response_is_documented(api_client, settings):
+    settings.OPENAPI_SCHEMA_FILE = ""
+    schema = json.loads(api_client.get(reverse("schema-json")).content)
+    for path in ("/products/bulk-upload/", "/category/bulk-upload/"):
+        responses = schema["paths"][path]["post"]["responses"]
+        assert set(responses) >= {"201", "400"}
+        name = responses["201"]["schema"]["$ref"].rsplit("/", 1)[-1]
+        properties = schema["definitions"][name]["properties"]
+        assert {"created", "created_count", "created_ids", "errors"} <= set(properties)
+
+
+def test_pre_generated_schema_is_served_from_disk(api_client, settings, tmp_path):
+    schema_file = tmp_path / "openapi.json"
+    schema_file.write_text('{"swagger": "2.0", "paths": {}}')
+    settings.OPENAPI_SCHEMA_FILE = str(schema_file)
+    response = api_client.get(reverse("schema-json"))
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.content == b'{"swagger": "2.0", "paths": {}}'
+
+
+@pytest.mark.parametrize("name", ["schema-swagger-ui", "schema-redoc"])
+def test_docs_ui_loads_schema_from_json_endpoint(api_client, name):
+    response = api_client.get(reverse(name))
+    assert response.status_code == 200
+    assert reverse("schema-json") in response.content.decode()
+
+
+def test_startup_defers_schema_generation():
+    code = (
+        "import sys, core.wsgi\n"
+        "from django.urls import get_resolver\n"
+        "get_resolver().url_patterns\n"
+        "print(sorted(m for m in ('drf_yasg.views', 'drf_yasg.generators', 'boto3')"
+        " if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=settings.BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.db.models import F
+
+from api.cart.models import Cart, CartItem
+from api.category.models import Category
+from api.orders.models import CouponUsage, Order, OrderItem, OrderSummary
+from api.products.models import Product
+from api.users.models import Address, Profile, User
+
+pytestmark = pytest.mark.django_db
+
+OPTIONS = {
+    "users": 4,
+    "categories": 5,
+    "tags": 3,
+    "products": 6,
+    "coupons": 2,
+    "carts": 2,
+    "order_items": 12,
+    "items_per_order": 3,
+    "batch_size": 2,
+    "until": datetime.date(2025, 1, 1),
+}
+
+
+def snapshot():
+    return (
+        list(Product.objects.order_by("pk").values_list("pk", "slug", "price")),
+        list(Order.objects.order_by("pk").values_list("pk", "total", "checked_out_at")),
+    )
+
+
+def test_seed_data_creates_coherent_rows():
+    call_command("seed_data", **OPTIONS)
+    assert User.objects.count() == 4
+    assert Profile.objects.count() == 4
+    assert Address.objects.filter(is_default=True).count() == 4
+    assert Category.objects.filter(parent__isnull=False).count() == 4
+    assert Product.objects.count() == 6
+    assert not Product.objects.filter(category__children__isnull=False).exists()
+    assert Cart.objects.count() == 2
+    for cart in Cart.objects.all():
+        assert cart.items_count == CartItem.objects.filter(cart=cart).count()
+    assert Order.objects.count() == 4
+    assert OrderItem.objects.count() >= 4
+    assert OrderSummary.objects.count() == 4
+    for order in Order.objects.all():
+        assert order.address.user_id == order.user_id
+        assert order.checked_out_at.date() < datetime.date(2025, 1, 1)
+        assert order.summary.item_count == order.items.count()
+    assert CouponUsage.objects.count() == Order.objects.exclude(coupon=None).count()
+    # Items capture the list price, as add_to_cart and checkout do
+    assert not CartItem.objects.exclude(price=F("product__price")).exists()
+    assert not OrderItem.objects.exclude(price=F("product__price")).exists()
+
+
+def test_seed_data_is_deterministic_for_a_seed():
+    call_command("seed_data", **OPTIONS)
+    first = snapshot()
+    for model in (Order, Product, Category, User):
+        model.objects.all().delete()
+    call_command("seed_data", **OPTIONS)
+    assert snapshot() == first
+
+
+def test_seed_data_continues_numbering_on_rerun():
+    options = {"users": 2, "products": 2, "order_items": 2, "categories": 2}
+    call_command("seed_data", **options)
+    call_command("seed_data", **options)
+    assert User.objects.count() == 4
+    assert Product.objects.count() == 4
+
+
+@pytest.mark.parametrize("tags", [0, 1])
+def test_seed_data_with_fewer_tags_than_sampled(tags):
+    call_command("seed_data", **{**OPTIONS, "tags": tags})
+    assert Product.objects.count() == 6
+    assert Product.tags.through.objects.values("tag").distinct().count() <= tags
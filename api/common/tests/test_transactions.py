@@ -0,0 +1,77 @@
+import pytest
+from django.core.handlers.base import BaseHandler
+from django.db import connection
+from django.test import RequestFactory
+from django.urls import include, path
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.common.transactions import (
+    NonAtomicReadsMixin,
+    non_atomic_reads,
+    non_atomic_safe_requests,
+)
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+class RecordingView(NonAtomicReadsMixin, APIView):
+    def get(self, request):
+        return Response({"atomic": connection.in_atomic_block})
+
+    post = get
+
+
+@non_atomic_reads
+def recording_function_view(request):
+    return Response({"atomic": connection.in_atomic_block})
+
+
+def call(view, method):
+    # Apply ATOMIC_REQUESTS the way Django's request handler does
+    view = BaseHandler().make_view_atomic(view)
+    request = getattr(RequestFactory(), method)("/")
+    return view(request).data["atomic"]
+
+
+def test_plain_views_are_atomic():
+    class PlainView(APIView):
+        def get(self, request):
+            return Response({"atomic": connection.in_atomic_block})
+
+    assert call(PlainView.as_view(), "get") is True
+
+
+def test_reads_run_in_autocommit_and_writes_in_a_transaction():
+    view = RecordingView.as_view()
+    assert call(view, "get") is False
+    assert call(view, "post") is True
+
+
+def test_function_view_decorator():
+    assert recording_function_view._non_atomic_requests == {"default"}
+
+
+def test_non_atomic_safe_requests_wraps_every_view():
+    class PlainView(APIView):
+        def get(self, request):
+            return Response({"atomic": connection.in_atomic_block})
+
+        post = get
+
+    async def async_view(request):
+        return None
+
+    plain = PlainView.as_view()
+    urlpatterns = [
+        path("plain/", plain),
+        path("nested/", include([path("async/", async_view)])),
+        path("mixin/", recording_function_view),
+    ]
+    non_atomic_safe_requests(urlpatterns)
+    wrapped = urlpatterns[0].callback
+    assert wrapped is not plain and wrapped.csrf_exempt
+    assert call(wrapped, "get") is False
+    assert call(wrapped, "post") is True
+    assert urlpatterns[1].url_patterns[0].callback is async_view
+    assert urlpatterns[2].callback is recording_function_view
@@ -0,0 +1,18 @@
+import pytest
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+def test_db_connection_stats_admin_only(api_client, user):
+    url = reverse("common:db-connections")
+    api_client.force_authenticate(user=user)
+    assert api_client.get(url).status_code == 403
+    user.is_staff = True
+    user.save()
+    response = api_client.get(url)
+    assert response.status_code == 200
+    default = next(entry for entry in response.data if entry["alias"] == "default")
+    assert default["connected"] is True
+    assert default["health_checks"] is True
+    assert default["pool"] is None
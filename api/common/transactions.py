@@ -0,0 +1,69 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.urls import URLPattern, URLResolver
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _autocommit(request):
+    # Inside a transaction we do not own (e.g. a test case) DRF's rollback on
+    # errors would poison it, so fall back to a savepoint there.
+    return (
+        request.method in SAFE_METHODS
+        and not transaction.get_connection().in_atomic_block
+    )
+
+
+class NonAtomicReadsMixin:
+    """
+    Opt a view out of ATOMIC_REQUESTS for GET/HEAD/OPTIONS so reads run in
+    autocommit instead of holding a transaction open while serializing.
+    Other methods still run in a transaction, scoped to the view itself.
+    List it before the DRF base class.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
+
+    def dispatch(self, request, *args, **kwargs):
+        if _autocommit(request):
+            return super().dispatch(request, *args, **kwargs)
+        with transaction.atomic():
+            return super().dispatch(request, *args, **kwargs)
+
+
+def non_atomic_reads(view):
+    """Function-view counterpart of NonAtomicReadsMixin."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if _autocommit(request):
+            return view(request, *args, **kwargs)
+        with transaction.atomic():
+            return view(request, *args, **kwargs)
+
+    return transaction.non_atomic_requests(wrapper)
+
+
+def non_atomic_safe_requests(urlpatterns):
+    """
+    Site-wide policy (AUTOCOMMIT_SAFE_REQUESTS, applied in core/urls.py):
+    wrap every view in `urlpatterns`, recursively, with non_atomic_reads,
+    as if each view used NonAtomicReadsMixin. Views that already opt out
+    of ATOMIC_REQUESTS and async views (never atomic) are left alone.
+    """
+    for pattern in urlpatterns:
+        if isinstance(pattern, URLResolver):
+            non_atomic_safe_requests(pattern.url_patterns)
+            continue
+        if not isinstance(pattern, URLPattern):
+            continue
+        callback = pattern.callback
+        if iscoroutinefunction(callback) or DEFAULT_DB_ALIAS in getattr(
+            callback, "_non_atomic_requests", ()
+        ):
+            continue
+        pattern.callback = non_atomic_reads(callback)
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .views import DatabaseConnectionStatsView
+
+app_name = "common"
+
+urlpatterns = [
+    path(
+        "db-connections/",
+        DatabaseConnectionStatsView.as_view(),
+        name="db-connections",
+    ),
+]
@@ -1,11 +1,12 @@
 import re
+import warnings
 from decimal import Decimal
 
 import environ
 import pyotp
-from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
+from rest_framework import status
+from rest_framework.response import Response
 
 env = environ.Env()
 BASE_OTP_SECRET = env("BASE_OTP_SECRET", default="BASE32SECRET3232")
@@ -32,10 +33,36 @@ def verify_otp(otp, secret, interval=300):
     return totp.verify(otp)
 
 
-def send_email(subject, message, recipient_list, from_email=None, fail_silently=True):
-    if from_email is None:
-        from_email = settings.DEFAULT_FROM_EMAIL
-    send_mail(subject, message, from_email, recipient_list, fail_silently=fail_silently)
+def _warn_fail_silently(fail_silently):
+    if fail_silently is not None:
+        warnings.warn(
+            "fail_silently is deprecated and ignored: email is queued, and "
+            "send_queued_emails retries failed deliveries.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+
+def send_email(subject, message, recipient_list, from_email=None, fail_silently=None):
+    """
+    Queue an email for delivery by the send_queued_emails worker.
+    The outbox row is written in the current transaction.
+    `fail_silently` is deprecated and ignored.
+    """
+    _warn_fail_silently(fail_silently)
+    send_emails([(subject, message, recipient_list)], from_email=from_email)
+
+
+def send_emails(messages, from_email=None, fail_silently=None):
+    """
+    Queue many (subject, message, recipient_list) tuples with a single
+    insert; the worker delivers them in batches over one mail connection.
+    `fail_silently` is deprecated and ignored.
+    """
+    from api.common.email_queue import enqueue_emails
+
+    _warn_fail_silently(fail_silently)
+    return enqueue_emails(messages, from_email=from_email)
 
 
 def calculate_shipping(subtotal, address, shipping_method_name="Standard", weight=0):
@@ -111,3 +138,54 @@ def check_delivery_availability(country_code):
         return False, f"Country with code '{country_code}' not found."
     except ShippingZone.DoesNotExist:
         return False, f"No shipping zone configured for {country_code}."
+
+
+async def acheck_delivery_availability(country_code):
+    """
+    Async counterpart of check_delivery_availability, using the async ORM.
+    """
+    from api.orders.models import Country, ShippingMethod, ShippingZone
+
+    if not country_code:
+        return False, "Country code is required."
+
+    try:
+        country = await Country.objects.aget(code=country_code.upper())
+        zone = await ShippingZone.objects.aget(country=country)
+        has_method = await ShippingMethod.objects.filter(
+            zone=zone, active=True
+        ).aexists()
+        if has_method:
+            return True, f"Delivery is available to {country.name}."
+        else:
+            return False, f"No active shipping methods for {country.name}."
+    except Country.DoesNotExist:
+        return False, f"Country with code '{country_code}' not found."
+    except ShippingZone.DoesNotExist:
+        return False, f"No shipping zone configured for {country_code}."
+
+
+def wants_summary(request):
+    return request.query_params.get("summary", "").lower() in ("1", "true", "yes")
+
+
+def bulk_upload_response(request, created, errors, serializer_class):
+    """
+    Response for bulk uploads: the created objects in full, or only their
+    count and ids with ?summary=true, so large uploads aren't echoed back.
+    """
+    if wants_summary(request):
+        body = {
+            "created_count": len(created),
+            "created_ids": [obj.pk for obj in created],
+            "errors": errors,
+        }
+    else:
+        body = {
+            "created": serializer_class(created, many=True).data,
+            "errors": errors,
+        }
+    return Response(
+        body,
+        status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+    )
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views import View
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .metrics import generate_metrics
+
+
+class DatabaseConnectionStatsView(APIView):
+    """
+    Connection settings and pool usage for each database alias in the worker
+    process that serves the request (admin only). Pool figures come from
+    psycopg_pool and are only reported when DATABASE_POOL is enabled.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(responses={200: "Per-alias connection and pool stats."})
+    def get(self, request):
+        stats = []
+        for alias in connections:
+            connection = connections[alias]
+            pool = getattr(connection, "pool", None)
+            stats.append(
+                {
+                    "alias": alias,
+                    "vendor": connection.vendor,
+                    "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+                    "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+                    "connected": connection.connection is not None,
+                    "pool": pool.get_stats() if pool is not None else None,
+                }
+            )
+        return Response(stats)
+
+
+class MetricsView(View):
+    """
+    Prometheus metrics for all worker processes. When METRICS_TOKEN is set
+    the scraper must send it as `Authorization: Bearer <token>`.
+    """
+
+    def get(self, request):
+        token = settings.METRICS_TOKEN
+        if token and not constant_time_compare(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            return HttpResponseForbidden()
+        body, content_type = generate_metrics()
+        return HttpResponse(body, content_type=content_type)
@@ -1,4 +1,7 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pytest_factoryboy import register
 from rest_framework.test import APIClient
 
@@ -47,6 +50,13 @@ register(CartItemFactory)
 # BaseModelFactory is abstract, not registered as a fixture
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -84,3 +94,49 @@ def cart_item(cart, product):
     # Ensure the cart has at least one item
     cart.items.add(item)
     return item
+
+
+# Savepoints from ATOMIC_REQUESTS nested in the test transaction
+TRANSACTION_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@pytest.fixture
+def query_budget(api_client):
+    """
+    Assert that a GET endpoint stays within a query budget and that its query
+    count does not grow with the number of results.
+
+        query_budget(url, create_rows, budget=4)
+
+    `create_rows(n)` must add n more rows the endpoint returns. The endpoint
+    is called once per entry in `sizes` (total rows created), with the cache
+    cleared before each call so cached fragments cannot hide queries.
+    Savepoint statements are not counted.
+    """
+
+    def check(url, create_rows, budget, sizes=(1, 4), params=None):
+        counts, created = [], 0
+        for size in sizes:
+            create_rows(size - created)
+            created = size
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = api_client.get(url, params)
+            assert response.status_code == 200, response.content
+            statements = [
+                query["sql"]
+                for query in queries.captured_queries
+                if not query["sql"].startswith(TRANSACTION_STATEMENTS)
+            ]
+            counts.append(len(statements))
+        statements = "\n".join(statements)
+        assert len(set(counts)) == 1, (
+            f"{url}: query count grows with results {dict(zip(sizes, counts))}\n"
+            f"{statements}"
+        )
+        assert (
+            counts[-1] <= budget
+        ), f"{url}: {counts[-1]} queries, budget {budget}\n{statements}"
+        return counts[-1]
+
+    return check
@@ -7,6 +7,7 @@ from .models import (
     Order,
     OrderItem,
     OrderReview,
+    OrderSummary,
     ShippingMethod,
     ShippingZone,
     TaxRate,
@@ -32,6 +33,7 @@ class OrderAdmin(admin.ModelAdmin):
     )
     search_fields = ("user__email", "id", "coupon__code")
     list_filter = ("status", "checked_out_at", "coupon")
+    list_select_related = ("user", "coupon")
     inlines = [OrderItemInline]
     actions = [
         "mark_as_paid",
@@ -61,35 +63,66 @@ class OrderAdmin(admin.ModelAdmin):
         ),
     )
 
+    def _bulk_set_status(self, request, queryset, new_status):
+        updated, errors = Order.bulk_set_status(
+            [
+                {"order": pk, "status": new_status}
+                for pk in queryset.values_list("pk", flat=True)
+            ]
+        )
+        self.message_user(
+            request,
+            f"{len(updated)} orders marked as {new_status}; "
+            f"{len(errors)} skipped (invalid transition).",
+        )
+
     def mark_as_paid(self, request, queryset):
-        for order in queryset:
-            order.set_status(Order.Status.PAID)
-        self.message_user(request, "Selected orders marked as paid.")
+        self._bulk_set_status(request, queryset, Order.Status.PAID)
 
     mark_as_paid.short_description = "Mark selected orders as Paid"
 
     def mark_as_shipped(self, request, queryset):
-        for order in queryset:
-            order.set_status(Order.Status.SHIPPED)
-        self.message_user(request, "Selected orders marked as shipped.")
+        self._bulk_set_status(request, queryset, Order.Status.SHIPPED)
 
     mark_as_shipped.short_description = "Mark selected orders as Shipped"
 
     def mark_as_delivered(self, request, queryset):
-        for order in queryset:
-            order.set_status(Order.Status.DELIVERED)
-        self.message_user(request, "Selected orders marked as delivered.")
+        self._bulk_set_status(request, queryset, Order.Status.DELIVERED)
 
     mark_as_delivered.short_description = "Mark selected orders as Delivered"
 
     def mark_as_cancelled(self, request, queryset):
-        for order in queryset:
-            order.set_status(Order.Status.CANCELLED)
-        self.message_user(request, "Selected orders marked as cancelled.")
+        self._bulk_set_status(request, queryset, Order.Status.CANCELLED)
 
     mark_as_cancelled.short_description = "Mark selected orders as Cancelled"
 
 
+@admin.register(OrderSummary)
+class OrderSummaryAdmin(admin.ModelAdmin):
+    """Read-only order dashboard backed by the denormalized summary table."""
+
+    list_display = (
+        "order",
+        "user_email",
+        "status",
+        "total",
+        "item_count",
+        "checked_out_at",
+    )
+    search_fields = ("user_email",)
+    list_filter = ("status", "checked_out_at")
+    date_hierarchy = "checked_out_at"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(OrderItem)
 class OrderItemAdmin(admin.ModelAdmin):
     list_display = ("id", "order", "product_name", "quantity", "price", "created_at")
@@ -5,3 +5,6 @@ class OrdersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.orders"
     verbose_name = "Orders"
+
+    def ready(self):
+        import api.orders.signals  # noqa: F401
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_order_summaries(apps, schema_editor):
+    Order = apps.get_model("orders", "Order")
+    OrderSummary = apps.get_model("orders", "OrderSummary")
+    rows = (
+        Order.objects.annotate(item_count=Count("items"))
+        .values("pk", "user__email", "status", "total", "checked_out_at", "item_count")
+        .order_by("pk")
+    )
+    batch = []
+    for row in rows.iterator(chunk_size=2000):
+        batch.append(
+            OrderSummary(
+                order_id=row["pk"],
+                user_email=row["user__email"],
+                status=row["status"],
+                total=row["total"],
+                item_count=row["item_count"],
+                checked_out_at=row["checked_out_at"],
+            )
+        )
+        if len(batch) >= 2000:
+            OrderSummary.objects.bulk_create(batch)
+            batch = []
+    OrderSummary.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0002_country_shippingzone_shippingmethod_taxzone_taxrate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderSummary",
+            fields=[
+                (
+                    "order",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to="orders.order",
+                    ),
+                ),
+                ("user_email", models.EmailField(db_index=True, max_length=254)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("paid", "Paid"),
+                            ("shipped", "Shipped"),
+                            ("delivered", "Delivered"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("total", models.DecimalField(decimal_places=2, max_digits=12)),
+                ("item_count", models.PositiveIntegerField(default=0)),
+                ("checked_out_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name_plural": "Order summaries",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "checked_out_at"],
+                        name="ordersummary_status_date_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_order_summaries, migrations.RunPython.noop),
+    ]
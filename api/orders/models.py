@@ -1,8 +1,13 @@
+from collections import defaultdict
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count
+from django.utils import timezone
 
-from api.common.models import BaseModel
-from api.common.utils import send_email
+from api.common.events import ORDER_STATUS_CHANGED, publish_many
+from api.common.models import BaseModel, LoadedValuesMixin
+from api.common.utils import send_email, send_emails
 from api.products.models import Product
 from api.users.models import Address
 
@@ -69,7 +74,7 @@ class CouponUsage(BaseModel):
         return f"{self.user.email} used {self.coupon.code} on order {self.order.id}"
 
 
-class Order(BaseModel):
+class Order(LoadedValuesMixin, BaseModel):
     class Status(models.TextChoices):
         PENDING = "pending", "Pending"
         PAID = "paid", "Paid"
@@ -117,12 +122,96 @@ class Order(BaseModel):
             return True
         return False
 
-    def send_status_email(self):
+    @classmethod
+    def bulk_set_status(cls, transitions, notify=True):
+        """
+        Apply many status transitions at once. `transitions` is a list of
+        dicts with "order" (id), "status" and optional "tracking_number".
+        Transitions are validated in memory, applied with one UPDATE per
+        (from, to) status pair, and notifications are queued in one insert
+        as part of the same transaction.
+        Returns (updated order ids, list of {"order", "detail"} errors).
+        """
+        with transaction.atomic():
+            orders = cls.objects.select_for_update().in_bulk(
+                [transition["order"] for transition in transitions]
+            )
+            groups = defaultdict(list)
+            tracking = []
+            errors = []
+            seen = set()
+            for transition in transitions:
+                order = orders.get(transition["order"])
+                if order is None:
+                    errors.append(
+                        {"order": transition["order"], "detail": "Order not found."}
+                    )
+                    continue
+                if order.pk in seen:
+                    errors.append(
+                        {"order": order.pk, "detail": "Order appears more than once."}
+                    )
+                    continue
+                seen.add(order.pk)
+                if not order.can_transition(transition["status"]):
+                    errors.append(
+                        {
+                            "order": order.pk,
+                            "detail": "Invalid status transition.",
+                        }
+                    )
+                    continue
+                groups[(order.status, transition["status"])].append(order)
+                if transition.get("tracking_number") is not None:
+                    order.tracking_number = transition["tracking_number"]
+                    tracking.append(order)
+            now = timezone.now()
+            updated = []
+            for (from_status, to_status), group in groups.items():
+                ids = [order.pk for order in group]
+                cls.objects.filter(pk__in=ids, status=from_status).update(
+                    status=to_status, updated_at=now
+                )
+                for order in group:
+                    order.status = to_status
+                updated.extend(group)
+            if tracking:
+                cls.objects.bulk_update(tracking, ["tracking_number"])
+            OrderSummary.refresh_for([order.pk for order in updated])
+            # Queryset updates skip post_save, so publish the events here
+            publish_many(
+                [
+                    (
+                        ORDER_STATUS_CHANGED,
+                        order.pk,
+                        {"id": order.pk, "from": from_status, "to": to_status},
+                    )
+                    for (from_status, to_status), group in groups.items()
+                    for order in group
+                ]
+            )
+            if notify and updated:
+                cls.send_status_emails(
+                    cls.objects.select_related("user").filter(
+                        pk__in=[order.pk for order in updated]
+                    )
+                )
+        return [order.pk for order in updated], errors
+
+    def status_email(self):
         subject = f"Order {self.id} status update: {self.get_status_display()}"
         message = f"Your order status is now: {self.get_status_display()}"
         if self.tracking_number:
             message += f"\nTracking Number: {self.tracking_number}"
-        send_email(subject, message, [self.user.email])
+        return subject, message, [self.user.email]
+
+    def send_status_email(self):
+        send_email(*self.status_email())
+
+    @staticmethod
+    def send_status_emails(orders):
+        """Queue status emails for many orders with a single insert."""
+        send_emails([order.status_email() for order in orders])
 
 
 class OrderItem(BaseModel):
@@ -136,6 +225,70 @@ class OrderItem(BaseModel):
         return f"{self.quantity} x {self.product_name} in order {self.order.id}"
 
 
+class OrderSummary(models.Model):
+    """
+    Denormalized one-row-per-order projection for admin lists and dashboards,
+    so they avoid joins to users and items. Kept in sync by signals on Order,
+    OrderItem and User writes; bulk queryset writes must call refresh_for().
+    """
+
+    order = models.OneToOneField(
+        Order, on_delete=models.CASCADE, primary_key=True, related_name="summary"
+    )
+    user_email = models.EmailField(db_index=True)
+    status = models.CharField(max_length=20, choices=Order.Status.choices)
+    total = models.DecimalField(max_digits=12, decimal_places=2)
+    item_count = models.PositiveIntegerField(default=0)
+    checked_out_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name_plural = "Order summaries"
+        indexes = [
+            models.Index(
+                fields=["status", "checked_out_at"],
+                name="ordersummary_status_date_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Summary of order {self.order_id}"
+
+    @classmethod
+    def refresh_for(cls, order_ids):
+        """Rebuild the summaries of the given orders with two queries."""
+        rows = (
+            Order.objects.filter(pk__in=order_ids)
+            .annotate(item_count=Count("items"))
+            .values(
+                "pk", "user__email", "status", "total", "checked_out_at", "item_count"
+            )
+        )
+        summaries = [
+            cls(
+                order_id=row["pk"],
+                user_email=row["user__email"],
+                status=row["status"],
+                total=row["total"],
+                item_count=row["item_count"],
+                checked_out_at=row["checked_out_at"],
+            )
+            for row in rows
+        ]
+        if summaries:
+            cls.objects.bulk_create(
+                summaries,
+                update_conflicts=True,
+                unique_fields=["order"],
+                update_fields=[
+                    "user_email",
+                    "status",
+                    "total",
+                    "item_count",
+                    "checked_out_at",
+                ],
+            )
+
+
 class OrderReview(BaseModel):
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="reviews")
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -1,9 +1,9 @@
 from rest_framework import serializers
 
-from api.products.serializers import ProductReadSerializer
+from api.products.serializers import ProductReadSerializer, ProductStubSerializer
 from api.users.serializers import AddressSerializer
 
-from .models import Coupon, CouponUsage, Order, OrderItem, OrderReview
+from .models import Coupon, CouponUsage, Order, OrderItem, OrderReview, OrderSummary
 
 
 class CouponSerializer(serializers.ModelSerializer):
@@ -54,6 +54,36 @@ class OrderItemSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class OrderHistoryItemSerializer(serializers.ModelSerializer):
+    """
+    Order line rendered from the checkout snapshot (name, price, quantity).
+    `product` is the product id, or a compact product stub when the view
+    sets `expand_product` in the serializer context.
+    """
+
+    product = serializers.SerializerMethodField()
+
+    def get_product(self, obj):
+        if not self.context.get("expand_product"):
+            return obj.product_id
+        if obj.product is None:
+            return None
+        return ProductStubSerializer(obj.product, context=self.context).data
+
+    class Meta:
+        model = OrderItem
+        fields = [
+            "id",
+            "product",
+            "product_name",
+            "quantity",
+            "price",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
 class OrderReviewSerializer(serializers.ModelSerializer):
     user_email = serializers.EmailField(source="user.email", read_only=True)
     user = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -131,6 +161,57 @@ class OrderSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class OrderHistorySerializer(OrderSerializer):
+    """Order list representation without nested full product graphs."""
+
+    items = OrderHistoryItemSerializer(many=True, read_only=True)
+
+    class Meta(OrderSerializer.Meta):
+        pass
+
+
+class OrderStatusTransitionSerializer(serializers.Serializer):
+    order = serializers.UUIDField()
+    status = serializers.ChoiceField(choices=Order.Status.choices)
+    tracking_number = serializers.CharField(
+        max_length=100, required=False, allow_blank=True
+    )
+
+
+class OrderBulkStatusUpdateSerializer(serializers.Serializer):
+    transitions = OrderStatusTransitionSerializer(
+        many=True, allow_empty=False, max_length=1000
+    )
+    notify = serializers.BooleanField(default=True)
+
+
+class OrderSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OrderSummary
+        fields = [
+            "order",
+            "user_email",
+            "status",
+            "total",
+            "item_count",
+            "checked_out_at",
+        ]
+        read_only_fields = fields
+
+
+class RevenueByDayQuerySerializer(serializers.Serializer):
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    status = serializers.ChoiceField(choices=Order.Status.choices, required=False)
+
+
+class RevenueByDaySerializer(serializers.Serializer):
+    date = serializers.DateField()
+    orders = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    items = serializers.IntegerField()
+
+
 # Checkout schemas for API documentation
 class CheckoutRequestSerializer(serializers.Serializer):
     """Request payload for checkout.
@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.common.events import (
+    ORDER_CREATED,
+    ORDER_STATUS_CHANGED,
+    changed_fields,
+    publish,
+)
+
+from .models import Order, OrderItem, OrderSummary
+
+
+@receiver(post_save, sender=Order)
+def refresh_order_summary(sender, instance, **kwargs):
+    OrderSummary.refresh_for([instance.pk])
+
+
+@receiver(post_save, sender=Order)
+def publish_order_events(sender, instance, created, **kwargs):
+    if created:
+        publish(
+            ORDER_CREATED,
+            instance.pk,
+            {
+                "id": instance.pk,
+                "user": instance.user_id,
+                "status": instance.status,
+                "total": instance.total,
+            },
+        )
+        return
+    changes = changed_fields(instance, ["status"])
+    if "status" in changes:
+        from_status, to_status = changes["status"]
+        publish(
+            ORDER_STATUS_CHANGED,
+            instance.pk,
+            {"id": instance.pk, "from": from_status, "to": to_status},
+        )
+
+
+@receiver(post_save, sender=OrderItem)
+def refresh_order_summary_for_item(sender, instance, **kwargs):
+    OrderSummary.refresh_for([instance.order_id])
+
+
+@receiver(post_delete, sender=OrderItem)
+def refresh_order_summary_for_deleted_item(sender, instance, origin=None, **kwargs):
+    # Items deleted in a cascade from their order (or its user) must not
+    # re-create the summary the same cascade deletes
+    if isinstance(origin, OrderItem) or getattr(origin, "model", None) is OrderItem:
+        OrderSummary.refresh_for([instance.order_id])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_order_summary_email(sender, instance, created, **kwargs):
+    if not created:
+        OrderSummary.objects.filter(order__user=instance).exclude(
+            user_email=instance.email
+        ).update(user_email=instance.email)
@@ -0,0 +1,21 @@
+import pytest
+from django.urls import reverse
+
+from api.orders.tests.factories import OrderFactory, OrderItemFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_order_list_budget(api_client, query_budget, user):
+    def create_orders(n):
+        for order in OrderFactory.create_batch(n, user=user):
+            OrderItemFactory.create_batch(2, order=order)
+
+    api_client.force_authenticate(user=user)
+    query_budget(reverse("orders:order-list"), create_orders, budget=4)
+    query_budget(
+        reverse("orders:order-list"),
+        create_orders,
+        budget=5,
+        params={"expand": "product"},
+    )
@@ -1,19 +1,29 @@
 import datetime
+from decimal import Decimal
 
 import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
-from api.orders.models import Country, CouponUsage, Order
+from api.cart.tests.factories import CartItemFactory
+from api.common.email_queue import process_queue
+from api.common.models import OutboundEmail
+from api.orders.models import Country, CouponUsage, Order, OrderItem, OrderSummary
 from api.orders.tests.factories import (
     CountryFactory,
     CouponFactory,
     OrderFactory,
+    OrderItemFactory,
+    OrderReviewFactory,
     ShippingMethodFactory,
     ShippingZoneFactory,
     TaxRateFactory,
     TaxZoneFactory,
 )
+from api.products.tests.factories import ProductFactory
 
 pytestmark = pytest.mark.django_db
 
@@ -57,6 +67,33 @@ def test_checkout_creates_order(
     assert Order.objects.filter(user=user).exists()
 
 
+def test_checkout_total_matches_cart_summary(api_client, user, address, cart):
+    address.country = "AT"
+    address.save()
+    country = CountryFactory(code="AT", name="Austria")
+    ShippingMethodFactory(
+        zone=ShippingZoneFactory(country=country),
+        name="Standard",
+        base_rate=10,
+        per_kg_rate=0,
+        free_over=200,
+        active=True,
+    )
+    TaxRateFactory(zone=TaxZoneFactory(country=country), rate=0.20, active=True)
+    CartItemFactory(cart=cart, product=ProductFactory(price="30.00"), quantity=1)
+    sale = ProductFactory(price="50.00", discount_price="40.00")
+    CartItemFactory(cart=cart, product=sale, quantity=2)
+    api_client.force_authenticate(user=user)
+    summary = api_client.get(reverse("cart:cart-summary")).data
+    response = api_client.post(reverse("orders:checkout"), {})
+    assert response.status_code == 201
+    order = Order.objects.get(user=user)
+    assert order.total == Decimal(summary["total"])
+    assert order.tax == Decimal(summary["tax"])
+    assert order.shipping == Decimal(summary["shipping"])
+    assert order.items.get(product=sale).price == Decimal("40.00")
+
+
 def test_checkout_with_coupon(api_client, user, address, cart, cart_item, coupon):
     coupon.min_order_amount = 0
     coupon.save()
@@ -419,3 +456,137 @@ def test_checkout_different_country_with_shipping_and_tax(
     order = Order.objects.get(user=user)
     assert order.shipping == 15
     assert order.tax > 0
+
+
+def _order_history_queries(api_client, user, orders, expand=False):
+    for _ in range(orders):
+        order = OrderFactory(user=user)
+        OrderItemFactory.create_batch(2, order=order)
+        OrderReviewFactory(order=order)
+    url = reverse("orders:order-list")
+    params = {"expand": "product"} if expand else {}
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url, params)
+    assert response.status_code == 200
+    return response, len(ctx.captured_queries)
+
+
+@pytest.mark.parametrize("expand", [False, True])
+def test_order_list_query_count_is_fixed(api_client, user, expand):
+    api_client.force_authenticate(user=user)
+    _, one = _order_history_queries(api_client, user, 1, expand)
+    response, many = _order_history_queries(api_client, user, 4, expand)
+    assert one == many
+    item = response.data["results"][0]["items"][0]
+    if expand:
+        assert set(item["product"]) == {"id", "name", "slug", "image", "image_url"}
+    else:
+        assert OrderItem.objects.filter(product_id=item["product"]).exists()
+
+
+def test_order_summary_maintained_on_writes(api_client, user, address, cart, cart_item):
+    api_client.force_authenticate(user=user)
+    response = api_client.post(reverse("orders:checkout"), {})
+    order = Order.objects.get(pk=response.data["id"])
+    summary = OrderSummary.objects.get(order=order)
+    assert summary.item_count == 1
+    assert summary.total == order.total
+    assert summary.user_email == user.email
+    order.set_status(Order.Status.PAID, notify=False)
+    user.email = "renamed@example.com"
+    user.save()
+    summary.refresh_from_db()
+    assert summary.status == Order.Status.PAID
+    assert summary.user_email == "renamed@example.com"
+
+
+def test_order_summary_follows_item_and_order_deletes():
+    order = OrderFactory()
+    first, second = OrderItemFactory.create_batch(2, order=order)
+    first.delete()
+    assert OrderSummary.objects.get(order=order).item_count == 1
+    order.delete()
+    assert not OrderSummary.objects.filter(order_id=order.pk).exists()
+
+
+def test_order_summary_list_admin_only(api_client, user):
+    OrderFactory.create_batch(2)
+    url = reverse("orders:order-summary-list")
+    api_client.force_authenticate(user=user)
+    assert api_client.get(url).status_code == 403
+    user.is_staff = True
+    user.save()
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.data["count"] == 2
+
+
+def test_revenue_by_day(api_client, user):
+    user.is_staff = True
+    user.save()
+    OrderFactory(total="10.00")
+    OrderFactory(total="15.50")
+    OrderFactory(total="99.00", status=Order.Status.CANCELLED)
+    api_client.force_authenticate(user=user)
+    response = api_client.get(reverse("orders:order-revenue-by-day"))
+    assert response.status_code == 200
+    assert len(response.data) == 1
+    assert response.data[0]["orders"] == 2
+    assert response.data[0]["revenue"] == "25.50"
+
+
+def test_order_bulk_status_update(api_client, user, mailoutbox):
+    user.is_staff = True
+    user.save()
+    pending = OrderFactory.create_batch(2)
+    delivered = OrderFactory(status=Order.Status.DELIVERED)
+    api_client.force_authenticate(user=user)
+    url = reverse("orders:order-bulk-status-update")
+    data = {
+        "transitions": [
+            {"order": str(pending[0].id), "status": "paid", "tracking_number": "T1"},
+            {"order": str(pending[1].id), "status": "cancelled"},
+            {"order": str(delivered.id), "status": "paid"},
+        ]
+    }
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.post(url, data, format="json")
+    assert response.status_code == 200
+    assert set(response.data["updated"]) == {pending[0].id, pending[1].id}
+    assert response.data["errors"] == [
+        {"order": delivered.id, "detail": "Invalid status transition."}
+    ]
+    pending[0].refresh_from_db()
+    assert (pending[0].status, pending[0].tracking_number) == ("paid", "T1")
+    assert OrderSummary.objects.get(order=pending[1]).status == "cancelled"
+    # One UPDATE per (from, to) pair, not per order
+    updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+    assert len(updates) == 3  # pending->paid, pending->cancelled, tracking numbers
+    # Notifications are queued in one insert, not sent during the request
+    assert OutboundEmail.objects.filter(status="pending").count() == 2
+    assert mailoutbox == []
+    assert process_queue() == (2, 2)
+    assert len(mailoutbox) == 2
+
+
+def test_delivery_availability(api_client):
+    method = ShippingMethodFactory(zone__country=CountryFactory(code="GH"))
+    url = reverse("orders:delivery-availability")
+    response = api_client.get(url, {"country": "gh"})
+    assert response.status_code == 200
+    assert response.data["available"] is True
+    method.active = False
+    method.save()
+    assert api_client.get(url, {"country": "GH"}).data["available"] is False
+    assert api_client.get(url, {"country": "ZZ"}).data == {
+        "available": False,
+        "detail": "Country with code 'ZZ' not found.",
+    }
+
+
+def test_delivery_availability_under_asgi(async_client):
+    ShippingMethodFactory(zone__country=CountryFactory(code="GH"))
+    url = reverse("orders:delivery-availability")
+    response = async_to_sync(async_client.get)(url, {"country": "GH"})
+    assert response.status_code == 200
+    assert response.json()["available"] is True
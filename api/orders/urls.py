@@ -2,10 +2,14 @@ from django.urls import path
 
 from .views import (
     CheckoutView,
+    DeliveryAvailabilityView,
+    OrderBulkStatusUpdateView,
     OrderDetailView,
     OrderListView,
     OrderReviewCreateView,
     OrderStatusUpdateView,
+    OrderSummaryListView,
+    RevenueByDayView,
 )
 
 app_name = "orders"
@@ -17,5 +21,17 @@ urlpatterns = [
     path(
         "<uuid:pk>/status/", OrderStatusUpdateView.as_view(), name="order-status-update"
     ),
+    path(
+        "status/bulk/",
+        OrderBulkStatusUpdateView.as_view(),
+        name="order-bulk-status-update",
+    ),
+    path("summaries/", OrderSummaryListView.as_view(), name="order-summary-list"),
+    path("revenue/", RevenueByDayView.as_view(), name="order-revenue-by-day"),
     path("reviews/", OrderReviewCreateView.as_view(), name="order-review-create"),
+    path(
+        "delivery-availability/",
+        DeliveryAvailabilityView.as_view(),
+        name="delivery-availability",
+    ),
 ]
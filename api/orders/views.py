@@ -1,6 +1,10 @@
 from decimal import Decimal
 
 from django.db import transaction
+from django.db.models import Count, Prefetch, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -9,20 +13,33 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.cart.models import Cart, CartItem
+from api.common.async_views import AsyncAPIView
+from api.common.metrics import CHECKOUTS, STOCK_CONFLICTS
 from api.common.permissions import IsAdminOrManager
-from api.common.utils import calculate_shipping, calculate_tax
+from api.common.transactions import NonAtomicReadsMixin
+from api.common.utils import acheck_delivery_availability
+from api.products.models import Product
 
-from .models import Order, OrderItem
+from .models import Order, OrderItem, OrderReview, OrderSummary
 from .serializers import (
     CheckoutRequestSerializer,
     CheckoutResponseSerializer,
+    OrderBulkStatusUpdateSerializer,
+    OrderHistorySerializer,
     OrderReviewSerializer,
     OrderSerializer,
+    OrderSummarySerializer,
+    RevenueByDayQuerySerializer,
+    RevenueByDaySerializer,
 )
 
 # Create your views here.
 
 
+# The order is written inside the explicit atomic block in post(); address
+# and cart lookups before it and response serialization after it run in
+# autocommit rather than inside a request-wide transaction.
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
 class CheckoutView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -47,6 +64,7 @@ class CheckoutView(APIView):
                 user.addresses.filter(is_default=True).first() or user.addresses.first()
             )
             if not address:
+                CHECKOUTS.labels(outcome="no_address").inc()
                 return Response(
                     {"detail": "No address found"},
                     status=status.HTTP_400_BAD_REQUEST,
@@ -54,11 +72,13 @@ class CheckoutView(APIView):
             try:
                 cart = Cart.objects.get(user=user, is_active=True)
             except Cart.DoesNotExist:
+                CHECKOUTS.labels(outcome="empty_cart").inc()
                 return Response(
                     {"detail": "Cart is empty"}, status=status.HTTP_400_BAD_REQUEST
                 )
             cart_items = CartItem.objects.filter(cart=cart)
             if not cart_items.exists():
+                CHECKOUTS.labels(outcome="empty_cart").inc()
                 return Response(
                     {"detail": "Cart is empty"}, status=status.HTTP_400_BAD_REQUEST
                 )
@@ -66,15 +86,17 @@ class CheckoutView(APIView):
             coupon = None
             discount = Decimal("0")
             with transaction.atomic():
-                subtotal = Decimal("0")
-                for item in cart_items:
-                    subtotal += item.product.price * item.quantity
-                shipping = calculate_shipping(subtotal, address)
+                # Price from the same query as the cart summary, so the order
+                # total matches what the customer was shown
+                now = timezone.now()
+                summary = cart.calculate_summary(address, now=now)
+                subtotal = summary["subtotal"] - summary["discount"]
+                shipping = summary["shipping"]
                 shipping_warning = None
                 if shipping is None:
                     shipping = Decimal("0")
                     shipping_warning = "Delivery is not supported to this country. You may need to arrange pickup."
-                tax = calculate_tax(subtotal, address)
+                tax = summary["tax"]
                 # Coupon logic
                 if coupon_code:
                     from .models import Coupon
@@ -83,11 +105,13 @@ class CheckoutView(APIView):
                         coupon = Coupon.objects.get(code=coupon_code)
                         valid, reason = coupon.is_valid_for_user(user, subtotal)
                         if not valid:
+                            CHECKOUTS.labels(outcome="invalid_coupon").inc()
                             return Response(
                                 {"detail": reason}, status=status.HTTP_400_BAD_REQUEST
                             )
                         discount = coupon.calculate_discount(subtotal)
                     except Coupon.DoesNotExist:
+                        CHECKOUTS.labels(outcome="invalid_coupon").inc()
                         return Response(
                             {"detail": "Invalid coupon code."},
                             status=status.HTTP_400_BAD_REQUEST,
@@ -103,22 +127,30 @@ class CheckoutView(APIView):
                     shipping=shipping,
                     coupon=coupon,
                 )
-                for item in cart_items:
-                    price = item.product.price
-                    OrderItem.objects.create(
-                        order=order,
-                        product=item.product,
-                        product_name=item.product.name,
-                        quantity=item.quantity,
-                        price=price,
+                order_items = []
+                for item in cart.priced_items(now).select_related("product"):
+                    price = item.unit_price
+                    order_items.append(
+                        OrderItem(
+                            order=order,
+                            product=item.product,
+                            product_name=item.product.name,
+                            quantity=item.quantity,
+                            price=price,
+                        )
                     )
+                    if item.quantity > item.product.stock:
+                        STOCK_CONFLICTS.inc()
                     item.product.stock = max(item.product.stock - item.quantity, 0)
                     item.product.save()
+                # bulk_create skips OrderItem signals; refresh the summary once
+                OrderItem.objects.bulk_create(order_items)
+                OrderSummary.refresh_for([order.pk])
                 if coupon:
                     from .models import CouponUsage
 
                     CouponUsage.objects.create(coupon=coupon, user=user, order=order)
-                cart.items.all().delete()
+                cart.clear_items()
                 # Keep cart active since user-cart is one-to-one relationship
                 # Just mark as checked out for tracking purposes
                 cart.checked_out = True
@@ -127,16 +159,25 @@ class CheckoutView(APIView):
             data = serializer.data
             if shipping_warning:
                 data["shipping_warning"] = shipping_warning
+            CHECKOUTS.labels(outcome="success").inc()
             return Response(data, status=status.HTTP_201_CREATED)
         except Exception as exc:
+            CHECKOUTS.labels(outcome="error").inc()
             return Response(
                 {"detail": str(exc), "type": type(exc).__name__},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
 
-class OrderListView(generics.ListAPIView):
-    serializer_class = OrderSerializer
+class OrderListView(NonAtomicReadsMixin, generics.ListAPIView):
+    """
+    List orders (own orders, or all orders for admin/manager).
+    Items are rendered from their checkout snapshot; pass `?expand=product`
+    to embed a compact product stub per item. The number of queries does not
+    depend on the number of orders or items on the page.
+    """
+
+    serializer_class = OrderHistorySerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [
         DjangoFilterBackend,
@@ -151,8 +192,18 @@ class OrderListView(generics.ListAPIView):
         if getattr(self, "swagger_fake_view", False):
             return Order.objects.none()
         qs = Order.objects.select_related("user", "address", "coupon").prefetch_related(
-            "items"
+            Prefetch("items", queryset=OrderItem.objects.order_by("created_at")),
+            Prefetch("reviews", queryset=OrderReview.objects.select_related("user")),
         )
+        if self.expand_product:
+            qs = qs.prefetch_related(
+                Prefetch(
+                    "items__product",
+                    queryset=Product.objects.only(
+                        "id", "name", "slug", "image", "image_url"
+                    ),
+                )
+            )
         if self.request.user.is_staff or getattr(self.request.user, "role", None) in [
             "admin",
             "manager",
@@ -163,8 +214,66 @@ class OrderListView(generics.ListAPIView):
             qs = qs.filter(user=self.request.user).order_by("-checked_out_at")
         return qs
 
+    @property
+    def expand_product(self):
+        return "product" in self.request.query_params.get("expand", "").split(",")
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["expand_product"] = self.expand_product
+        return context
+
+
+class OrderSummaryListView(NonAtomicReadsMixin, generics.ListAPIView):
+    """
+    List order summaries for admin/manager dashboards.
+    Backed by the denormalized OrderSummary table, so filtering by status,
+    searching by email and ordering by date or total need no joins.
+    """
+
+    serializer_class = OrderSummarySerializer
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrManager]
+    filterset_fields = ["status"]
+    search_fields = ["user_email"]
+    ordering_fields = ["checked_out_at", "total", "item_count"]
 
-class OrderDetailView(generics.RetrieveAPIView):
+    def get_queryset(self):
+        return OrderSummary.objects.order_by("-checked_out_at")
+
+
+class RevenueByDayView(NonAtomicReadsMixin, APIView):
+    """
+    Daily order count, revenue and item count from order summaries.
+    Cancelled orders are excluded. Optional `start`/`end` dates (inclusive)
+    and `status` restrict the range.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrManager]
+
+    @swagger_auto_schema(
+        query_serializer=RevenueByDayQuerySerializer,
+        responses={200: RevenueByDaySerializer(many=True)},
+    )
+    def get(self, request):
+        params = RevenueByDayQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        qs = OrderSummary.objects.exclude(status=Order.Status.CANCELLED)
+        if params.validated_data.get("status"):
+            qs = qs.filter(status=params.validated_data["status"])
+        if params.validated_data.get("start"):
+            qs = qs.filter(checked_out_at__date__gte=params.validated_data["start"])
+        if params.validated_data.get("end"):
+            qs = qs.filter(checked_out_at__date__lte=params.validated_data["end"])
+        rows = (
+            qs.annotate(date=TruncDate("checked_out_at"))
+            .values("date")
+            .annotate(orders=Count("pk"), revenue=Sum("total"), items=Sum("item_count"))
+            .order_by("date")
+        )
+        return Response(RevenueByDaySerializer(rows, many=True).data)
+
+
+class OrderDetailView(NonAtomicReadsMixin, generics.RetrieveAPIView):
     serializer_class = OrderSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -208,6 +317,31 @@ class OrderStatusUpdateView(APIView):
             )
 
 
+class OrderBulkStatusUpdateView(APIView):
+    """
+    Apply status transitions (and tracking numbers) to many orders at once,
+    e.g. marking a courier pickup as shipped. Invalid transitions are
+    reported per order; valid ones are applied and the customer emails are
+    queued in the same transaction, for the send_queued_emails worker to
+    deliver once it commits.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsAdminOrManager]
+
+    @swagger_auto_schema(request_body=OrderBulkStatusUpdateSerializer)
+    def post(self, request):
+        serializer = OrderBulkStatusUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        updated, errors = Order.bulk_set_status(
+            serializer.validated_data["transitions"],
+            notify=serializer.validated_data["notify"],
+        )
+        return Response(
+            {"updated": updated, "errors": errors},
+            status=status.HTTP_200_OK if updated else status.HTTP_400_BAD_REQUEST,
+        )
+
+
 class OrderReviewCreateView(generics.CreateAPIView):
     serializer_class = OrderReviewSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -220,3 +354,30 @@ class OrderReviewCreateView(generics.CreateAPIView):
         if order.user != user or order.status != Order.Status.DELIVERED:
             raise PermissionDenied("You can only review your own delivered orders.")
         serializer.save(user=user, order=order)
+
+
+class DeliveryAvailabilityView(AsyncAPIView):
+    """
+    Check whether delivery is available to a country (`?country=<ISO code>`).
+    Async view backed by the async ORM.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "country",
+                openapi.IN_QUERY,
+                description="ISO 3166-1 alpha-2 country code.",
+                type=openapi.TYPE_STRING,
+                required=True,
+            )
+        ],
+        responses={200: "{available, detail}"},
+    )
+    async def get(self, request):
+        available, detail = await acheck_delivery_availability(
+            request.query_params.get("country")
+        )
+        return Response({"available": available, "detail": detail})
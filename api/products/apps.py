@@ -5,3 +5,6 @@ class ProductsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.products"
     verbose_name = "Products"
+
+    def ready(self):
+        import api.products.signals  # noqa: F401
@@ -0,0 +1,115 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from api.common.metrics import record_cache_lookups
+from api.common.renderers import PreEncoded, dumps
+
+# Bump whenever the shape of ProductReadSerializer output (or the way
+# fragments are stored) changes so that fragments rendered by older code are
+# never served.
+PRODUCT_FRAGMENT_VERSION = 2
+
+
+def _generation_key(product_pk):
+    return f"product-fragment-gen:{product_pk}"
+
+
+def _get_generations(products, timeout):
+    """
+    Current fragment generation of each product, fetched with a single
+    get_many. Products without one (never invalidated, or evicted) get a
+    fresh generation, so an evicted generation can never re-address a
+    fragment rendered under an older one.
+    """
+    keys = {product.pk: _generation_key(product.pk) for product in products}
+    cached = cache.get_many(keys.values())
+    missing = {key: uuid.uuid4().hex for key in keys.values() if key not in cached}
+    if missing:
+        cache.set_many(missing, timeout)
+    generations = {**cached, **missing}
+    return {pk: generations[key] for pk, key in keys.items()}
+
+
+def product_fragment_key(product, generation, request=None):
+    """
+    Cache key for a product's serialized representation.
+    Keyed by (id, updated_at, generation, serializer version): updated_at
+    covers writes to the product row itself, the generation covers rows
+    embedded in its representation (see invalidate_product_fragments). The
+    request origin is part of the key because image fields render as
+    absolute URLs.
+    """
+    origin = ""
+    if request is not None:
+        origin = f"{request.scheme}://{request.get_host()}"
+    return (
+        f"product-fragment:v{PRODUCT_FRAGMENT_VERSION}:{product.pk}:"
+        f"{product.updated_at.timestamp()}:{generation}:{origin}"
+    )
+
+
+def get_product_fragments(products, render, request=None, prepare=None):
+    """
+    Return serialized representations for `products` in order.
+    Cached fragments are fetched with a single get_many; misses are rendered
+    with `render(product)` and written back with a single set_many. When
+    given, `prepare(products)` is called once with the products about to be
+    rendered, e.g. to prefetch their relations.
+
+    Fragments are cached as encoded JSON and returned as PreEncoded values,
+    which FastJSONRenderer splices into the response as they are.
+    """
+    timeout = settings.PRODUCT_FRAGMENT_CACHE_TIMEOUT
+    if not timeout:
+        if prepare is not None:
+            prepare(products)
+        return [render(product) for product in products]
+    generations = _get_generations(products, timeout)
+    keys = [
+        product_fragment_key(product, generations[product.pk], request)
+        for product in products
+    ]
+    cached = cache.get_many(keys)
+    missing = {
+        key: product for key, product in zip(keys, products) if key not in cached
+    }
+    record_cache_lookups("product_fragment", len(keys) - len(missing), len(missing))
+    if missing:
+        if prepare is not None:
+            prepare(list(missing.values()))
+        rendered = {key: render(product) for key, product in missing.items()}
+        encoded = {key: dumps(data) for key, data in rendered.items()}
+        cache.set_many(encoded, timeout)
+        return [
+            (
+                PreEncoded(encoded[key], rendered[key])
+                if key in rendered
+                else PreEncoded(cached[key])
+            )
+            for key in keys
+        ]
+    return [PreEncoded(cached[key]) for key in keys]
+
+
+def invalidate_product_fragments(product_ids):
+    """
+    Give the given products a new fragment generation so their cached
+    fragments are no longer addressed. Touches only the cache, not the
+    product rows; the bump is repeated on commit so that a fragment rendered
+    from the pre-commit rows in the meantime is not served either.
+    """
+    product_ids = {pk for pk in product_ids if pk is not None}
+    if not product_ids or not settings.PRODUCT_FRAGMENT_CACHE_TIMEOUT:
+        return
+
+    def bump():
+        cache.set_many(
+            {_generation_key(pk): uuid.uuid4().hex for pk in product_ids},
+            settings.PRODUCT_FRAGMENT_CACHE_TIMEOUT,
+        )
+
+    bump()
+    transaction.on_commit(bump)
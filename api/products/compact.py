@@ -0,0 +1,241 @@
+"""
+Fast read path for product lists.
+
+Rows are fetched with .values() and turned into the same dicts that
+ProductReadSerializer(many=True) produces, using converters set up once per
+request instead of DRF's per-field dispatch and nested serializer instances.
+Output must stay identical to the serializer's (see tests/test_compact.py);
+when a field is added to ProductReadSerializer, add it here as well.
+"""
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.utils import timezone
+
+from api.category.models import Tag
+from api.common.profiling import serializing
+
+from .models import Product, ProductImage, ProductReview, ProductVariant
+
+RelatedLink = Product.related_products.through
+
+
+class Converters:
+    """Value conversions matching the DRF fields ProductReadSerializer uses."""
+
+    def __init__(self, request=None):
+        self.request = request
+        self.timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+
+    def datetime(self, value):
+        # DateTimeField: enforce_timezone() then ISO 8601 with "Z" for UTC
+        if value is None:
+            return None
+        if self.timezone is not None and timezone.is_aware(value):
+            value = value.astimezone(self.timezone)
+        value = value.isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    @staticmethod
+    def decimal(places):
+        # DecimalField with COERCE_DECIMAL_TO_STRING: quantized, fixed-point
+        exponent = Decimal(1).scaleb(-places)
+
+        def convert(value):
+            if value is None:
+                return None
+            return f"{value.quantize(exponent):f}"
+
+        return convert
+
+    def file(self, model, field_name):
+        # FileField with use_url: the storage URL, absolute when there is a request
+        storage = model._meta.get_field(field_name).storage
+        request = self.request
+
+        def convert(name):
+            if not name:
+                return None
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+
+        return convert
+
+
+def _uuid(value):
+    return str(value) if value is not None else None
+
+
+class CompactProductList:
+    """Renders products by id as ProductReadSerializer would, in 6 queries."""
+
+    def __init__(self, request=None):
+        self.convert = Converters(request)
+        self.price = self.convert.decimal(2)
+        self.product_image = self.convert.file(Product, "image")
+        self.gallery_image = self.convert.file(ProductImage, "image")
+
+    def render(self, ids):
+        """Return {id: representation} for the products with the given ids."""
+        with serializing():
+            return self._render(ids)
+
+    def _render(self, ids):
+        links = {}
+        for from_id, to_id in RelatedLink.objects.filter(
+            from_product_id__in=ids
+        ).values_list("from_product_id", "to_product_id"):
+            links.setdefault(from_id, []).append(to_id)
+        related_ids = {pk for targets in links.values() for pk in targets}
+        # Page and related products are rendered together; related products
+        # are embedded one level deep, with an empty related_products list
+        base = self.render_base([*ids, *(related_ids - set(ids))])
+        return {
+            pk: {
+                **base[pk],
+                "related_products": [base[to_id] for to_id in links.get(pk, [])],
+            }
+            for pk in ids
+            if pk in base
+        }
+
+    def render_base(self, ids):
+        dt = self.convert.datetime
+        price = self.price
+        tags, images, variants, reviews = {}, {}, {}, {}
+        for row in Tag.objects.filter(products__in=ids).values(
+            "products", "id", "name", "slug", "description", "created_at", "updated_at"
+        ):
+            tags.setdefault(row["products"], []).append(
+                {
+                    "id": str(row["id"]),
+                    "name": row["name"],
+                    "slug": row["slug"],
+                    "description": row["description"],
+                    "created_at": dt(row["created_at"]),
+                    "updated_at": dt(row["updated_at"]),
+                }
+            )
+        for row in ProductImage.objects.filter(product_id__in=ids).values(
+            "product_id", "id", "image", "alt_text", "created_at", "updated_at"
+        ):
+            images.setdefault(row["product_id"], []).append(
+                {
+                    "id": str(row["id"]),
+                    "image": self.gallery_image(row["image"]),
+                    "alt_text": row["alt_text"],
+                    "created_at": dt(row["created_at"]),
+                    "updated_at": dt(row["updated_at"]),
+                }
+            )
+        for row in ProductVariant.objects.filter(product_id__in=ids).values(
+            "product_id", "id", "name", "value", "created_at", "updated_at"
+        ):
+            variants.setdefault(row["product_id"], []).append(
+                {
+                    "id": str(row["id"]),
+                    "product": str(row["product_id"]),
+                    "name": row["name"],
+                    "value": row["value"],
+                    "created_at": dt(row["created_at"]),
+                    "updated_at": dt(row["updated_at"]),
+                }
+            )
+        for row in ProductReview.objects.filter(product_id__in=ids).values(
+            "product_id",
+            "id",
+            "user_id",
+            "user__email",
+            "rating",
+            "review",
+            "is_approved",
+            "created_at",
+            "updated_at",
+        ):
+            reviews.setdefault(row["product_id"], []).append(
+                {
+                    "id": str(row["id"]),
+                    "user": str(row["user_id"]),
+                    "user_email": row["user__email"],
+                    "rating": row["rating"],
+                    "review": row["review"],
+                    "is_approved": row["is_approved"],
+                    "created_at": dt(row["created_at"]),
+                    "updated_at": dt(row["updated_at"]),
+                }
+            )
+
+        products = {}
+        for row in Product.objects.filter(pk__in=ids).values(
+            "id",
+            "name",
+            "slug",
+            "description",
+            "price",
+            "discount_price",
+            "discount_start",
+            "discount_end",
+            "image",
+            "image_url",
+            "source",
+            "source_platform",
+            "source_url",
+            "category_id",
+            "category__name",
+            "category__slug",
+            "category__description",
+            "category__parent_id",
+            "category__created_at",
+            "category__updated_at",
+            "status",
+            "is_available",
+            "is_featured",
+            "stock",
+            "is_deleted",
+            "created_at",
+            "updated_at",
+        ):
+            pk = row["id"]
+            category = None
+            if row["category_id"] is not None:
+                category = {
+                    "id": str(row["category_id"]),
+                    "name": row["category__name"],
+                    "slug": row["category__slug"],
+                    "description": row["category__description"],
+                    "parent": _uuid(row["category__parent_id"]),
+                    "created_at": dt(row["category__created_at"]),
+                    "updated_at": dt(row["category__updated_at"]),
+                }
+            products[pk] = {
+                "id": str(pk),
+                "name": row["name"],
+                "slug": row["slug"],
+                "description": row["description"],
+                "price": price(row["price"]),
+                "discount_price": price(row["discount_price"]),
+                "discount_start": dt(row["discount_start"]),
+                "discount_end": dt(row["discount_end"]),
+                "image": self.product_image(row["image"]),
+                "image_url": row["image_url"],
+                "images": images.get(pk, []),
+                "source": row["source"],
+                "source_platform": row["source_platform"],
+                "source_url": row["source_url"],
+                "category": category,
+                "tags": tags.get(pk, []),
+                "status": row["status"],
+                "is_available": row["is_available"],
+                "is_featured": row["is_featured"],
+                "stock": row["stock"],
+                "is_deleted": row["is_deleted"],
+                "related_products": [],
+                "variants": variants.get(pk, []),
+                "reviews": reviews.get(pk, []),
+                "created_at": dt(row["created_at"]),
+                "updated_at": dt(row["updated_at"]),
+            }
+        return products
@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+from django.conf import settings
+
+# Returned when no DISCOUNT_FEED_URLS are configured
+SAMPLE_FEED = [
+    {
+        "name": "External Product 1",
+        "description": "Discounted product from Amazon",
+        "price": 100.00,
+        "discount_price": 80.00,
+        "image_url": "https://example.com/image1.jpg",
+        "source": "external",
+        "source_platform": "Amazon",
+        "source_url": "https://amazon.com/product1",
+    },
+    {
+        "name": "External Product 2",
+        "description": "Discounted product from eBay",
+        "price": 200.00,
+        "discount_price": 150.00,
+        "image_url": "https://example.com/image2.jpg",
+        "source": "external",
+        "source_platform": "eBay",
+        "source_url": "https://ebay.com/product2",
+    },
+]
+
+FEED_FIELDS = (
+    "name",
+    "description",
+    "price",
+    "discount_price",
+    "image_url",
+    "source_platform",
+    "source_url",
+)
+
+
+async def _fetch_feed(client, url):
+    response = await client.get(url, headers={"Accept": "application/json"})
+    response.raise_for_status()
+    return response.json()
+
+
+async def fetch_discount_feeds(urls=None, timeout=None):
+    """
+    Fetch every discount feed concurrently and return the combined list of
+    product dicts. Each feed is a JSON list of objects with FEED_FIELDS.
+    Requests are made with an async HTTP client, so the event loop (and an
+    ASGI worker) keeps serving other requests while feeds are in flight.
+    """
+    if urls is None:
+        urls = settings.DISCOUNT_FEED_URLS
+    if timeout is None:
+        timeout = settings.DISCOUNT_FEED_TIMEOUT
+    if not urls:
+        return [dict(item) for item in SAMPLE_FEED]
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        feeds = await asyncio.gather(*(_fetch_feed(client, url) for url in urls))
+    return [
+        {
+            **{field: item.get(field) for field in FEED_FIELDS},
+            "source": "external",
+        }
+        for feed in feeds
+        for item in feed
+    ]
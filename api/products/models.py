@@ -1,10 +1,36 @@
 from django.db import models
 from django.utils.text import slugify
 
-from api.common.models import BaseModel
-
-
-class Product(BaseModel):
+from api.common.models import BaseModel, LoadedValuesMixin
+
+
+class ProductQuerySet(models.QuerySet):
+    @staticmethod
+    def read_prefetches():
+        """
+        Lookups for everything ProductReadSerializer renders besides the
+        category, including the related products it embeds.
+        """
+        reviews = models.Prefetch(
+            "reviews", queryset=ProductReview.objects.select_related("user")
+        )
+        related = Product.objects.select_related("category").prefetch_related(
+            "tags", "images", "variants", reviews
+        )
+        return [
+            "tags",
+            "images",
+            "variants",
+            reviews,
+            models.Prefetch("related_products", queryset=related),
+        ]
+
+    def for_read(self):
+        """Products ready for ProductReadSerializer in a fixed number of queries."""
+        return self.select_related("category").prefetch_related(*self.read_prefetches())
+
+
+class Product(LoadedValuesMixin, BaseModel):
     class Source(models.TextChoices):
         INTERNAL = "internal", "Internal"
         EXTERNAL = "external", "External"
@@ -48,6 +74,8 @@ class Product(BaseModel):
     is_deleted = models.BooleanField(default=False)
     related_products = models.ManyToManyField("self", blank=True)
 
+    objects = ProductQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
@@ -1,8 +1,10 @@
+from django.db import models
 from rest_framework import serializers
 
 from api.category.models import Category, Tag
 from api.category.serializers import CategorySerializer, TagSerializer
 
+from .cache import get_product_fragments
 from .models import Product, ProductImage, ProductReview, ProductVariant
 
 
@@ -48,6 +50,27 @@ class ProductReviewSerializer(serializers.ModelSerializer):
         ]
 
 
+def prefetch_for_read(products):
+    models.prefetch_related_objects(products, *Product.objects.read_prefetches())
+
+
+class CachedProductListSerializer(serializers.ListSerializer):
+    """
+    Assembles product lists from per-product cached fragments, so only
+    products changed since they were last rendered go through the serializer.
+    Relations are prefetched for those products only.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return get_product_fragments(
+            list(iterable),
+            self.child.to_representation,
+            request=self.context.get("request"),
+            prepare=prefetch_for_read,
+        )
+
+
 class ProductReadSerializer(serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
@@ -57,10 +80,13 @@ class ProductReadSerializer(serializers.ModelSerializer):
     related_products = serializers.SerializerMethodField()
 
     def get_related_products(self, obj):
-        # Avoid infinite recursion by limiting depth
-        return ProductReadSerializer(
-            obj.related_products.all(), many=True, context=self.context
-        ).data
+        # Related products are embedded one level deep (related_products is
+        # symmetrical, so deeper levels would recurse forever) and bypass the
+        # fragment cache, which holds top-level representations only.
+        if self.context.get("embedded"):
+            return []
+        serializer = ProductReadSerializer(context={**self.context, "embedded": True})
+        return [serializer.to_representation(p) for p in obj.related_products.all()]
 
     class Meta:
         model = Product
@@ -93,6 +119,16 @@ class ProductReadSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = fields
+        list_serializer_class = CachedProductListSerializer
+
+
+class ProductStubSerializer(serializers.ModelSerializer):
+    """Compact product reference for embedding in order history and similar lists."""
+
+    class Meta:
+        model = Product
+        fields = ["id", "name", "slug", "image", "image_url"]
+        read_only_fields = fields
 
 
 class ProductCreateSerializer(serializers.ModelSerializer):
@@ -137,3 +173,19 @@ class ProductCreateSerializer(serializers.ModelSerializer):
 
 class ProductBulkUploadSerializer(serializers.Serializer):
     products = ProductCreateSerializer(many=True)
+
+
+class ProductBulkUploadResultSerializer(serializers.Serializer):
+    """
+    Response payload for bulk upload: `created` in full by default, or only
+    `created_count` and `created_ids` with ?summary=true. Sent with 201 if
+    anything was created, 400 otherwise.
+    """
+
+    created = ProductReadSerializer(many=True, required=False)
+    created_count = serializers.IntegerField(required=False)
+    created_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
+    errors = serializers.ListField(
+        child=serializers.DictField(),
+        help_text="Rejected items as {index, errors}.",
+    )
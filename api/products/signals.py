@@ -0,0 +1,126 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from api.category.models import Category, Tag
+from api.common.events import (
+    PRODUCT_PRICE_CHANGED,
+    PRODUCT_STOCK_CHANGED,
+    changed_fields,
+    publish_many,
+)
+
+from .cache import invalidate_product_fragments
+from .models import Product, ProductImage, ProductReview, ProductVariant
+
+# Product fragments are keyed by a per-product generation, so invalidation
+# means bumping the generation of every product whose serialized form embeds
+# the changed row.
+
+
+def invalidate_products_and_related(product_ids):
+    # Related products embed these products' full representation (tags,
+    # category, images, variants, reviews), so their fragments go stale too.
+    # related_products is symmetrical, so the embedding products are the
+    # related ones.
+    product_ids = [pk for pk in product_ids if pk is not None]
+    if not product_ids:
+        return
+    related_ids = Product.related_products.through.objects.filter(
+        from_product_id__in=product_ids
+    ).values_list("to_product_id", flat=True)
+    invalidate_product_fragments([*product_ids, *related_ids])
+
+
+@receiver(post_save, sender=Product)
+def invalidate_related_product_fragments(sender, instance, **kwargs):
+    # Related products embed this product in their own representation
+    invalidate_product_fragments(
+        list(instance.related_products.values_list("pk", flat=True))
+    )
+
+
+@receiver(post_save, sender=Product)
+def publish_product_events(sender, instance, created, **kwargs):
+    if created:
+        return
+    changes = changed_fields(instance, ["price", "stock"])
+    events = []
+    if "price" in changes:
+        old, new = changes["price"]
+        events.append(
+            (
+                PRODUCT_PRICE_CHANGED,
+                instance.pk,
+                {"id": instance.pk, "old": old, "new": new},
+            )
+        )
+    if "stock" in changes:
+        old, new = changes["stock"]
+        events.append(
+            (
+                PRODUCT_STOCK_CHANGED,
+                instance.pk,
+                {"id": instance.pk, "old": old, "new": new},
+            )
+        )
+    if events:
+        publish_many(events)
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=ProductVariant)
+@receiver(post_delete, sender=ProductVariant)
+@receiver(post_save, sender=ProductReview)
+@receiver(post_delete, sender=ProductReview)
+def invalidate_product_fragment_for_child(sender, instance, **kwargs):
+    invalidate_products_and_related([instance.product_id])
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+@receiver(m2m_changed, sender=Product.related_products.through)
+def invalidate_product_fragment_for_m2m(sender, instance, action, pk_set, **kwargs):
+    if action == "pre_clear":
+        # pk_set is not provided for clear(), so invalidate the current members
+        if isinstance(instance, Product):
+            if sender is Product.related_products.through:
+                invalidate_product_fragments(
+                    [
+                        instance.pk,
+                        *instance.related_products.values_list("pk", flat=True),
+                    ]
+                )
+            else:
+                invalidate_products_and_related([instance.pk])
+        else:
+            invalidate_products_and_related(
+                instance.products.values_list("pk", flat=True)
+            )
+        return
+    if action not in ("post_add", "post_remove"):
+        return
+    if sender is Product.related_products.through:
+        # Embedded copies carry no related_products of their own, so only the
+        # two ends of each link change
+        invalidate_product_fragments([instance.pk, *pk_set])
+    elif isinstance(instance, Product):
+        invalidate_products_and_related([instance.pk])
+    else:
+        # Reverse side, e.g. tag.products.add(...)
+        invalidate_products_and_related(pk_set)
+
+
+# pre_delete: once the delete runs, SET_NULL / through-row cleanup has
+# already detached the products we need to find.
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def invalidate_product_fragments_for_category(sender, instance, **kwargs):
+    invalidate_products_and_related(
+        Product.objects.filter(category_id=instance.pk).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def invalidate_product_fragments_for_tag(sender, instance, **kwargs):
+    invalidate_products_and_related(instance.products.values_list("pk", flat=True))
@@ -1,34 +1,16 @@
 import factory
 import factory.fuzzy
 
-from api.category.models import Category, Tag
+from api.category.tests.factories import CategoryFactory
 from api.products.models import Product, ProductImage, ProductReview, ProductVariant
 
 
-class CategoryFactory(factory.django.DjangoModelFactory):
-    class Meta:
-        model = Category
-
-    name = factory.Faker("word")
-    slug = factory.LazyAttribute(lambda o: o.name.lower())
-    description = factory.Faker("sentence")
-
-
-class TagFactory(factory.django.DjangoModelFactory):
-    class Meta:
-        model = Tag
-
-    name = factory.Faker("word")
-    slug = factory.LazyAttribute(lambda o: o.name.lower())
-    description = factory.Faker("sentence")
-
-
 class ProductFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Product
 
     name = factory.Faker("word")
-    slug = factory.LazyAttribute(lambda o: o.name.lower())
+    slug = factory.LazyAttributeSequence(lambda o, n: f"{o.name.lower()}-{n}")
     description = factory.Faker("sentence")
     price = factory.fuzzy.FuzzyDecimal(10, 100)
     category = factory.SubFactory(CategoryFactory)
@@ -0,0 +1,75 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.category.tests.factories import TagFactory
+from api.products.models import Product
+from api.products.tests.factories import ProductFactory, ProductVariantFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _list(api_client):
+    url = reverse("products:product-list-create")
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    return response.data["results"], len(ctx.captured_queries)
+
+
+def test_product_list_served_from_fragment_cache(api_client):
+    ProductFactory.create_batch(3)
+    cold, cold_queries = _list(api_client)
+    warm, warm_queries = _list(api_client)
+    assert warm == cold
+    assert warm_queries < cold_queries
+
+
+def test_product_fragment_invalidated_by_child_write(api_client):
+    product = ProductFactory()
+    _list(api_client)
+    ProductVariantFactory(product=product, name="Color", value="Red")
+    results, _ = _list(api_client)
+    assert [v["value"] for v in results[0]["variants"]] == ["Red"]
+
+
+def test_product_fragment_invalidated_by_tag_change(api_client):
+    product = ProductFactory()
+    tag = TagFactory(name="sale", slug="sale")
+    _list(api_client)
+    product.tags.add(tag)
+    results, _ = _list(api_client)
+    assert [t["name"] for t in results[0]["tags"]] == ["sale"]
+    tag.name = "clearance"
+    tag.save()
+    results, _ = _list(api_client)
+    assert [t["name"] for t in results[0]["tags"]] == ["clearance"]
+
+
+def test_product_fragment_invalidated_by_category_change(api_client):
+    product = ProductFactory()
+    _list(api_client)
+    product.category.name = "renamed"
+    product.category.save()
+    results, _ = _list(api_client)
+    assert results[0]["category"]["name"] == "renamed"
+
+
+def test_related_product_fragments_invalidated_by_child_write(api_client):
+    product, related = ProductFactory.create_batch(2)
+    product.related_products.add(related)
+    _list(api_client)
+    ProductVariantFactory(product=related, name="Color", value="Red")
+    results, _ = _list(api_client)
+    embedded = next(r for r in results if r["id"] == str(product.pk))
+    assert [v["value"] for v in embedded["related_products"][0]["variants"]] == ["Red"]
+
+
+def test_fragment_invalidation_leaves_updated_at_alone(api_client):
+    product, related = ProductFactory.create_batch(2)
+    product.related_products.add(related)
+    before = {p.pk: p.updated_at for p in Product.objects.all()}
+    ProductVariantFactory(product=related, name="Color", value="Red")
+    product.tags.add(TagFactory())
+    assert {p.pk: p.updated_at for p in Product.objects.all()} == before
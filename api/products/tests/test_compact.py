@@ -0,0 +1,74 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from api.category.tests.factories import CategoryFactory, TagFactory
+from api.products.compact import CompactProductList
+from api.products.models import Product
+from api.products.serializers import ProductReadSerializer
+from api.products.tests.factories import (
+    ProductFactory,
+    ProductImageFactory,
+    ProductReviewFactory,
+    ProductVariantFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def products():
+    parent = CategoryFactory()
+    full = ProductFactory(
+        category=CategoryFactory(parent=parent),
+        price=Decimal("19.5"),
+        discount_price=Decimal("12.00"),
+        discount_start=timezone.now(),
+        discount_end=timezone.now() + datetime.timedelta(days=3, microseconds=7),
+        image="product_images/cover.jpg",
+        image_url="https://cdn.example.com/cover.jpg",
+        source_platform="jumia",
+    )
+    full.tags.add(*TagFactory.create_batch(2))
+    ProductImageFactory.create_batch(
+        2, product=full, image="product_images/gallery/a.jpg"
+    )
+    ProductVariantFactory.create_batch(2, product=full)
+    ProductReviewFactory.create_batch(2, product=full)
+    related = ProductFactory.create_batch(2, category=None)
+    ProductImageFactory(product=related[0], image="product_images/gallery/b.jpg")
+    related[1].tags.add(TagFactory())
+    full.related_products.add(*related)
+    bare = ProductFactory(category=None)
+    return [full, *related, bare]
+
+
+@override_settings(PRODUCT_FRAGMENT_CACHE_TIMEOUT=0)
+def test_compact_output_matches_serializer(products):
+    request = APIRequestFactory().get("/api/products/")
+    queryset = Product.objects.filter(pk__in=[p.pk for p in products]).order_by("pk")
+    expected = ProductReadSerializer(
+        queryset, many=True, context={"request": request}
+    ).data
+    rendered = CompactProductList(request).render(
+        list(queryset.values_list("pk", flat=True))
+    )
+    actual = list(rendered.values())
+    assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
+    assert any(product["related_products"] for product in actual)
+
+
+@override_settings(PRODUCT_FRAGMENT_CACHE_TIMEOUT=0)
+def test_product_list_view_identical_with_compact_path(api_client, products):
+    url = reverse("products:product-list-create")
+    with override_settings(PRODUCT_LIST_COMPACT=False):
+        expected = api_client.get(url).content
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.content == expected
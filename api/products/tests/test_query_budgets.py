@@ -0,0 +1,42 @@
+import pytest
+from django.urls import reverse
+
+from api.category.tests.factories import TagFactory
+from api.products.tests.factories import (
+    ProductFactory,
+    ProductImageFactory,
+    ProductReviewFactory,
+    ProductVariantFactory,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def create_products(n):
+    for product in ProductFactory.create_batch(n):
+        product.tags.add(*TagFactory.create_batch(2))
+        ProductImageFactory(product=product)
+        ProductVariantFactory(product=product)
+        ProductReviewFactory(product=product)
+        related = ProductFactory()
+        ProductImageFactory(product=related)
+        ProductReviewFactory(product=related)
+        product.related_products.add(related)
+
+
+def test_product_list_budget(query_budget):
+    # Count, page ids, related links, then products (+categories), tags,
+    # images, variants and reviews (+users) for the page and related products
+    query_budget(reverse("products:product-list-create"), create_products, budget=8)
+
+
+@pytest.mark.parametrize(
+    "url_name, factory",
+    [
+        ("products:product-image-list-create", ProductImageFactory),
+        ("products:product-variant-list-create", ProductVariantFactory),
+        ("products:product-review-list-create", ProductReviewFactory),
+    ],
+)
+def test_product_child_list_budgets(query_budget, url_name, factory):
+    query_budget(reverse(url_name), factory.create_batch, budget=2)
@@ -1,6 +1,11 @@
+from functools import partial
+from unittest import mock
+
+import httpx
 import pytest
 from django.urls import reverse
 
+from api.products.models import Product
 from api.products.tests.factories import ProductFactory
 from api.users.tests.factories import UserFactory
 
@@ -41,6 +46,36 @@ def test_fetch_discounted_products(api_client):
     assert response.status_code in (200, 403, 405)
 
 
+def test_fetch_discounted_products_from_feeds(api_client, settings):
+    settings.DISCOUNT_FEED_URLS = [
+        "https://feeds.example.com/a",
+        "https://feeds.example.com/b",
+    ]
+    feeds = {
+        url: [{"name": f"Deal {url[-1]}", "price": "10.00", "source_platform": url[-1]}]
+        for url in settings.DISCOUNT_FEED_URLS
+    }
+    api_client.force_authenticate(user=UserFactory(is_staff=True))
+    url = reverse("products:fetch-discounted-products")
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=feeds[str(request.url)])
+    )
+    with mock.patch(
+        "api.products.feeds.httpx.AsyncClient",
+        partial(httpx.AsyncClient, transport=transport),
+    ):
+        response = api_client.post(url)
+        assert response.status_code == 201
+        assert {item["name"] for item in response.data["created"]} == {
+            "Deal a",
+            "Deal b",
+        }
+        # Already imported products are skipped
+        assert api_client.post(url).data["created"] == []
+    assert Product.objects.filter(source="external").count() == 2
+    assert api_client.get(url).status_code == 405
+
+
 def test_product_image_create(api_client, user):
     api_client.force_authenticate(user=user)
     product = ProductFactory()
@@ -78,3 +113,42 @@ def test_product_detail_not_found(api_client):
     )
     response = api_client.get(url)
     assert response.status_code == 404
+
+
+def test_product_bulk_upload_summary(api_client):
+    api_client.force_authenticate(user=UserFactory(is_staff=True))
+    url = reverse("products:product-bulk-upload")
+    products = [
+        {"name": "Bulk A", "price": "5.00"},
+        {"name": "Bulk B", "price": "6.00"},
+    ]
+    response = api_client.post(f"{url}?summary=true", products, format="json")
+    assert response.status_code == 201
+    assert response.data["created_count"] == 2
+    assert set(response.data["created_ids"]) == set(
+        Product.objects.filter(name__startswith="Bulk").values_list("pk", flat=True)
+    )
+    assert "created" not in response.data
+
+
+def test_product_bulk_upload_default_response(api_client):
+    api_client.force_authenticate(user=UserFactory(is_staff=True))
+    url = reverse("products:product-bulk-upload")
+    products = [{"name": "Bulk A", "price": "5.00"}, {"name": "Bulk B"}]
+    response = api_client.post(url, products, format="json")
+    assert response.status_code == 201
+    assert [p["name"] for p in response.data["created"]] == ["Bulk A"]
+    assert [e["index"] for e in response.data["errors"]] == [1]
+    assert "created_count" not in response.data
+
+
+def test_product_bulk_upload_summary_nothing_created(api_client):
+    api_client.force_authenticate(user=UserFactory(is_staff=True))
+    url = reverse("products:product-bulk-upload")
+    response = api_client.post(
+        f"{url}?summary=true", [{"name": "No price"}], format="json"
+    )
+    assert response.status_code == 400
+    assert response.data["created_count"] == 0
+    assert response.data["created_ids"] == []
+    assert response.data["errors"][0]["index"] == 0
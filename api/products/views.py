@@ -1,16 +1,28 @@
 import csv
 from io import StringIO
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+from django.utils.text import slugify
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics, permissions, status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from api.common.async_views import AsyncAPIView
 from api.common.permissions import IsAdminOrManager
+from api.common.transactions import NonAtomicReadsMixin
+from api.common.utils import bulk_upload_response
 
+from .cache import get_product_fragments
+from .compact import CompactProductList
+from .feeds import fetch_discount_feeds
 from .models import Product, ProductImage, ProductReview, ProductVariant
 from .serializers import (
+    ProductBulkUploadResultSerializer,
     ProductBulkUploadSerializer,
     ProductCreateSerializer,
     ProductImageSerializer,
@@ -22,7 +34,7 @@ from .serializers import (
 # Create your views here.
 
 
-class ProductListCreateView(generics.ListCreateAPIView):
+class ProductListCreateView(NonAtomicReadsMixin, generics.ListCreateAPIView):
     """
     List all products or create a new internal product.
     - GET: Returns a paginated list of products with filtering, search, and ordering.
@@ -37,9 +49,9 @@ class ProductListCreateView(generics.ListCreateAPIView):
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
     def get_queryset(self):
-        qs = Product.objects.select_related("category").prefetch_related(
-            "tags", "related_products"
-        )
+        # Relations are prefetched by CachedProductListSerializer for the
+        # products missing from the fragment cache
+        qs = Product.objects.select_related("category")
         user = self.request.user
         if user.is_authenticated and (
             user.is_staff or getattr(user, "role", None) in ["admin", "manager"]
@@ -52,11 +64,33 @@ class ProductListCreateView(generics.ListCreateAPIView):
             return ProductCreateSerializer
         return ProductReadSerializer
 
+    def list(self, request, *args, **kwargs):
+        if not settings.PRODUCT_LIST_COMPACT:
+            return super().list(request, *args, **kwargs)
+        # Paginate (id, updated_at) pairs, which is all the fragment cache
+        # needs; products it misses are rendered from .values() rows
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values_list("pk", "updated_at", named=True)
+        page = self.paginate_queryset(rows)
+        compact = CompactProductList(request)
+        rendered = {}
+        data = get_product_fragments(
+            list(rows if page is None else page),
+            lambda row: rendered[row.pk],
+            request=request,
+            prepare=lambda missing: rendered.update(
+                compact.render([row.pk for row in missing])
+            ),
+        )
+        if page is None:
+            return Response(data)
+        return self.get_paginated_response(data)
+
     def perform_create(self, serializer):
         serializer.save(source="internal")
 
 
-class ProductRetrieveView(generics.RetrieveAPIView):
+class ProductRetrieveView(NonAtomicReadsMixin, generics.RetrieveAPIView):
     """
     Retrieve a product by ID.
     Returns full product details, including category, tags, images, variants, reviews, and related products.
@@ -66,9 +100,7 @@ class ProductRetrieveView(generics.RetrieveAPIView):
     serializer_class = ProductReadSerializer
 
     def get_queryset(self):
-        qs = Product.objects.select_related("category").prefetch_related(
-            "tags", "related_products"
-        )
+        qs = Product.objects.for_read()
         user = self.request.user
         if user.is_authenticated and (
             user.is_staff or getattr(user, "role", None) in ["admin", "manager"]
@@ -77,39 +109,19 @@ class ProductRetrieveView(generics.RetrieveAPIView):
         return qs.filter(is_deleted=False)
 
 
-class FetchDiscountedProductsView(APIView):
+class FetchDiscountedProductsView(AsyncAPIView):
     """
     Fetch discounted products from external platforms and save them as external products.
     Only admin/manager users can access this endpoint.
+    Runs as an async view: feeds (DISCOUNT_FEED_URLS) are fetched concurrently
+    and the database is queried with the async ORM.
     """
 
     permission_classes = [permissions.IsAdminUser]
 
-    def post(self, request):
+    async def post(self, request):
         try:
-            # Example: Simulate fetching from an external API
-            external_products = [
-                {
-                    "name": "External Product 1",
-                    "description": "Discounted product from Amazon",
-                    "price": 100.00,
-                    "discount_price": 80.00,
-                    "image_url": "https://example.com/image1.jpg",
-                    "source": "external",
-                    "source_platform": "Amazon",
-                    "source_url": "https://amazon.com/product1",
-                },
-                {
-                    "name": "External Product 2",
-                    "description": "Discounted product from eBay",
-                    "price": 200.00,
-                    "discount_price": 150.00,
-                    "image_url": "https://example.com/image2.jpg",
-                    "source": "external",
-                    "source_platform": "eBay",
-                    "source_url": "https://ebay.com/product2",
-                },
-            ]
+            external_products = await fetch_discount_feeds()
             user = request.user
             qs = Product.objects
             if not (
@@ -119,14 +131,17 @@ class FetchDiscountedProductsView(APIView):
             # Only create if not already present (by name, source_platform)
             to_create = []
             for prod in external_products:
-                if not qs.filter(
+                if not await qs.filter(
                     name=prod["name"],
                     source="external",
                     source_platform=prod["source_platform"],
-                ).exists():
-                    to_create.append(Product(**prod))
-            Product.objects.bulk_create(to_create)
-            created = [ProductReadSerializer(p).data for p in to_create]
+                ).aexists():
+                    # bulk_create skips Product.save(), which fills in the slug
+                    to_create.append(Product(**prod, slug=slugify(prod["name"])))
+            await Product.objects.abulk_create(to_create)
+            created = await sync_to_async(
+                lambda: [ProductReadSerializer(p).data for p in to_create]
+            )()
             return Response({"created": created}, status=status.HTTP_201_CREATED)
         except Exception as exc:
             return Response(
@@ -159,10 +174,12 @@ class ProductBulkActionView(APIView):
             qs = qs.filter(is_deleted=False)
         try:
             if action_type == "assign_category" and category_id:
-                qs.update(category_id=category_id)
+                # updated_at is bumped explicitly; update() skips auto_now and
+                # cached product fragments are keyed by it
+                qs.update(category_id=category_id, updated_at=timezone.now())
                 return Response({"detail": "Category assigned to products."})
             elif action_type == "remove_category":
-                qs.update(category=None)
+                qs.update(category=None, updated_at=timezone.now())
                 return Response({"detail": "Category removed from products."})
             elif action_type == "assign_tags" and tag_ids:
                 # Use bulk operations for performance
@@ -175,7 +192,7 @@ class ProductBulkActionView(APIView):
                 return Response({"detail": "Tags removed from products."})
             elif action_type == "bulk_delete":
                 # Soft delete instead of hard delete
-                qs.update(is_deleted=True)
+                qs.update(is_deleted=True, updated_at=timezone.now())
                 return Response({"detail": "Products soft-deleted."})
             else:
                 return Response(
@@ -195,7 +212,8 @@ class ProductBulkUploadView(APIView):
     - JSON: POST a list of product objects or {"products": [...]}
     - CSV: POST a file with the key 'file' (fields: name, description, price, ...)
     Only admin/manager users can access this endpoint.
-    Returns a list of created products and any errors.
+    Returns a list of created products and any errors, or with ?summary=true
+    only the number and ids of created products.
     """
 
     permission_classes = [IsAdminOrManager]
@@ -203,8 +221,21 @@ class ProductBulkUploadView(APIView):
 
     @swagger_auto_schema(
         operation_description="Bulk upload products via JSON (list of products) or CSV file.",
+        manual_parameters=[
+            openapi.Parameter(
+                "summary",
+                openapi.IN_QUERY,
+                description="Return only the count and ids of created products (and any errors).",
+                type=openapi.TYPE_BOOLEAN,
+            )
+        ],
         request_body=ProductBulkUploadSerializer,
-        responses={201: ProductReadSerializer(many=True)},
+        responses={
+            201: ProductBulkUploadResultSerializer,
+            400: openapi.Response(
+                "Nothing was created.", ProductBulkUploadResultSerializer
+            ),
+        },
     )
     def post(self, request):
         created = []
@@ -240,13 +271,7 @@ class ProductBulkUploadView(APIView):
                 {"detail": "Provide a list of products (JSON) or a CSV file."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        return Response(
-            {
-                "created": ProductReadSerializer(created, many=True).data,
-                "errors": errors,
-            },
-            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
-        )
+        return bulk_upload_response(request, created, errors, ProductReadSerializer)
 
 
 class ProductImageListCreateTopView(generics.ListCreateAPIView):
@@ -0,0 +1,32 @@
+import pytest
+from django.urls import reverse
+
+from api.users.tests.factories import AddressFactory, UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def create_users(n):
+    # Profiles are created by a post_save signal
+    for user in UserFactory.create_batch(n):
+        AddressFactory.create_batch(2, user=user)
+
+
+def test_user_list_budget(query_budget):
+    query_budget(reverse("user-list-create"), create_users, budget=4)
+
+
+def test_admin_user_list_budget(api_client, query_budget, user):
+    user.is_staff = True
+    user.save()
+    api_client.force_authenticate(user=user)
+    query_budget(reverse("admin-user-list"), create_users, budget=2)
+
+
+def test_address_list_budget(api_client, query_budget, user):
+    api_client.force_authenticate(user=user)
+    query_budget(
+        reverse("address-list-create"),
+        lambda n: AddressFactory.create_batch(n, user=user),
+        budget=2,
+    )
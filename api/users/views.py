@@ -37,7 +37,11 @@ class UserListCreateView(generics.ListCreateAPIView):
     """List all users or create a new user (admin only for list, open for create)."""
 
     def get_queryset(self):
-        return User.objects.for_user(self.request.user)
+        return (
+            User.objects.for_user(self.request.user)
+            .select_related("profile")
+            .prefetch_related("addresses")
+        )
 
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
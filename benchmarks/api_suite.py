@@ -0,0 +1,228 @@
+"""
+Benchmark the main API paths against the configured (seeded) database.
+
+Seed volumes first, e.g. `python manage.py seed_data --products 1000000
+--users 100000 --order-items 5000000`, then run every scenario through
+Django's test client with a JWT-authenticated customer. Write scenarios
+(add-to-cart, checkout) are rolled back after each iteration so every run
+starts from the same data. Results include the git commit and dataset size;
+save them with --output and compare a later run with --compare.
+
+    python benchmarks/api_suite.py --output base.json
+    python benchmarks/api_suite.py --compare base.json --max-regression 10
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from api.orders.models import Order, OrderItem  # noqa: E402
+from api.products.models import Product  # noqa: E402
+from api.users.models import User  # noqa: E402
+
+
+class Context:
+    def __init__(self):
+        order = Order.objects.filter(user__addresses__is_default=True).first()
+        if order is None:
+            raise SystemExit("No orders found; run `manage.py seed_data` first.")
+        self.user = order.user
+        self.product = Product.objects.filter(stock__gt=0).order_by("pk").first()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client = Client(headers={"Authorization": f"Bearer {token}"})
+        self.search_term = self.product.name.split()[0]
+
+
+def product_list(ctx):
+    return ctx.client.get(reverse("products:product-list-create")), 200
+
+
+def product_search(ctx):
+    url = reverse("products:product-list-create")
+    return ctx.client.get(url, {"search": ctx.search_term}), 200
+
+
+def product_detail(ctx):
+    url = reverse("products:product-detail", args=[ctx.product.pk])
+    return ctx.client.get(url), 200
+
+
+def add_to_cart(ctx):
+    url = reverse("cart:cartitem-list-create-top")
+    data = {"product": str(ctx.product.pk), "quantity": 1}
+    return ctx.client.post(url, data, content_type="application/json"), 201
+
+
+def checkout(ctx):
+    add_to_cart(ctx)
+    return ctx.client.post(reverse("orders:checkout")), 201
+
+
+def order_history(ctx):
+    return ctx.client.get(reverse("orders:order-list")), 200
+
+
+# name: (scenario, writes)
+SCENARIOS = {
+    "product_list": (product_list, False),
+    "product_search": (product_search, False),
+    "product_detail": (product_detail, False),
+    "add_to_cart": (add_to_cart, True),
+    "checkout": (checkout, True),
+    "order_history": (order_history, False),
+}
+
+
+def run_once(ctx, scenario, writes):
+    if not writes:
+        response, expected = scenario(ctx)
+        return response, expected
+    with transaction.atomic():
+        response, expected = scenario(ctx)
+        transaction.set_rollback(True)
+    return response, expected
+
+
+def measure(ctx, scenario, writes, iterations, warmup):
+    for _ in range(warmup):
+        run_once(ctx, scenario, writes)
+    timings = []
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response, expected = run_once(ctx, scenario, writes)
+            timings.append(time.perf_counter() - started)
+            if response.status_code != expected:
+                raise SystemExit(
+                    f"{scenario.__name__}: HTTP {response.status_code} "
+                    f"{response.content[:200]!r}"
+                )
+    timings.sort()
+    return {
+        "iterations": iterations,
+        "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "p95_ms": round(timings[max(0, int(len(timings) * 0.95) - 1)] * 1000, 3),
+        "min_ms": round(timings[0] * 1000, 3),
+        "stdev_ms": round(statistics.pstdev(timings) * 1000, 3),
+        "ops_per_sec": round(len(timings) / sum(timings), 1),
+        "queries": len(queries) // iterations,
+    }
+
+
+def git_revision():
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "-uno", "--porcelain")),
+    }
+
+
+def compare(results, baseline, max_regression):
+    print(f"\n{'benchmark':<16}{'base ms':>10}{'now ms':>10}{'change':>9}")
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        change = (result["median_ms"] / base["median_ms"] - 1) * 100
+        print(
+            f"{name:<16}{base['median_ms']:>10}{result['median_ms']:>10}{change:>+8.1f}%"
+        )
+        if max_regression is not None and change > max_regression:
+            regressions.append(name)
+    if regressions:
+        raise SystemExit(
+            f"Median regressed over {max_regression}%: {', '.join(regressions)}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run; repeat to pick several. Defaults to all.",
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this file.")
+    parser.add_argument("--compare", help="Baseline JSON results to compare with.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="Exit non-zero when a median is this many percent slower than --compare.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    ctx = Context()
+    results = {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "dataset": {
+            "products": Product.objects.count(),
+            "users": User.objects.count(),
+            "orders": Order.objects.count(),
+            "order_items": OrderItem.objects.count(),
+        },
+        "benchmarks": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        scenario, writes = SCENARIOS[name]
+        results["benchmarks"][name] = measure(
+            ctx, scenario, writes, args.iterations, args.warmup
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(
+            f"{'benchmark':<16}{'median ms':>11}{'p95 ms':>10}{'ops/s':>9}{'queries':>9}"
+        )
+        for name, result in results["benchmarks"].items():
+            print(
+                f"{name:<16}{result['median_ms']:>11}{result['p95_ms']:>10}"
+                f"{result['ops_per_sec']:>9}{result['queries']:>9}"
+            )
+    if args.compare:
+        compare(
+            results, json.loads(Path(args.compare).read_text()), args.max_regression
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Compare concurrent throughput of an I/O-bound endpoint under WSGI and ASGI.
+
+POSTs to FetchDiscountedProductsView, whose discount feeds are served by a
+local HTTP server that answers after --latency ms. The WSGI run sends the
+requests through Django's WSGI handler from --wsgi-workers threads (one
+thread per sync gunicorn worker); the ASGI run sends them through the ASGI
+handler from a single event loop with --concurrency requests in flight, as
+a uvicorn worker would.
+
+    python benchmarks/asgi_vs_wsgi.py --requests 100 --latency 200
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+from asgiref.sync import ThreadSensitiveContext  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.test import AsyncClient, Client  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from api.users.models import User  # noqa: E402
+
+
+def start_feed_server(latency):
+    # Every response lists a new product so each request also inserts rows
+    counter = itertools.count()
+
+    class FeedHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            feed = json.dumps(
+                [
+                    {
+                        "name": f"Benchmark deal {time.time_ns()}-{next(counter)}",
+                        "price": "9.99",
+                        "source_platform": "Bench",
+                    }
+                ]
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(feed)))
+            self.end_headers()
+            self.wfile.write(feed)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def auth_headers():
+    user, _ = User.objects.get_or_create(
+        email="benchmark-admin@example.com", defaults={"is_staff": True}
+    )
+    token = RefreshToken.for_user(user).access_token
+    return {"Authorization": f"Bearer {token}"}
+
+
+def run_wsgi(url, headers, requests, workers):
+    def call(_):
+        response = Client(headers=headers).post(url)
+        assert response.status_code == 201, response.content
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(call, range(requests)))
+    return time.perf_counter() - started
+
+
+def run_asgi(url, headers, requests, concurrency):
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+        client = AsyncClient()
+
+        async def call():
+            # Like Django's ASGIHandler, give each request its own sync thread
+            async with semaphore, ThreadSensitiveContext():
+                response = await client.post(url, headers=headers)
+                assert response.status_code == 201, response.content
+
+        await asyncio.gather(*(call() for _ in range(requests)))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument(
+        "--latency", type=float, default=200, help="Feed latency in ms."
+    )
+    parser.add_argument("--feeds", type=int, default=3)
+    parser.add_argument("--wsgi-workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    server = start_feed_server(args.latency / 1000)
+    feed_url = f"http://127.0.0.1:{server.server_port}/feed"
+    settings.DISCOUNT_FEED_URLS = [f"{feed_url}?n={n}" for n in range(args.feeds)]
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    url = reverse("products:fetch-discounted-products")
+    headers = auth_headers()
+
+    results = {}
+    for mode, elapsed in (
+        ("wsgi", run_wsgi(url, headers, args.requests, args.wsgi_workers)),
+        ("asgi", run_asgi(url, headers, args.requests, args.concurrency)),
+    ):
+        results[mode] = {
+            "requests": args.requests,
+            "seconds": round(elapsed, 3),
+            "rps": round(args.requests / elapsed, 1),
+        }
+    server.shutdown()
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'mode':<8}{'requests':>10}{'seconds':>10}{'req/s':>10}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<8}{result['requests']:>10}{result['seconds']:>10}{result['rps']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
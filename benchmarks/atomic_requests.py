@@ -0,0 +1,109 @@
+"""
+Compare ProductListCreateView throughput with and without ATOMIC_REQUESTS.
+
+The view is called in-process from several threads, once wrapped in a
+request-wide transaction (the old behaviour) and once as shipped, where
+NonAtomicReadsMixin runs GET in autocommit. Point DATABASE_URL at Postgres
+for meaningful numbers; SQLite serializes access between threads. Products
+are created first if the database holds fewer than --products.
+
+    python benchmarks/atomic_requests.py --threads 8 --seconds 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from api.products.models import Product  # noqa: E402
+from api.products.views import ProductListCreateView  # noqa: E402
+
+
+def ensure_products(count):
+    missing = count - Product.objects.count()
+    if missing > 0:
+        Product.objects.bulk_create(
+            Product(
+                name=f"Benchmark product {i}",
+                slug=f"bench-{time.time_ns()}-{i}",
+                price=10,
+            )
+            for i in range(missing)
+        )
+
+
+def run(view, threads, seconds):
+    factory = RequestFactory()
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def worker():
+        local = []
+        try:
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                response = view(factory.get("/api/products/", HTTP_HOST="localhost"))
+                response.render()
+                local.append(time.perf_counter() - started)
+        finally:
+            connection.close()
+        with lock:
+            latencies.extend(local)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / seconds, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    ensure_products(args.products)
+    autocommit = ProductListCreateView.as_view()
+    atomic = transaction.atomic(autocommit)
+    results = {
+        "atomic": run(atomic, args.threads, args.seconds),
+        "autocommit": run(autocommit, args.threads, args.seconds),
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'mode':<12}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<12}{result['requests']:>10}{result['rps']:>10}"
+            f"{result['p50_ms']:>10}{result['p99_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
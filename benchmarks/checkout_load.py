@@ -0,0 +1,340 @@
+"""
+Load-test the browse -> add-to-cart -> checkout funnel under contention.
+
+Creates throwaway customers (with default addresses) and --skus products with
+--stock units each, starts gunicorn with core/gunicorn_conf.py, and runs each
+scenario USERS:SKEW for --seconds: USERS virtual customers loop through the
+funnel (product list, product detail, add one unit to the cart, checkout),
+picking SKUs with Zipf weights 1 / rank**SKEW, so 0 is uniform and higher
+values pile buyers onto a few hot SKUs. Stock is reset between scenarios.
+
+Reports funnel throughput, p50/p99 latency per step, failed checkouts by
+reason, oversold units (sold beyond the stock a SKU started with) and lock
+waits: sampled sessions waiting on a lock on PostgreSQL, "database is
+locked" failures on SQLite. The created rows are deleted afterwards unless
+--keep is given.
+
+    python benchmarks/checkout_load.py --scenario 16:0 --scenario 16:1.2 --scenario 64:1.2
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.db.models import Sum  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from gunicorn_load import free_port, start_server  # noqa: E402
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from api.cart.models import Cart  # noqa: E402
+from api.orders.models import Order, OrderItem  # noqa: E402
+from api.products.models import Product  # noqa: E402
+from api.users.models import Address, User  # noqa: E402
+
+STEPS = ("browse", "detail", "add_to_cart", "checkout")
+
+
+class Fixtures:
+    """Customers and SKUs created for one harness run."""
+
+    def __init__(self, users, skus, stock):
+        run = uuid.uuid4().hex[:8]
+        self.stock = stock
+        self.products = Product.objects.bulk_create(
+            Product(
+                name=f"Load test SKU {n}",
+                slug=f"load-test-{run}-{n}",
+                price=Decimal("10.00"),
+                stock=stock,
+            )
+            for n in range(skus)
+        )
+        self.users = User.objects.bulk_create(
+            User(
+                email=f"load-{run}-{n}@example.com",
+                phonenumber=f"+1{int(run, 16) % 10**6:06d}{n:06d}",
+                password="!",
+            )
+            for n in range(users)
+        )
+        Address.objects.bulk_create(
+            Address(
+                user=user,
+                line1="1 Load Street",
+                city="Accra",
+                state="Greater Accra",
+                postal_code="00233",
+                country="GH",
+                is_default=True,
+            )
+            for user in self.users
+        )
+        self.tokens = [
+            str(RefreshToken.for_user(user).access_token) for user in self.users
+        ]
+
+    def reset(self):
+        Product.objects.filter(pk__in=[p.pk for p in self.products]).update(
+            stock=self.stock
+        )
+        Cart.objects.filter(user__in=self.users).delete()
+
+    def oversold(self, since):
+        sold = (
+            OrderItem.objects.filter(
+                product__in=self.products, order__checked_out_at__gte=since
+            )
+            .values("product")
+            .annotate(units=Sum("quantity"))
+        )
+        over = [row["units"] - self.stock for row in sold if row["units"] > self.stock]
+        return {"oversold_units": sum(over), "oversold_skus": len(over)}
+
+    def delete(self):
+        Order.objects.filter(user__in=self.users).delete()
+        User.objects.filter(pk__in=[u.pk for u in self.users]).delete()
+        Product.objects.filter(pk__in=[p.pk for p in self.products]).delete()
+
+
+class LockSampler(threading.Thread):
+    """Sample PostgreSQL sessions waiting on a lock every `interval` seconds."""
+
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        with connection.cursor() as cursor:
+            while not self.stopped.wait(self.interval):
+                cursor.execute(
+                    "SELECT count(*) FROM pg_stat_activity "
+                    "WHERE wait_event_type = 'Lock' AND datname = current_database()"
+                )
+                self.samples.append(cursor.fetchone()[0])
+        connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        return {
+            "lock_waiters_peak": max(self.samples, default=0),
+            # Session-seconds spent waiting on locks, estimated from the samples
+            "lock_wait_s": round(sum(self.samples) * self.interval, 2),
+        }
+
+
+class StepFailed(Exception):
+    """A funnel step answered with an error; the funnel stops there."""
+
+    def __init__(self, step, status, payload):
+        text = payload.decode(errors="replace")
+        try:
+            detail = json.loads(text)
+            reason = detail.get("type") or detail.get("detail") or text[:80]
+        except (ValueError, AttributeError):
+            reason = text[:80]
+        if "database is locked" in text:
+            reason = "database is locked"
+        super().__init__(f"{step} HTTP {status}: {reason}")
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[max(0, int(len(sorted_values) * fraction) - 1)]
+
+
+def drive(port, fixtures, users, skew, seconds):
+    weights = list(
+        itertools.accumulate(
+            1 / rank**skew for rank in range(1, len(fixtures.products) + 1)
+        )
+    )
+    paths = {
+        "browse": reverse("products:product-list-create"),
+        "add_to_cart": reverse("cart:cartitem-list-create-top"),
+        "checkout": reverse("orders:checkout"),
+    }
+    latencies = {step: [] for step in STEPS}
+    failures = {}
+    funnels = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def customer(number):
+        nonlocal funnels
+        rng = random.Random(number)
+        headers = {
+            "Host": "localhost",
+            "Authorization": f"Bearer {fixtures.tokens[number]}",
+            "Content-Type": "application/json",
+        }
+        local = {step: [] for step in STEPS}
+        failed, completed = {}, 0
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+
+        def call(step, method, path, body=None):
+            started = time.perf_counter()
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            payload = response.read()
+            local[step].append(time.perf_counter() - started)
+            if response.status >= 400:
+                raise StepFailed(step, response.status, payload)
+
+        while time.monotonic() < deadline:
+            product = rng.choices(fixtures.products, cum_weights=weights)[0]
+            item = json.dumps({"product": str(product.pk), "quantity": 1})
+            try:
+                call("browse", "GET", paths["browse"])
+                call(
+                    "detail",
+                    "GET",
+                    reverse("products:product-detail", args=[product.pk]),
+                )
+                call("add_to_cart", "POST", paths["add_to_cart"], item)
+                call("checkout", "POST", paths["checkout"], "{}")
+                completed += 1
+                continue
+            except StepFailed as exc:
+                reason = str(exc)
+            except (OSError, http.client.HTTPException) as exc:
+                reason = type(exc).__name__
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+            failed[reason] = failed.get(reason, 0) + 1
+        conn.close()
+        with lock:
+            funnels += completed
+            for step in STEPS:
+                latencies[step].extend(local[step])
+            for reason, count in failed.items():
+                failures[reason] = failures.get(reason, 0) + count
+
+    threads = [threading.Thread(target=customer, args=(n,)) for n in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    result = {
+        "users": users,
+        "skew": skew,
+        "checkouts": funnels,
+        "checkouts_per_sec": round(funnels / seconds, 1),
+        "failed_checkouts": sum(failures.values()),
+        "failures": failures,
+        "latency_ms": {},
+    }
+    for step, values in latencies.items():
+        values.sort()
+        if values:
+            result["latency_ms"][step] = {
+                "p50": round(percentile(values, 0.5) * 1000, 1),
+                "p99": round(percentile(values, 0.99) * 1000, 1),
+            }
+    return result
+
+
+def parse_scenario(value):
+    users, _, skew = value.partition(":")
+    return int(users), float(skew or 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        type=parse_scenario,
+        help="USERS[:SKEW]; repeat to compare. Defaults to 16:0 and 16:1.2.",
+    )
+    parser.add_argument("--skus", type=int, default=50)
+    parser.add_argument("--stock", type=int, default=20, help="Starting stock per SKU.")
+    parser.add_argument("--seconds", type=float, default=15)
+    parser.add_argument(
+        "--config",
+        default="gthread",
+        help="Gunicorn WORKER_CLASS[:WORKERS[:THREADS]] (see gunicorn_load.py).",
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the created users, SKUs and orders."
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    scenarios = args.scenario or [(16, 0.0), (16, 1.2)]
+    fixtures = Fixtures(max(users for users, _ in scenarios), args.skus, args.stock)
+    # Don't hold the database (or a SQLite lock) while the server runs
+    connection.close()
+    port = free_port()
+    process = start_server(args.config, port, asgi=False)
+    results = []
+    try:
+        for users, skew in scenarios:
+            fixtures.reset()
+            connection.close()
+            sampler = LockSampler() if connection.vendor == "postgresql" else None
+            if sampler:
+                sampler.start()
+            since = timezone.now()
+            result = drive(port, fixtures, users, skew, args.seconds)
+            if sampler:
+                result.update(sampler.stop())
+            else:
+                result["lock_errors"] = sum(
+                    count
+                    for reason, count in result["failures"].items()
+                    if reason.endswith("database is locked")
+                )
+            result.update(fixtures.oversold(since))
+            results.append(result)
+    finally:
+        process.terminate()
+        process.wait()
+        if not args.keep:
+            fixtures.delete()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(
+        "| users | skew | checkouts/s | failed | oversold units | lock waits "
+        "| checkout p50 ms | checkout p99 ms | funnel steps p99 ms |"
+    )
+    print("|---:|---:|---:|---:|---:|---:|---:|---:|---|")
+    for result in results:
+        latency = result["latency_ms"]
+        locks = result.get("lock_wait_s", result.get("lock_errors"))
+        steps = ", ".join(f"{step} {latency[step]['p99']}" for step in latency)
+        checkout = latency.get("checkout", {})
+        print(
+            f"| {result['users']} | {result['skew']} | {result['checkouts_per_sec']} "
+            f"| {result['failed_checkouts']} | {result['oversold_units']} | {locks} "
+            f"| {checkout.get('p50', '-')} | {checkout.get('p99', '-')} | {steps} |"
+        )
+        for reason, count in sorted(result["failures"].items()):
+            print(f"    {count} x {reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Compare per-request latency for connect-per-request, persistent and pooled
+database connections.
+
+Each simulated request fires Django's request_started/request_finished
+signals (which open and close connections according to CONN_MAX_AGE) around
+a small product query, from several threads. Modes run against copies of
+the "default" database settings:
+
+- per_request: CONN_MAX_AGE=0, a fresh connection for every request
+- persistent:  CONN_MAX_AGE=600 with health checks
+- pooled:      psycopg pool (PostgreSQL with psycopg 3 and psycopg-pool only)
+
+    python benchmarks/db_connections.py --threads 8 --requests 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+from django.conf import settings  # noqa: E402
+
+MODES = {
+    "per_request": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+    "persistent": {"CONN_MAX_AGE": 600, "CONN_HEALTH_CHECKS": True},
+    "pooled": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+}
+
+
+def pool_available():
+    if not settings.DATABASES["default"]["ENGINE"].endswith("postgresql"):
+        return False
+    try:
+        import psycopg  # noqa: F401
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def configure(threads):
+    """Register one database alias per mode before Django sets up."""
+    base = {
+        key: value
+        for key, value in settings.DATABASES["default"].items()
+        if key not in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS", "OPTIONS")
+    }
+    modes = [mode for mode in MODES if mode != "pooled" or pool_available()]
+    for mode in modes:
+        options = dict(settings.DATABASES["default"].get("OPTIONS", {}))
+        options.pop("pool", None)
+        if mode == "pooled":
+            options["pool"] = {"min_size": threads, "max_size": threads}
+        settings.DATABASES[mode] = {
+            **base,
+            **MODES[mode],
+            "OPTIONS": options,
+            "TEST": {"MIRROR": "default"},
+        }
+    return modes
+
+
+def run(alias, threads, requests):
+    from django.core import signals
+    from django.db import connections
+
+    latencies = []
+    lock = threading.Lock()
+
+    def worker():
+        local = []
+        connection = connections[alias]
+        for _ in range(requests):
+            started = time.perf_counter()
+            signals.request_started.send(sender=None)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT id, name, price FROM products_product LIMIT 10")
+                cursor.fetchall()
+            signals.request_finished.send(sender=None)
+            local.append(time.perf_counter() - started)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests per thread."
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    modes = configure(args.threads)
+    import django
+
+    django.setup()
+    results = {mode: run(mode, args.threads, args.requests) for mode in modes}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if "pooled" not in modes:
+        print("pooled: skipped (needs PostgreSQL with psycopg 3 and psycopg-pool)")
+    print(f"{'mode':<14}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<14}{result['requests']:>10}{result['rps']:>10}"
+            f"{result['p50_ms']:>10}{result['p99_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Load-test the API under gunicorn worker configurations from core/gunicorn_conf.py.
+
+Each configuration starts gunicorn on a free local port, waits for it to
+answer, then drives GET requests from --concurrency keep-alive clients for
+--seconds and records throughput and latency percentiles. Configurations are
+WORKER_CLASS[:WORKERS[:THREADS]]; omitted sizes use the config's CPU-based
+defaults.
+
+    python benchmarks/gunicorn_load.py --config sync --config gthread:2:8
+
+Use a seeded database (see DATABASE_URL) so the endpoint does real work.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(config, port, asgi):
+    worker_class, *sizes = config.split(":")
+    env = {
+        **os.environ,
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "GUNICORN_WORKER_CLASS": worker_class,
+        "GUNICORN_ACCESSLOG": "",
+        "GUNICORN_LOGLEVEL": "warning",
+        "SERVER_MODE": "asgi" if asgi else "wsgi",
+    }
+    if len(sizes) > 0:
+        env["GUNICORN_WORKERS"] = sizes[0]
+    if len(sizes) > 1:
+        env["GUNICORN_THREADS"] = sizes[1]
+    app = "core.asgi:application" if asgi else "core.wsgi:application"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "python:core.gunicorn_conf", app],
+        cwd=ROOT,
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"gunicorn ({config}) did not start")
+
+
+def drive(port, path, concurrency, seconds):
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def client():
+        nonlocal errors
+        local, failed = [], 0
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path, headers={"Host": "localhost"})
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 500:
+                    failed += 1
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                continue
+            local.append(time.perf_counter() - started)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors += failed
+
+    clients = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    latencies.sort()
+    if not latencies:
+        return {"requests": 0, "errors": errors}
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / seconds, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--config",
+        action="append",
+        help="WORKER_CLASS[:WORKERS[:THREADS]]; repeat to compare. "
+        "Defaults to sync and gthread.",
+    )
+    parser.add_argument(
+        "--asgi", action="store_true", help="Serve core.asgi with uvicorn workers."
+    )
+    parser.add_argument("--path", default="/api/products/")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=15)
+    parser.add_argument("--warmup", type=float, default=2)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    results = {}
+    for config in args.config or ["sync", "gthread"]:
+        port = free_port()
+        process = start_server(config, port, args.asgi)
+        try:
+            drive(port, args.path, args.concurrency, args.warmup)
+            results[config] = drive(port, args.path, args.concurrency, args.seconds)
+        finally:
+            process.terminate()
+            process.wait()
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print("| config | requests | errors | req/s | p50 ms | p99 ms |")
+    print("|---|---:|---:|---:|---:|---:|")
+    for config, result in results.items():
+        print(
+            f"| {config} | {result['requests']} | {result['errors']} | "
+            f"{result.get('rps', 0)} | {result.get('p50_ms', '-')} | {result.get('p99_ms', '-')} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Compare DRF's JSONRenderer with FastJSONRenderer on product list pages.
+
+For each --size, builds a page of that many product representations (with
+CompactProductList, from the configured database or from products seeded
+inside a rolled-back transaction) and times rendering it to bytes with:
+DRF's JSONRenderer, FastJSONRenderer on plain dicts, and FastJSONRenderer
+with every product pre-encoded, as served from a warm fragment cache. The
+renderers' outputs are checked to be identical first.
+
+    python benchmarks/json_render.py --size 100 --size 1000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import transaction  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from api.common import renderers  # noqa: E402
+from api.common.renderers import FastJSONRenderer, PreEncoded, dumps  # noqa: E402
+from api.common.seeding import Seeder  # noqa: E402
+from api.products.compact import CompactProductList  # noqa: E402
+from api.products.models import Product  # noqa: E402
+
+
+def page(results):
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+def measure(render, data, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        render(data)
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def run(sizes, iterations):
+    ids = list(Product.objects.values_list("pk", flat=True)[: max(sizes)])
+    rendered = CompactProductList().render(ids)
+    products = [rendered[pk] for pk in ids]
+    drf, fast = JSONRenderer(), FastJSONRenderer()
+    results = {}
+    for size in sizes:
+        plain = page(products[:size])
+        pre_encoded = page([PreEncoded(dumps(p), p) for p in products[:size]])
+        expected = drf.render(plain)
+        if fast.render(plain) != expected or fast.render(pre_encoded) != expected:
+            raise SystemExit(f"size {size}: FastJSONRenderer output differs")
+        drf_ms = measure(drf.render, plain, iterations)
+        fast_ms = measure(fast.render, plain, iterations)
+        spliced_ms = measure(fast.render, pre_encoded, iterations)
+        results[size] = {
+            "bytes": len(expected),
+            "drf_ms": drf_ms,
+            "fast_ms": fast_ms,
+            "pre_encoded_ms": spliced_ms,
+            "speedup": round(drf_ms / fast_ms, 1),
+            "pre_encoded_speedup": round(drf_ms / spliced_ms, 1),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--size",
+        type=int,
+        action="append",
+        help="Products per page; repeat to compare. Defaults to 100 and 1000.",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    sizes = args.size or [100, 1000]
+    with transaction.atomic():
+        missing = max(sizes) - Product.objects.count()
+        if missing > 0:
+            seeder = Seeder(seed=0)
+            seeder.seed_categories(20)
+            seeder.seed_tags(50)
+            seeder.seed_products(missing)
+        results = run(sizes, args.iterations)
+        transaction.set_rollback(True)
+
+    encoder = "orjson" if renderers.orjson is not None else "stdlib json"
+    if args.json:
+        print(json.dumps({"encoder": encoder, "results": results}, indent=2))
+        return
+    print(f"Encoder: {encoder}")
+    print(
+        "| products | bytes | DRF ms | fast ms | pre-encoded ms | speedup (fast / pre-encoded) |"
+    )
+    print("|---:|---:|---:|---:|---:|---:|")
+    for size, result in results.items():
+        print(
+            f"| {size} | {result['bytes']} | {result['drf_ms']} | {result['fast_ms']} "
+            f"| {result['pre_encoded_ms']} | {result['speedup']}x / {result['pre_encoded_speedup']}x |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Compare rendering product list pages with ProductReadSerializer and with the compact .values() path.
+
+For each --size, renders that many products to JSON bytes both ways, with
+the fragment cache disabled so every product is rendered: the serializer
+over select_related/prefetched model instances (as the list view did), and
+CompactProductList (api/products/compact.py). Both outputs are checked to be
+identical. Products come from the configured database; when it has too few,
+they are generated with the seeding module inside a transaction that is
+rolled back afterwards.
+
+    python benchmarks/product_list_render.py --size 100 --size 1000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from api.common.seeding import Seeder  # noqa: E402
+from api.products.compact import CompactProductList  # noqa: E402
+from api.products.models import Product  # noqa: E402
+from api.products.serializers import ProductReadSerializer  # noqa: E402
+
+
+def with_serializer(ids, request):
+    products = Product.objects.select_related("category").filter(pk__in=ids)
+    data = ProductReadSerializer(products, many=True, context={"request": request}).data
+    return JSONRenderer().render(data)
+
+
+def with_compact(ids, request):
+    rendered = CompactProductList(request).render(ids)
+    return JSONRenderer().render([rendered[pk] for pk in ids if pk in rendered])
+
+
+def measure(render, ids, request, iterations):
+    timings = []
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            render(ids, request)
+            timings.append(time.perf_counter() - started)
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+        "queries": len(queries) // iterations,
+    }
+
+
+def run(sizes, iterations):
+    request = APIRequestFactory().get("/api/products/")
+    ids = list(
+        Product.objects.order_by("-created_at").values_list("pk", flat=True)[
+            : max(sizes)
+        ]
+    )
+    results = {}
+    for size in sizes:
+        page = ids[:size]
+        # The serializer path returns products in database order
+        order = list(Product.objects.filter(pk__in=page).values_list("pk", flat=True))
+        if with_serializer(order, request) != with_compact(order, request):
+            raise SystemExit(f"size {size}: compact output differs from the serializer")
+        serializer = measure(with_serializer, order, request, iterations)
+        compact = measure(with_compact, order, request, iterations)
+        results[size] = {
+            "serializer": serializer,
+            "compact": compact,
+            "speedup": round(serializer["median_ms"] / compact["median_ms"], 2),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--size",
+        type=int,
+        action="append",
+        help="Products per page; repeat to compare. Defaults to 100 and 1000.",
+    )
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    sizes = args.size or [100, 1000]
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    settings.PRODUCT_FRAGMENT_CACHE_TIMEOUT = 0
+    with transaction.atomic():
+        missing = max(sizes) - Product.objects.count()
+        if missing > 0:
+            seeder = Seeder(seed=0)
+            seeder.seed_categories(20)
+            seeder.seed_tags(50)
+            seeder.seed_products(missing)
+            # Relate products in pairs (both directions, as the symmetrical
+            # relation stores them) so related products are embedded too
+            ids = [pk for pk, _, _ in seeder.products]
+            pairs = list(zip(ids[::2], ids[1::2]))
+            Product.related_products.through.objects.bulk_create(
+                Product.related_products.through(from_product_id=a, to_product_id=b)
+                for a, b in [*pairs, *((b, a) for a, b in pairs)]
+            )
+        results = run(sizes, args.iterations)
+        transaction.set_rollback(True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(
+        "| products | serializer ms | compact ms | speedup | queries (serializer / compact) |"
+    )
+    print("|---:|---:|---:|---:|---:|")
+    for size, result in results.items():
+        print(
+            f"| {size} | {result['serializer']['median_ms']} | {result['compact']['median_ms']} "
+            f"| {result['speedup']}x | {result['serializer']['queries']} / {result['compact']['queries']} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
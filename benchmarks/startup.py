@@ -0,0 +1,126 @@
+"""
+Measure how long a fresh process takes to become ready to serve requests.
+
+Every run starts a new interpreter (as a gunicorn worker would without
+preloading) and times, in order: importing core.wsgi (settings, app
+registry, middleware), loading the URLconf, the first request, and the
+first /swagger.json request, which generates the schema unless
+OPENAPI_SCHEMA_FILE exists. One extra run with `python -X importtime`
+reports the packages that take the longest to import up to the first
+request, and whether modules that should be deferred (drf_yasg's schema
+generation, boto3) were among them.
+
+    python benchmarks/startup.py --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Imported only when first used; see api/common/schema.py and STORAGES
+DEFERRED = ("drf_yasg.views", "drf_yasg.generators", "boto3", "botocore")
+
+CHILD = """
+import json, os, sys, time
+started = time.perf_counter()
+timings = {}
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+import core.wsgi
+timings["import core.wsgi"] = time.perf_counter() - started
+from django.urls import get_resolver
+mark = time.perf_counter()
+get_resolver().url_patterns
+timings["load URLconf"] = time.perf_counter() - mark
+deferred = sorted(m for m in %(deferred)r if m in sys.modules)
+if %(startup_only)r:
+    print(json.dumps({"timings": timings, "deferred_loaded": deferred}))
+    sys.exit()
+from django.conf import settings
+from django.test import Client
+settings.ALLOWED_HOSTS += ["testserver"]
+client = Client()
+mark = time.perf_counter()
+client.get(%(path)r)
+timings["first request"] = time.perf_counter() - mark
+mark = time.perf_counter()
+client.get("/swagger.json")
+timings["first /swagger.json"] = time.perf_counter() - mark
+print(json.dumps({"timings": timings, "deferred_loaded": deferred}))
+"""
+
+
+def run_child(path, importtime=False):
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    # The import profile stops before the requests, so it covers startup only
+    options = {"deferred": DEFERRED, "path": path, "startup_only": importtime}
+    command += ["-c", CHILD % options]
+    result = subprocess.run(
+        command, cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1]), result.stderr
+
+
+def slowest_packages(importtime_output, count):
+    # Lines look like "import time: <self us> | <cumulative us> | <name>";
+    # self times are summed per top-level package
+    totals = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.split(":", 1)[1].split("|")
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0) + int(self_us)
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    return {package: round(us / 1000, 1) for package, us in ranked[:count]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--path",
+        default="/api/test-protected/",
+        help="First request; the default needs no database.",
+    )
+    parser.add_argument(
+        "--packages", type=int, default=15, help="Slowest packages to list."
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    runs = [run_child(args.path)[0]["timings"] for _ in range(args.runs)]
+    profile, importtime_output = run_child(args.path, importtime=True)
+    results = {
+        "median_ms": {
+            phase: round(statistics.median(run[phase] for run in runs) * 1000, 1)
+            for phase in runs[0]
+        },
+        "deferred_loaded_at_startup": profile["deferred_loaded"],
+        "slowest_packages_ms": slowest_packages(importtime_output, args.packages),
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print("| phase | median ms |")
+    print("|---|---:|")
+    for phase, ms in results["median_ms"].items():
+        print(f"| {phase} | {ms} |")
+    print()
+    loaded = ", ".join(results["deferred_loaded_at_startup"]) or "none"
+    print(f"Deferred modules imported before the first request: {loaded}")
+    print()
+    print("| package | import ms (self) |")
+    print("|---|---:|")
+    for package, ms in results["slowest_packages_ms"].items():
+        print(f"| {package} | {ms} |")
+
+
+if __name__ == "__main__":
+    main()
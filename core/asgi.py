@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+# Also when run without entrypoint.sh (e.g. uvicorn core.asgi:application);
+# settings disable persistent connections under ASGI
+os.environ.setdefault("SERVER_MODE", "asgi")
 
 application = get_asgi_application()
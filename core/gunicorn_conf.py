@@ -0,0 +1,93 @@
+"""
+Gunicorn settings for the API, sized from the CPUs available to the
+container. Every value can be overridden with a GUNICORN_* environment
+variable.
+
+    gunicorn -c python:core.gunicorn_conf core.wsgi:application
+
+Worker models (GUNICORN_WORKER_CLASS):
+- sync:    one request per process; workers default to 2 * CPUs + 1
+- gthread: GUNICORN_THREADS requests per process; workers default to CPUs + 1
+With SERVER_MODE=asgi, uvicorn workers are used instead (one per CPU).
+"""
+
+import os
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name) or default)
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def container_cpus():
+    """CPUs usable by this process, honouring affinity and a cgroup v2 quota."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 0
+    cpus = cpus or os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+cpus = container_cpus()
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+if os.environ.get("SERVER_MODE") == "asgi":
+    worker_class = "uvicorn_worker.UvicornWorker"
+    default_workers, default_threads = cpus, 1
+else:
+    worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+    if worker_class == "gthread":
+        default_workers, default_threads = cpus + 1, 4
+    else:
+        default_workers, default_threads = 2 * cpus + 1, 1
+
+workers = _env_int("GUNICORN_WORKERS", default_workers)
+threads = _env_int("GUNICORN_THREADS", default_threads)
+
+# Import the app once in the master so workers share its memory pages
+# copy-on-write; see post_fork for the connections this must not share.
+preload_app = _env_bool("GUNICORN_PRELOAD", True)
+
+# Recycle workers to bound slow memory growth; jitter keeps them from all
+# restarting at the same moment.
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+
+accesslog = os.environ.get("GUNICORN_ACCESSLOG", "-") or None
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOGLEVEL", "info")
+
+# Heartbeat files on tmpfs; a disk-backed /tmp can stall workers in Docker
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+
+def post_fork(server, worker):
+    # Never share a database connection opened in the master while preloading
+    from django.db import connections
+
+    connections.close_all()
+
+
+def child_exit(server, worker):
+    # Drop the exited worker's live gauges from the shared metrics files
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
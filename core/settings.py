@@ -55,11 +55,16 @@ INSTALLED_APPS = [
     "api.category",
     "api.cart",
     "api.orders",
+    "api.common",
 ]
 
 MIDDLEWARE = [
+    "api.common.profiling.RequestProfilingMiddleware",
+    "api.common.metrics.MetricsMiddleware",
+    "api.common.compression.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "api.common.db_routers.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -95,6 +100,146 @@ DATABASES = {
     "default": env.db("DATABASE_URL"),
 }
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Run every GET/HEAD/OPTIONS request in autocommit instead of only the views
+# using api.common.transactions.NonAtomicReadsMixin (applied to the URLconf
+# in core/urls.py)
+AUTOCOMMIT_SAFE_REQUESTS = env.bool("AUTOCOMMIT_SAFE_REQUESTS", default=False)
+
+# Connection reuse. With DATABASE_POOL (PostgreSQL with psycopg 3 and
+# psycopg-pool installed) connections come from a per-process pool; otherwise
+# each thread keeps its connection for CONN_MAX_AGE seconds. Under ASGI
+# (SERVER_MODE=asgi) sync code runs in executor threads that don't see the
+# end of the request, so persistent connections would never be reused or
+# closed; CONN_MAX_AGE is forced to 0 there, and DATABASE_POOL is the way to
+# reuse connections.
+SERVER_MODE = env("SERVER_MODE", default="wsgi")
+DATABASE_POOL = env.bool("DATABASE_POOL", default=False)
+if DATABASE_POOL and DATABASES["default"]["ENGINE"].endswith("postgresql"):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0  # required by the pool
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=2),
+        "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=10),
+        "timeout": env.int("DATABASE_POOL_TIMEOUT", default=10),
+    }
+elif SERVER_MODE == "asgi":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool(
+    "CONN_HEALTH_CHECKS", default=True
+)
+
+# Read replicas of "default", as comma separated database URLs. Catalog and
+# order-history reads in safe requests are routed to them; see
+# api.common.db_routers.ReplicaRouter.
+DATABASE_REPLICAS = []
+for _index, _url in enumerate(env.list("DATABASE_REPLICA_URLS", default=[]), 1):
+    DATABASES[f"replica{_index}"] = {
+        **env.db_url_config(_url),
+        "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],
+        "CONN_HEALTH_CHECKS": DATABASES["default"]["CONN_HEALTH_CHECKS"],
+        # Tests run against "default" only
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{_index}")
+
+DATABASE_ROUTERS = ["api.common.db_routers.ReplicaRouter"]
+# Apps whose reads may be served by a replica
+DATABASE_REPLICA_APPS = ["products", "category", "orders"]
+# Seconds a client keeps reading from the primary after a write
+DATABASE_REPLICA_PIN_SECONDS = env.int("DATABASE_REPLICA_PIN_SECONDS", default=5)
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+# Seconds to keep serialized product fragments; 0 disables the fragment cache
+PRODUCT_FRAGMENT_CACHE_TIMEOUT = env.int("PRODUCT_FRAGMENT_CACHE_TIMEOUT", default=300)
+
+# Render product list pages from .values() rows (api/products/compact.py)
+# instead of ProductReadSerializer; the JSON is identical
+PRODUCT_LIST_COMPACT = env.bool("PRODUCT_LIST_COMPACT", default=True)
+
+# JSON discount feeds fetched concurrently by FetchDiscountedProductsView;
+# sample products are used when none are configured
+DISCOUNT_FEED_URLS = env.list("DISCOUNT_FEED_URLS", default=[])
+DISCOUNT_FEED_TIMEOUT = env.int("DISCOUNT_FEED_TIMEOUT", default=10)
+
+# Cart items untouched for longer than this are removed by prune_cart_items
+CART_ITEM_MAX_AGE_DAYS = env.int("CART_ITEM_MAX_AGE_DAYS", default=30)
+
+
+# Email
+# https://docs.djangoproject.com/en/5.2/topics/email/
+
+EMAIL_BACKEND = env(
+    "EMAIL_BACKEND", default="django.core.mail.backends.console.EmailBackend"
+)
+EMAIL_HOST = env("EMAIL_HOST", default="localhost")
+EMAIL_PORT = env.int("EMAIL_PORT", default=25)
+EMAIL_HOST_USER = env("EMAIL_HOST_USER", default="")
+EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default="")
+EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=False)
+EMAIL_TIMEOUT = env.int("EMAIL_TIMEOUT", default=10)
+DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="webmaster@localhost")
+
+# Outbound email queue, drained by the send_queued_emails worker
+EMAIL_QUEUE_MAX_ATTEMPTS = env.int("EMAIL_QUEUE_MAX_ATTEMPTS", default=5)
+EMAIL_QUEUE_BACKOFF_SECONDS = env.int("EMAIL_QUEUE_BACKOFF_SECONDS", default=60)
+EMAIL_QUEUE_MAX_BACKOFF_SECONDS = env.int(
+    "EMAIL_QUEUE_MAX_BACKOFF_SECONDS", default=3600
+)
+# Seconds a worker holds claimed emails before another worker may retry them
+EMAIL_QUEUE_LEASE_SECONDS = env.int("EMAIL_QUEUE_LEASE_SECONDS", default=300)
+
+
+# Domain event consumers run by consume_events, e.g.
+# {"search-index": {"handler": "dotted.path.to.handler", "topics": ["product.price_changed"]}}
+# Handlers receive a list of DomainEvent rows and must be idempotent.
+EVENT_CONSUMERS = {}
+# How long a consumer waits on a missing event id (an insert still in flight
+# or rolled back) before moving past it. On PostgreSQL it also keeps waiting
+# while any transaction older than the gap is still open.
+EVENT_CONSUMER_SETTLE_SECONDS = env.int("EVENT_CONSUMER_SETTLE_SECONDS", default=5)
+
+
+# Request profiling (api.common.profiling): Server-Timing headers and a JSON
+# log line per request with query count, DB and serializer time
+REQUEST_PROFILING = env.bool("REQUEST_PROFILING", default=False)
+# Requests running more queries than this are logged as warnings
+REQUEST_QUERY_BUDGET = env.int("REQUEST_QUERY_BUDGET", default=20)
+# Budgets for individual views by namespaced URL name, e.g.
+# {"products:product-list-create": 6}
+REQUEST_QUERY_BUDGETS = {}
+
+# Prometheus metrics (api.common.metrics), scraped from /metrics. Under
+# gunicorn also set PROMETHEUS_MULTIPROC_DIR so all workers are aggregated.
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=True)
+# Bearer token required to scrape /metrics; empty allows any client
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
+# Negotiated response compression (api.common.compression): zstd or br when
+# the zstandard/brotli packages are installed, gzip otherwise
+RESPONSE_COMPRESSION = env.bool("RESPONSE_COMPRESSION", default=True)
+RESPONSE_COMPRESSION_MIN_BYTES = env.int("RESPONSE_COMPRESSION_MIN_BYTES", default=1024)
+RESPONSE_COMPRESSION_TYPES = env.list(
+    "RESPONSE_COMPRESSION_TYPES", default=["application/json"]
+)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "api.common.profiling": {"handlers": ["console"], "level": "INFO"},
+    },
+}
 
 
 # Password validation
@@ -139,7 +284,6 @@ USE_S3 = env.bool("USE_S3", default=False)
 STATIC_ROOT = os.path.join(BASE_DIR, "static")
 
 if USE_S3:
-    print("Using AWS S3")
     # AWS S3 settings for both static and media
     AWS_STORAGE_BUCKET_NAME = env("AWS_STORAGE_BUCKET_NAME")
     AWS_ACCESS_KEY_ID = env("AWS_ACCESS_KEY_ID")
@@ -149,12 +293,15 @@ if USE_S3:
     AWS_LOCATION = ""
     AWS_QUERYSTRING_AUTH = False  # Optional: makes files public
 
-    STATICFILES_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
-    DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
+    # Backends are dotted paths, so boto3 is only imported when a storage is
+    # first used (Django 5.1 dropped DEFAULT_FILE_STORAGE/STATICFILES_STORAGE)
+    STORAGES = {
+        "default": {"BACKEND": "storages.backends.s3boto3.S3Boto3Storage"},
+        "staticfiles": {"BACKEND": "storages.backends.s3boto3.S3Boto3Storage"},
+    }
     STATIC_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/static/"
     MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/media/"
 else:
-    print("Using local storage")
     STATIC_URL = "/static/"
     MEDIA_URL = "/media/"
     MEDIA_ROOT = os.path.join(BASE_DIR, "media")
@@ -173,6 +320,12 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    # orjson-backed (stdlib fallback) JSON with the same output as DRF's
+    # JSONRenderer; splices pre-encoded cached fragments into responses
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_FILTER_BACKENDS": [
@@ -186,3 +339,16 @@ REST_FRAMEWORK = {
 CORS_ALLOW_ALL_ORIGINS = True
 
 SWAGGER_USE_COMPAT_RENDERERS = False
+
+# Both UIs load the schema from /swagger.json (api.common.schema), which
+# serves OPENAPI_SCHEMA_FILE when it exists; entrypoint.sh writes it with
+# `manage.py generate_swagger`. Without the file (e.g. in development, where
+# it would go stale) the schema is generated on every request
+OPENAPI_SCHEMA_FILE = env(
+    "OPENAPI_SCHEMA_FILE", default=os.path.join(BASE_DIR, "openapi.json")
+)
+SWAGGER_SETTINGS = {
+    "DEFAULT_INFO": "api.common.schema.API_INFO",
+    "SPEC_URL": "schema-json",
+}
+REDOC_SETTINGS = {"SPEC_URL": "schema-json"}
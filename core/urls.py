@@ -21,9 +21,6 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -33,16 +30,9 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView,
 )
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Discount E-commerce API",
-        default_version="v1",
-        description="API documentation for the Discount E-commerce platform",
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
-
+from api.common import schema
+from api.common.transactions import non_atomic_safe_requests
+from api.common.views import MetricsView
 
 auth_urlpatterns = [
     path("token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
@@ -66,19 +56,24 @@ urlpatterns = [
     path("api/cart/", include("api.cart.urls")),
     path("api/orders/", include("api.orders.urls")),
     path("api/auth/", include(auth_urlpatterns)),
+    path("api/internal/", include("api.common.urls")),
+    path("metrics", MetricsView.as_view(), name="metrics"),
     path("api/test-protected/", TestProtectedView.as_view(), name="test_protected"),
 ]
 
+# drf_yasg is imported on the first request to these (see api/common/schema.py)
 urlpatterns += [
-    path(
-        "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
-    ),
-    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    path("swagger.json", schema.schema_json, name="schema-json"),
+    path("swagger/", schema.swagger_ui, name="schema-swagger-ui"),
+    path("redoc/", schema.redoc_ui, name="schema-redoc"),
 ]
 
 # Serve static files in development (only when not using Nginx)
 if settings.DEBUG and not os.environ.get("USE_NGINX"):
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+# Views are wrapped here rather than in middleware: Django applies
+# ATOMIC_REQUESTS to the view after all process_view hooks have run
+if settings.AUTOCOMMIT_SAFE_REQUESTS:
+    non_atomic_safe_requests(urlpatterns)
@@ -9,6 +9,22 @@ python manage.py migrate --noinput
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
-# Start Gunicorn
-echo "Starting Gunicorn..."
-exec gunicorn core.wsgi:application --bind 0.0.0.0:8000 
\ No newline at end of file
+# Pre-generate the OpenAPI schema served at /swagger.json, once per
+# container rather than on every docs request
+echo "Generating OpenAPI schema..."
+python manage.py generate_swagger --overwrite --format json "${OPENAPI_SCHEMA_FILE:-openapi.json}"
+
+# Start Gunicorn (see core/gunicorn_conf.py); SERVER_MODE=asgi serves
+# core.asgi with uvicorn workers
+if [ "$SERVER_MODE" = "asgi" ]; then
+    APP=core.asgi:application
+else
+    APP=core.wsgi:application
+fi
+# Metrics files from a previous run would be added to this run's totals
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+echo "Starting Gunicorn ($APP)..."
+exec gunicorn -c python:core.gunicorn_conf "$APP"
@@ -147,6 +147,15 @@ fi
 print_header "Performance Metrics"
 print_status "Docker container resource usage:"
 docker stats --no-stream --format "table {{.Container}}\t{{.CPUPerc}}\t{{.MemUsage}}\t{{.NetIO}}"
+print_status "Application metrics (checkouts, stock conflicts, email queue):"
+docker-compose exec -T web python -c '
+import os, urllib.request
+request = urllib.request.Request("http://localhost:8000/metrics")
+if os.environ.get("METRICS_TOKEN"):
+    request.add_header("Authorization", "Bearer " + os.environ["METRICS_TOKEN"])
+print(urllib.request.urlopen(request, timeout=5).read().decode())
+' 2>/dev/null | grep -E "^(checkout_total|stock_conflicts_total|email_queue_depth)" \
+    || print_warning "Metrics endpoint is not responding"
 
 # Network connectivity
 print_header "Network Connectivity"